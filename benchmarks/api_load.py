@@ -0,0 +1,100 @@
+"""Throughput and latency of the HTTP API under concurrent clients.
+
+Runs against a local instance started with `fastruct api`. A temporary foundation is created with synthetic loads,
+every client requests the endpoint in a loop until the total number of requests is done, and the foundation is
+deleted at the end.
+
+Usage:
+    fastruct api --workers 4 &
+    python benchmarks/api_load.py --clients 1 4 16 64 --requests 400 --loads 10000
+    python benchmarks/api_load.py --endpoint design --clients 8
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import aiohttp
+import numpy as np
+
+ENDPOINTS = {
+    "analysis": "/foundations/{id}/analysis?cache=false",
+    "analysis-cached": "/foundations/{id}/analysis",
+    "top": "/foundations/{id}/analysis?top=10&cache=false",
+    "design": "/foundations/{id}/design",
+    "foundation": "/foundations/{id}",
+}
+
+
+def synthetic_loads(size: int, seed: int = 0) -> list[dict]:
+    """Random user loads covering every stress distribution."""
+    rng = np.random.default_rng(seed)
+    forces = np.column_stack(
+        [rng.uniform(10, 100, size), rng.uniform(-5, 5, size), rng.uniform(-5, 5, size)]
+        + [rng.uniform(-60, 60, size) for _ in range(2)]
+    )
+    return [dict(zip(("p", "vx", "vy", "mx", "my"), row, strict=True)) for row in forces.round(4).tolist()]
+
+
+async def create_foundation(session: aiohttp.ClientSession, url: str, loads: int) -> int:
+    """ID of a new foundation with synthetic loads, uploaded as NDJSON."""
+    geometry = {"lx": 2, "ly": 2.2, "lz": 0.5, "depth": 2, "col_x": 0.4, "col_y": 0.4, "name": "api-load"}
+    async with session.post(f"{url}/foundations", json=geometry) as response:
+        response.raise_for_status()
+        foundation_id = (await response.json())["id"]
+
+    body = "\n".join(json.dumps(load) for load in synthetic_loads(loads))
+    headers = {"Content-Type": "application/x-ndjson"}
+    async with session.post(f"{url}/foundations/{foundation_id}/loads", data=body, headers=headers) as response:
+        response.raise_for_status()
+    return foundation_id
+
+
+async def client(session: aiohttp.ClientSession, url: str, remaining: list[int], latencies: list[float]) -> None:
+    """Request the URL until no requests remain, reading every response to the end."""
+    while remaining[0] > 0:
+        remaining[0] -= 1
+        start = time.perf_counter()
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async for _ in response.content.iter_chunked(64 * 1024):
+                pass
+        latencies.append(time.perf_counter() - start)
+
+
+async def measure(session: aiohttp.ClientSession, url: str, clients: int, requests: int) -> tuple[float, list[float]]:
+    """Elapsed seconds and latencies of every request, with the given number of concurrent clients."""
+    remaining, latencies = [requests], []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(session, url, remaining, latencies) for _ in range(clients)))
+    return time.perf_counter() - start, latencies
+
+
+async def main() -> None:
+    """Print the throughput and latencies of the endpoint for every number of clients."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="URL of the API.")
+    parser.add_argument("--endpoint", choices=ENDPOINTS, default="analysis", help="Requested endpoint.")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 4, 16], help="Concurrent clients of every run.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests of every run.")
+    parser.add_argument("--loads", type=int, default=10_000, help="Loads of the benchmarked foundation.")
+    args = parser.parse_args()
+
+    connector = aiohttp.TCPConnector(limit=max(args.clients))
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=None)) as session:
+        foundation_id = await create_foundation(session, args.url, args.loads)
+        url = args.url + ENDPOINTS[args.endpoint].format(id=foundation_id)
+        try:
+            print(f"{args.endpoint} with {args.loads} loads")
+            print(f"{'clients':>8}{'req/s':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'p99 (ms)':>10}")
+            for clients in args.clients:
+                elapsed, latencies = await measure(session, url, clients, args.requests)
+                p50, p95, p99 = (1000 * value for value in np.percentile(latencies, [50, 95, 99]))
+                print(f"{clients:>8}{len(latencies) / elapsed:>10.1f}{p50:>10.1f}{p95:>10.1f}{p99:>10.1f}")
+        finally:
+            async with session.delete(f"{args.url}/foundations/{foundation_id}"):
+                pass
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
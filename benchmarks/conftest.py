@@ -0,0 +1,106 @@
+"""Fixtures of the benchmark suite.
+
+Synthetic foundations and load sets of 10, 1k, 50k and 500k loads. Sizes above `--max-loads` are skipped, 50k by
+default, so a full run over 500k loads is requested explicitly:
+
+    pytest benchmarks --max-loads 500000
+"""
+import csv
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fastruct import config_db
+from fastruct.loads.loadset import LoadSet
+from fastruct.loads.queries import bulk_add_loads
+from fastruct.models.foundation import Foundation
+
+SIZES = (10, 1_000, 50_000, 500_000)
+DEFAULT_MAX_LOADS = 50_000
+GEOMETRY = {"lx": 2.5, "ly": 2.2, "lz": 0.6, "depth": 1.8, "ex": 0.1, "ey": -0.05, "col_x": 0.5, "col_y": 0.4}
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option that limits the size of the load sets."""
+    parser.addoption(
+        "--max-loads", type=int, default=DEFAULT_MAX_LOADS, help="Largest load set to benchmark (default: 50000)."
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Run every benchmark that takes a `size` over every load set size up to `--max-loads`."""
+    if "size" in metafunc.fixturenames:
+        max_loads = metafunc.config.getoption("max_loads")
+        metafunc.parametrize("size", [size for size in SIZES if size <= max_loads])
+
+
+def synthetic_forces(size: int, seed: int = 0) -> np.ndarray:
+    """User loads (p, vx, vy, mx, my) with shape `(size, 5)`.
+
+    Moments are large enough for every stress distribution to show up: full contact, cracked and overturned.
+    """
+    rng = np.random.default_rng(seed)
+    forces = np.empty((size, 5))
+    forces[:, 0] = rng.uniform(10, 200, size)
+    forces[:, 1:3] = rng.uniform(-5, 5, (size, 2))
+    forces[:, 3:] = rng.uniform(-40, 40, (size, 2))
+    return forces
+
+
+@pytest.fixture
+def foundation() -> Foundation:
+    """Transient foundation."""
+    return Foundation(id=1, **GEOMETRY)
+
+
+@pytest.fixture
+def loads(foundation: Foundation, size: int) -> LoadSet:
+    """Synthetic loads at the seal level of the foundation."""
+    p, vx, vy, mx, my = synthetic_forces(size, seed=size).T
+    ids = np.arange(1, size + 1)
+    return LoadSet(ids, ids, [None] * size, *foundation.load_at_seal(p, vx, vy, mx, my))
+
+
+@pytest.fixture
+def database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Empty database file used by the commands."""
+    path = tmp_path / "benchmark.db"
+    monkeypatch.setenv("FASTRUCT_DATABASE", str(path))
+    monkeypatch.setattr(config_db, "_session_local", None)
+    yield path
+
+
+@pytest.fixture
+def empty_foundation(database: Path) -> int:
+    """ID of a stored foundation without loads."""
+    with config_db.session_scope() as session:
+        foundation = Foundation(**GEOMETRY)
+        session.add(foundation)
+        session.flush()
+        return foundation.id
+
+
+@pytest.fixture
+def stored_foundation(empty_foundation: int, size: int) -> int:
+    """ID of a stored foundation with synthetic loads."""
+    with config_db.session_scope() as session:
+        foundation = session.get(Foundation, empty_foundation)
+        user_loads = [
+            {"foundation_id": empty_foundation, "name": None, "p": p, "vx": vx, "vy": vy, "mx": mx, "my": my}
+            for p, vx, vy, mx, my in synthetic_forces(size, seed=size).tolist()
+        ]
+        bulk_add_loads(session, user_loads, {empty_foundation: foundation})
+    return empty_foundation
+
+
+@pytest.fixture
+def loads_csv(empty_foundation: int, tmp_path: Path, size: int) -> Path:
+    """CSV file with synthetic loads for the stored foundation, in the format of `add_from_csv`."""
+    path = tmp_path / "loads.csv"
+    with open(path, "w", newline="") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["id", "name", "p", "vx", "vy", "mx", "my"])
+        writer.writerows([empty_foundation, None, *forces] for forces in synthetic_forces(size, seed=size).tolist())
+    return path
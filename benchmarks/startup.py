@@ -0,0 +1,57 @@
+"""Cold-start time of the command line application.
+
+Every command runs in a new interpreter, the way build scripts call `fastruct`. A temporary foundation is created
+for the commands that need one and deleted at the end. Commands are forwarded to the daemon when `fastruct serve` is
+running, so running the script with and without it compares both startups.
+
+Usage:
+    python benchmarks/startup.py --runs 20
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+
+FASTRUCT = [sys.executable, "-m", "fastruct.client"]
+
+
+def run(*args: str) -> str:
+    """Run a fastruct command and return its output."""
+    return subprocess.run([*FASTRUCT, *args], capture_output=True, text=True, check=True).stdout
+
+
+def measure(args: Callable[[int], list[str]], runs: int) -> list[float]:
+    """Wall time in seconds of every run of a command, built from the run number."""
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        run(*args(i))
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def main() -> None:
+    """Print the cold-start times of the benchmarked commands."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Runs of every command.")
+    runs = parser.parse_args().runs
+
+    foundation_id = run("f", "add", "2", "2", "1").strip().split("=")[-1]
+    try:
+        commands: dict[str, Callable[[int], list[str]]] = {
+            "fastruct --help": lambda _: ["--help"],
+            "fastruct l add": lambda i: ["l", "add", foundation_id, str(10 + i), "1", "1", "2", "3"],
+            "fastruct f analize": lambda _: ["f", "analize", foundation_id],
+        }
+        print(f"{'command':<22}{'min (ms)':>10}{'median (ms)':>14}{'max (ms)':>10}")
+        for name, args in commands.items():
+            times = [1000 * value for value in measure(args, runs)]
+            print(f"{name:<22}{min(times):>10.1f}{statistics.median(times):>14.1f}{max(times):>10.1f}")
+    finally:
+        run("f", "delete", foundation_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmarks of the analysis and design engines.
+
+The per-load reference implementations are only timed up to `REFERENCE_MAX_LOADS`, since they take minutes over the
+largest load sets.
+"""
+import pytest
+
+from fastruct.foundations.analysis.bi_direction import bi_direction_analysis
+from fastruct.foundations.analysis.exact import exact_analysis
+from fastruct.foundations.analysis.one_direction import one_direction_analysis
+from fastruct.foundations.analysis.prefilter import prefiltered_bi_direction_analysis
+from fastruct.foundations.analysis.vectorized import (
+    vectorized_bi_direction_analysis,
+    vectorized_one_direction_analysis,
+)
+from fastruct.foundations.design import get_ultimate_moments
+
+REFERENCE_MAX_LOADS = 50_000
+
+BI_DIRECTION_ENGINES = {
+    "reference": bi_direction_analysis,
+    "vectorized": vectorized_bi_direction_analysis,
+    "prefilter": prefiltered_bi_direction_analysis,
+    "exact": exact_analysis,
+}
+ONE_DIRECTION_ENGINES = {"reference": one_direction_analysis, "vectorized": vectorized_one_direction_analysis}
+
+
+def skip_slow_reference(engine: str, size: int) -> None:
+    """Skip the per-load reference implementations over the largest load sets."""
+    if engine == "reference" and size > REFERENCE_MAX_LOADS:
+        pytest.skip("per-load reference is too slow for this size")
+
+
+@pytest.mark.parametrize("engine", BI_DIRECTION_ENGINES)
+def test_bi_direction_analysis(benchmark, foundation, loads, engine, size):
+    """Bi-direction stresses and percentajes of every load."""
+    skip_slow_reference(engine, size)
+    benchmark.group = f"bi-direction {size}"
+    benchmark(BI_DIRECTION_ENGINES[engine], foundation, loads)
+
+
+@pytest.mark.parametrize("engine", ONE_DIRECTION_ENGINES)
+def test_one_direction_analysis(benchmark, foundation, loads, engine, size):
+    """One-direction stresses and percentajes of every load."""
+    skip_slow_reference(engine, size)
+    benchmark.group = f"one-direction {size}"
+    benchmark(ONE_DIRECTION_ENGINES[engine], foundation, loads)
+
+
+def test_get_ultimate_moments(benchmark, foundation, loads, size):
+    """Ultimate moments by direction and side of every load."""
+    benchmark.group = f"design {size}"
+    benchmark(get_ultimate_moments, foundation, loads)
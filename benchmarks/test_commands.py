@@ -0,0 +1,44 @@
+"""Benchmarks of the commands over a database file.
+
+Commands run in the current process, so these times don't include the interpreter start up (see `startup.py`).
+Every command is run a few times only, since a single run over the largest load sets takes seconds.
+"""
+import sqlalchemy as sa
+
+from fastruct import config_db
+from fastruct.commands.foundations.app import analyze_stresses_and_lifts, update
+from fastruct.commands.loads.app import add_from_csv
+from fastruct.models.user_load import UserLoad
+
+ROUNDS = 3
+
+
+def test_add_from_csv(benchmark, loads_csv, size):
+    """Import of a CSV file with every load of a foundation."""
+
+    def delete_loads():
+        with config_db.session_scope() as session:
+            session.execute(sa.delete(UserLoad))
+
+    benchmark.group = f"add-from-csv {size}"
+    benchmark.pedantic(add_from_csv, args=(loads_csv,), setup=delete_loads, rounds=ROUNDS)
+
+
+def test_update(benchmark, stored_foundation, size):
+    """Update of the geometry, recomputing every load at the seal level."""
+    benchmark.group = f"update {size}"
+    benchmark.pedantic(update, args=(stored_foundation, 2.5, 2.2, 0.7, 1.8, 0.1, -0.05, 0.5, 0.4), rounds=ROUNDS)
+
+
+def test_analize_rendering(benchmark, stored_foundation, size):
+    """Analysis of the stored loads and rendering of every page, as when the output is piped."""
+    benchmark.group = f"analize {size}"
+    kwargs = {"interactive": False}
+    benchmark.pedantic(analyze_stresses_and_lifts, args=(stored_foundation,), kwargs=kwargs, rounds=ROUNDS)
+
+
+def test_analize_top(benchmark, stored_foundation, size):
+    """Analysis of the stored loads and rendering of the 20 governing loads."""
+    benchmark.group = f"analize {size}"
+    kwargs = {"top": 20}
+    benchmark.pedantic(analyze_stresses_and_lifts, args=(stored_foundation,), kwargs=kwargs, rounds=ROUNDS)
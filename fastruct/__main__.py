@@ -1,24 +1,132 @@
 """Entry point de la aplicación."""
+import time
+from importlib import import_module
+from pathlib import Path
+from typing import Annotated, Optional
+
+import click
 import typer
+from typer.core import TyperGroup
+
+STARTED = time.perf_counter()
+
+# Subcommand name: (module with a Typer `app`, help)
+LAZY_COMMANDS = {
+    "l": ("fastruct.commands.loads.app", "💪 Loads Module"),
+    "f": ("fastruct.commands.foundations.app", "🏢 Foundations Module"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Group that imports the module of a subcommand only when the subcommand is used.
+
+    Listing the subcommands in the help page only needs their help text, so no module is imported.
+    """
+
+    _listing = False
+    import_time = 0.0  # Seconds spent importing subcommand modules
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Eager commands followed by the lazy ones."""
+        return [*super().list_commands(ctx), *LAZY_COMMANDS]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Import the subcommand module the first time the subcommand is requested."""
+        if cmd_name not in LAZY_COMMANDS or cmd_name in self.commands:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, help = LAZY_COMMANDS[cmd_name]
+        if self._listing:
+            return click.Command(cmd_name, help=help)
+
+        start = time.perf_counter()
+        command = typer.main.get_group(import_module(module_name).app)
+        self.import_time += time.perf_counter() - start
+        command.name, command.help = cmd_name, help
+        self.add_command(command)
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Help page listing the lazy subcommands without importing them."""
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
+
+app = typer.Typer(cls=LazyGroup)
+
+
+@app.callback()
+def callback(
+    ctx: typer.Context,
+    profile: Annotated[
+        bool, typer.Option("--profile", envvar="FASTRUCT_PROFILE", help="Print the wall time by phase to stderr.")
+    ] = False,
+    profile_output: Annotated[
+        Optional[Path],  # noqa: UP007 (typer needs Optional)
+        typer.Option(envvar="FASTRUCT_PROFILE_OUTPUT", help="Also dump cProfile stats of the command to this file."),
+    ] = None,
+) -> None:
+    """Structural analysis and design made fast and simple."""
+    if profile or profile_output is not None:
+        from fastruct import profiling
+
+        profiling.start(profile_output, STARTED)
+        profiling.add("command import", getattr(ctx.command, "import_time", 0.0))
+        ctx.call_on_close(profiling.stop)
+
+
+@app.command()
+def serve(
+    socket: Annotated[
+        Optional[Path],  # noqa: UP007 (typer needs Optional)
+        typer.Option(help="Socket path. Defaults to FASTRUCT_SOCKET."),
+    ] = None,
+) -> None:
+    """Keep fastruct loaded in a daemon to run commands faster.
+
+    While the daemon runs, fastruct commands are forwarded to it and skip imports and database configuration.\n
+    Stop it with Ctrl-C. Set FASTRUCT_NO_DAEMON to run commands without it.\n
+    """  # noqa: D301
+    from fastruct.client import socket_path
+    from fastruct.daemon import serve as serve_commands
+
+    try:
+        serve_commands(socket or socket_path())
+    except RuntimeError as error:
+        typer.secho(str(error), fg=typer.colors.RED, err=True)
+        raise typer.Exit(1) from error
 
-from fastruct.commands.foundations.app import app as foundations_app
-from fastruct.commands.loads.app import app as loads_app
-from fastruct.config_db import config_database
 
-app = typer.Typer()
+@app.command()
+def api(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    workers: Annotated[
+        Optional[int],  # noqa: UP007 (typer needs Optional)
+        typer.Option(help="Worker processes for analysis and design. Defaults to the number of CPUs."),
+    ] = None,
+) -> None:
+    """Serve the HTTP/JSON API.
 
+    Foundations, loads, analysis and design over HTTP, with analysis results streamed as NDJSON.\n
+    Requires the api extra: pip install fastruct[api].\n
+    """  # noqa: D301
+    try:
+        from fastruct.api.app import run
+    except ImportError as error:
+        typer.secho("The API requires aiohttp and aiosqlite: pip install fastruct[api]", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1) from error
 
-def config_app():
-    """App. Configuration."""
-    app.add_typer(loads_app, name="l", help="💪 Loads Module")
-    app.add_typer(foundations_app, name="f", help="🏢 Foundations Module")
+    run(host, port, workers)
 
 
 def main():
     """Entrypoint function."""
-    config_database()
-    config_app()
     app()
 
 
-main()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""HTTP/JSON API over the analysis and design engines."""
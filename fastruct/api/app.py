@@ -0,0 +1,403 @@
+"""HTTP/JSON API.
+
+An aiohttp application over the same database as the command line application. Foundations and loads are read and
+written with an async SQLAlchemy session (aiosqlite), while analysis and design run in a process pool, so the event
+loop only waits for their serialized results. Analysis results are streamed as NDJSON, one record per load: workers
+put them in a bounded queue chunk by chunk, and every chunk is written to the client as soon as it arrives.
+
+Endpoints:
+    GET    /foundations                     Every foundation.
+    POST   /foundations                     Add a foundation.
+    GET    /foundations/{id}                A foundation.
+    PATCH  /foundations/{id}                Update a foundation and recompute its loads at the seal level.
+    DELETE /foundations/{id}                Delete a foundation with its loads.
+    POST   /foundations/{id}/loads          Add user loads, as a JSON array or as NDJSON.
+    GET    /foundations/{id}/analysis       Stresses and percentajes by load, as NDJSON.
+    GET    /foundations/{id}/design         Ultimate moments envelope.
+
+Requires the optional `api` dependencies: `pip install fastruct[api]`.
+"""
+import asyncio
+import json
+import os
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from multiprocessing import get_context
+from multiprocessing.managers import SyncManager
+from queue import Full
+from typing import Any
+
+import sqlalchemy as sa
+from aiohttp import web
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastruct.config_db import async_session_scope, close_async_database, get_async_session_local
+from fastruct.foundations.cache import invalidate_results
+from fastruct.loads.queries import bulk_add_loads, update_loads_at_seal
+from fastruct.models.foundation import Foundation
+
+from . import workers
+
+EXECUTOR = web.AppKey("executor", Executor)
+# Manager of the queues that stream analysis results from the workers
+MANAGER = web.AppKey("manager", SyncManager)
+
+# Foundation fields accepted by the API, with their types
+FOUNDATION_FIELDS: dict[str, type | tuple[type, ...]] = {
+    "name": str,
+    "description": str,
+    "lx": (int, float),
+    "ly": (int, float),
+    "lz": (int, float),
+    "depth": (int, float),
+    "ex": (int, float),
+    "ey": (int, float),
+    "col_x": (int, float),
+    "col_y": (int, float),
+}
+GEOMETRY_FIELDS = ("lx", "ly", "lz", "depth", "ex", "ey", "col_x", "col_y")
+LOAD_FORCES = ("p", "vx", "vy", "mx", "my")
+
+# User loads inserted per statement when uploaded in bulk, so large uploads don't hold the event loop
+LOADS_CHUNK_SIZE = 10_000
+MAX_BODY_SIZE = 256 * 1024**2
+# NDJSON chunks of a streamed analysis waiting to be written
+STREAM_QUEUE_SIZE = 4
+# Put in the queue of a stream to wake up its receiver
+STOPPED = "stopped"
+
+routes = web.RouteTableDef()
+
+
+def create_app(workers_count: int | None = None, executor: Executor | None = None) -> web.Application:
+    """API application.
+
+    Args:
+        workers_count (int | None, optional): Worker processes for analysis and design. Defaults to the number of CPUs.
+        executor (Executor | None, optional): Executor to use instead of a new process pool. It is not shut down with
+            the application.
+    """
+    app = web.Application(client_max_size=MAX_BODY_SIZE)
+    app.add_routes(routes)
+    app.cleanup_ctx.append(partial(resources, workers_count=workers_count, executor=executor))
+    return app
+
+
+async def resources(
+    app: web.Application, workers_count: int | None = None, executor: Executor | None = None
+) -> AsyncIterator[None]:
+    """Configure the database and start the worker pool, and release them when the application stops."""
+    await get_async_session_local()
+    manager = get_context("spawn").Manager()
+    app[MANAGER] = manager
+    if executor is None:
+        # Spawned workers don't inherit the event loop nor the aiosqlite threads
+        pool = ProcessPoolExecutor(
+            workers_count or os.cpu_count(), mp_context=get_context("spawn"), initializer=workers.initialize_worker
+        )
+        app[EXECUTOR] = pool
+    else:
+        pool = None
+        app[EXECUTOR] = executor
+
+    yield
+
+    if pool is not None:
+        pool.shutdown(cancel_futures=True)
+    manager.shutdown()
+    await close_async_database()
+
+
+def run(host: str = "127.0.0.1", port: int = 8080, workers_count: int | None = None) -> None:
+    """Serve the API until interrupted."""
+    web.run_app(create_app(workers_count), host=host, port=port)
+
+
+@routes.get("/foundations")
+async def list_foundations(request: web.Request) -> web.Response:
+    """Every foundation, by ID."""
+    async with async_session_scope() as session:
+        foundations = (await session.scalars(sa.select(Foundation).order_by(Foundation.id))).all()
+        return web.json_response([foundation.as_dict() for foundation in foundations])
+
+
+@routes.post("/foundations")
+async def add_foundation(request: web.Request) -> web.Response:
+    """Add a foundation. The depth defaults to the height, and eccentricities and column sizes to 0."""
+    values = foundation_values(await json_body(request), required=("lx", "ly", "lz"))
+    values.setdefault("depth", values["lz"])
+    for name in ("ex", "ey", "col_x", "col_y"):
+        values.setdefault(name, 0)
+
+    async with async_session_scope() as session:
+        foundation = Foundation(**values)
+        session.add(foundation)
+        await flush(session)
+        await session.refresh(foundation)
+        return web.json_response(foundation.as_dict(), status=201)
+
+
+@routes.get("/foundations/{id:\\d+}")
+async def get_foundation(request: web.Request) -> web.Response:
+    """A foundation."""
+    async with async_session_scope() as session:
+        foundation = await stored_foundation(session, request)
+        return web.json_response(foundation.as_dict())
+
+
+@routes.patch("/foundations/{id:\\d+}")
+async def update_foundation(request: web.Request) -> web.Response:
+    """Update the given fields of a foundation. Its loads at the seal level are recomputed when the geometry changes."""
+    values = foundation_values(await json_body(request))
+    async with async_session_scope() as session:
+        foundation = await stored_foundation(session, request)
+        geometry_changed = any(values[name] != getattr(foundation, name) for name in GEOMETRY_FIELDS if name in values)
+        for name, value in values.items():
+            setattr(foundation, name, value)
+        await flush(session)
+
+        if geometry_changed:
+            await session.run_sync(update_loads_at_seal, foundation)
+            await session.run_sync(invalidate_results, [foundation.id])
+        await session.refresh(foundation)
+        return web.json_response(foundation.as_dict())
+
+
+@routes.delete("/foundations/{id:\\d+}")
+async def delete_foundation(request: web.Request) -> web.Response:
+    """Delete a foundation with its loads and results."""
+    async with async_session_scope() as session:
+        foundation = await stored_foundation(session, request)
+        await session.delete(foundation)
+    return web.Response(status=204)
+
+
+@routes.post("/foundations/{id:\\d+}/loads")
+async def add_loads(request: web.Request) -> web.Response:
+    """Add user loads to a foundation, as a JSON array or as NDJSON (`application/x-ndjson`).
+
+    Every load has p, vx, vy, mx, my and an optional name. Loads already stored for the foundation, or repeated in
+    the body, are skipped.
+    """
+    if request.content_type == "application/x-ndjson":
+        lines = (await request.text()).splitlines()
+        try:
+            body = [json.loads(line) for line in lines if line.strip()]
+        except ValueError as error:
+            raise bad_request(f"Invalid NDJSON: {error}") from error
+    else:
+        body = await json_body(request)
+    if not isinstance(body, list):
+        raise bad_request("Loads must be a list")
+
+    async with async_session_scope() as session:
+        foundation = await stored_foundation(session, request)
+        user_loads = [user_load_values(foundation.id, load, number) for number, load in enumerate(body, start=1)]
+        added = 0
+        for start in range(0, len(user_loads), LOADS_CHUNK_SIZE):
+            chunk = user_loads[start : start + LOADS_CHUNK_SIZE]
+            added += len(await session.run_sync(bulk_add_loads, chunk, {foundation.id: foundation}))
+        if added:
+            await session.run_sync(invalidate_results, [foundation.id])
+
+    return web.json_response({"added": added, "skipped": len(user_loads) - added}, status=201)
+
+
+@routes.get("/foundations/{id:\\d+}/analysis")
+async def analyze(request: web.Request) -> web.StreamResponse:
+    """Stresses and percentajes by load, streamed as NDJSON while the worker serializes them.
+
+    Query parameters: method (defaults to bi-direction), combinations (service or ultimate), order (stress or
+    percentaje), top and cache (false to recompute the results).
+    """
+    query = request.query
+    top = int_parameter(request, "top")
+    manager = request.app[MANAGER]
+    chunks, cancelled = manager.Queue(STREAM_QUEUE_SIZE), manager.Event()
+    # Blocking gets of a shared pool could all wait on queued workers, so every stream gets its own receiver thread
+    receiver = ThreadPoolExecutor(1, thread_name_prefix="analysis-receiver")
+    worker = asyncio.get_running_loop().run_in_executor(
+        request.app[EXECUTOR],
+        workers.stream_analysis,
+        chunks,
+        cancelled,
+        int(request.match_info["id"]),
+        query.get("method", "bi-direction"),
+        query.get("combinations"),
+        query.get("order"),
+        top,
+        query.get("cache", "true").lower() != "false",
+    )
+
+    try:
+        chunk = await receive(chunks, worker, receiver)
+        if isinstance(chunk, Exception):
+            raise http_error(chunk)
+
+        response = web.StreamResponse(headers={"Content-Type": "application/x-ndjson"})
+        await response.prepare(request)
+        while chunk is not None:
+            if isinstance(chunk, Exception):
+                # The status is already sent, so the response is cut short
+                raise chunk
+            try:
+                await response.write(chunk)
+            except ConnectionResetError:
+                # The client is gone
+                return response
+            chunk = await receive(chunks, worker, receiver)
+        await response.write_eof()
+        return response
+    finally:
+        # Stops the worker when the client is gone or the stream failed
+        cancelled.set()
+        receiver.shutdown(wait=False)
+
+
+@routes.get("/foundations/{id:\\d+}/design")
+async def design(request: web.Request) -> web.Response:
+    """Maximum ultimate moment of every side of the column and the load that governs it."""
+    envelope = await in_worker(
+        request, workers.design_envelope, int(request.match_info["id"]), request.query.get("combinations")
+    )
+    return web.json_response(envelope)
+
+
+async def in_worker(request: web.Request, function: Callable[..., Any], *args: Any) -> Any:
+    """Run a function in the worker pool, turning its lookup and value errors into HTTP errors."""
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(request.app[EXECUTOR], function, *args)
+    except (LookupError, ValueError) as error:
+        raise http_error(error) from error
+
+
+async def receive(chunks: Any, worker: asyncio.Future, receiver: Executor) -> Any:
+    """Next item put in a queue by a worker, waited for in the receiver thread of the stream.
+
+    The receiver blocks on the queue, and it is woken up with `STOPPED` when the worker fails without putting its
+    error or the request is cancelled, so no thread is left waiting.
+
+    Raises:
+        Exception: The error of the worker, when it failed without putting anything else in the queue.
+    """
+    item = asyncio.get_running_loop().run_in_executor(receiver, chunks.get)
+    try:
+        await asyncio.wait((item, worker), return_when=asyncio.FIRST_COMPLETED)
+        # A worker that returned put its last item already, so only a failed one leaves the receiver waiting
+        if not item.done() and (worker.cancelled() or worker.exception() is not None):
+            wake(chunks)
+            worker.result()
+        return await item
+    except asyncio.CancelledError:
+        wake(chunks)
+        raise
+
+
+def wake(chunks: Any) -> None:
+    """Wake up a receiver waiting on an empty queue."""
+    with suppress(Full):
+        chunks.put_nowait(STOPPED)
+
+
+def http_error(error: Exception) -> Exception:
+    """HTTP error for a lookup or value error of a worker, or the error itself for any other one."""
+    if isinstance(error, LookupError):
+        return not_found(str(error))
+    if isinstance(error, ValueError):
+        return bad_request(str(error))
+    return error
+
+
+async def stored_foundation(session: AsyncSession, request: web.Request) -> Foundation:
+    """Foundation of the request path.
+
+    Raises:
+        web.HTTPNotFound: When the foundation doesn't exist.
+    """
+    foundation = await session.get(Foundation, int(request.match_info["id"]))
+    if foundation is None:
+        raise not_found("Foundation not found")
+    return foundation
+
+
+async def flush(session: AsyncSession) -> None:
+    """Flush the session, turning constraint violations into bad requests."""
+    try:
+        await session.flush()
+    except IntegrityError as error:
+        raise bad_request(f"Invalid foundation: {error.orig}") from error
+
+
+async def json_body(request: web.Request) -> Any:
+    """JSON body of a request.
+
+    Raises:
+        web.HTTPBadRequest: When the body is not valid JSON.
+    """
+    try:
+        return await request.json()
+    except ValueError as error:
+        raise bad_request(f"Invalid JSON: {error}") from error
+
+
+def foundation_values(body: Any, required: tuple[str, ...] = ()) -> dict[str, Any]:
+    """Foundation fields of a request body.
+
+    Raises:
+        web.HTTPBadRequest: When the body has unknown fields, values of the wrong type or misses required fields.
+    """
+    if not isinstance(body, dict):
+        raise bad_request("Foundation must be an object")
+
+    unknown = body.keys() - FOUNDATION_FIELDS.keys()
+    if unknown:
+        raise bad_request(f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    missing = [name for name in required if name not in body]
+    if missing:
+        raise bad_request(f"Missing fields: {', '.join(missing)}")
+
+    for name, value in body.items():
+        if not isinstance(value, FOUNDATION_FIELDS[name]) or isinstance(value, bool):
+            raise bad_request(f"Invalid value for {name}: {value!r}")
+    return dict(body)
+
+
+def user_load_values(foundation_id: int, load: Any, number: int) -> dict[str, Any]:
+    """User load values of a load of the body, as taken by `bulk_add_loads`.
+
+    Raises:
+        web.HTTPBadRequest: When the load misses a force or has values of the wrong type.
+    """
+    try:
+        name = load.get("name")
+        values = {"foundation_id": foundation_id, "name": None if name is None else str(name)}
+        values.update((force, float(load[force])) for force in LOAD_FORCES)
+    except (AttributeError, KeyError, TypeError, ValueError) as error:
+        raise bad_request(f"Invalid load {number}: it must have numeric {', '.join(LOAD_FORCES)}") from error
+    return values
+
+
+def int_parameter(request: web.Request, name: str) -> int | None:
+    """Integer query parameter, None when it is not given."""
+    value = request.query.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError as error:
+        raise bad_request(f"{name} must be an integer") from error
+
+
+def bad_request(message: str) -> web.HTTPBadRequest:
+    """Bad request error with a JSON body."""
+    return web.HTTPBadRequest(text=json.dumps({"error": message}), content_type="application/json")
+
+
+def not_found(message: str) -> web.HTTPNotFound:
+    """Not found error with a JSON body."""
+    return web.HTTPNotFound(text=json.dumps({"error": message}), content_type="application/json")
@@ -0,0 +1,218 @@
+"""Test for HTTP API module."""
+import asyncio
+import json
+import threading
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from queue import Queue
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("aiosqlite")
+
+from aiohttp import ClientResponse  # noqa: E402
+from aiohttp.test_utils import TestClient, TestServer  # noqa: E402
+
+from fastruct import config_db  # noqa: E402
+from fastruct.api import workers  # noqa: E402
+from fastruct.api.app import create_app, receive  # noqa: E402
+
+GEOMETRY = {"lx": 2, "ly": 2.2, "lz": 0.5, "depth": 2, "col_x": 0.4, "col_y": 0.4}
+LOADS = [
+    {"name": "D", "p": 50, "vx": 1, "vy": 2, "mx": 3, "my": 4},
+    {"name": "E", "p": 20, "vx": 4, "vy": 1, "mx": 30, "my": 2},
+    {"p": 10, "vx": 0, "vy": 0, "mx": 0, "my": 40},
+]
+
+Scenario = Callable[[TestClient], Awaitable[None]]
+
+
+@pytest.fixture
+def database(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Empty database file used by the API."""
+    path = tmp_path / "fastructdb.db"
+    monkeypatch.setenv("FASTRUCT_DATABASE", str(path))
+    monkeypatch.setattr(config_db, "_session_local", None)
+    monkeypatch.setattr(config_db, "_async_session_local", None)
+    yield path
+
+
+@pytest.fixture
+def run(database: Path) -> Iterator[Callable[[Scenario], None]]:
+    """Run a scenario against the API, with a thread pool instead of worker processes."""
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    def run_scenario(scenario: Scenario) -> None:
+        async def main() -> None:
+            async with TestClient(TestServer(create_app(executor=executor))) as client:
+                await scenario(client)
+
+        asyncio.run(main())
+
+    yield run_scenario
+    executor.shutdown()
+
+
+async def add_foundation(client: TestClient) -> int:
+    """ID of a new foundation with loads."""
+    response = await client.post("/foundations", json=GEOMETRY)
+    assert response.status == 201
+    foundation_id = (await response.json())["id"]
+    response = await client.post(f"/foundations/{foundation_id}/loads", json=LOADS)
+    assert response.status == 201
+    return foundation_id
+
+
+async def ndjson(response: ClientResponse) -> list[dict]:
+    """Records of an NDJSON response."""
+    return [json.loads(line) for line in (await response.text()).splitlines()]
+
+
+def test_foundation_crud(run: Callable[[Scenario], None]) -> None:
+    """Foundations are added, listed, updated and deleted."""
+
+    async def scenario(client: TestClient) -> None:
+        response = await client.post("/foundations", json={"lx": 1, "ly": 1, "lz": 1, "name": "F1"})
+        assert response.status == 201
+        foundation = await response.json()
+        assert foundation["depth"] == 1 and foundation["col_x"] == 0
+
+        assert [item["id"] for item in await (await client.get("/foundations")).json()] == [foundation["id"]]
+
+        response = await client.patch(f"/foundations/{foundation['id']}", json={"lx": 2, "description": "Updated"})
+        assert response.status == 200
+        assert (await response.json())["lx"] == 2
+        assert (await (await client.get(f"/foundations/{foundation['id']}")).json())["description"] == "Updated"
+
+        assert (await client.delete(f"/foundations/{foundation['id']}")).status == 204
+        assert (await client.get(f"/foundations/{foundation['id']}")).status == 404
+
+    run(scenario)
+
+
+def test_invalid_foundations(run: Callable[[Scenario], None]) -> None:
+    """Invalid bodies are rejected with the reason."""
+
+    async def scenario(client: TestClient) -> None:
+        for body in ({"lx": 1, "ly": 1}, {"lx": 1, "ly": 1, "lz": 1, "height": 2}, {"lx": "1", "ly": 1, "lz": 1}):
+            response = await client.post("/foundations", json=body)
+            assert response.status == 400
+            assert "error" in await response.json()
+
+        response = await client.post("/foundations", json={"lx": -1, "ly": 1, "lz": 1})
+        assert response.status == 400
+
+    run(scenario)
+
+
+def test_add_loads(run: Callable[[Scenario], None]) -> None:
+    """Loads are added as JSON or NDJSON, skipping the ones already stored."""
+
+    async def scenario(client: TestClient) -> None:
+        foundation_id = await add_foundation(client)
+        body = "\n".join(json.dumps(load) for load in [*LOADS[:1], {"p": 5, "vx": 0, "vy": 0, "mx": 0, "my": 0}])
+        response = await client.post(
+            f"/foundations/{foundation_id}/loads", data=body, headers={"Content-Type": "application/x-ndjson"}
+        )
+        assert await response.json() == {"added": 1, "skipped": 1}
+
+        response = await client.post(f"/foundations/{foundation_id}/loads", json=[{"p": 5}])
+        assert response.status == 400
+        assert (await client.post("/foundations/999/loads", json=LOADS)).status == 404
+
+    run(scenario)
+
+
+def test_analysis(run: Callable[[Scenario], None]) -> None:
+    """Results by load are streamed as NDJSON, in load order or ranked."""
+
+    async def scenario(client: TestClient) -> None:
+        foundation_id = await add_foundation(client)
+
+        response = await client.get(f"/foundations/{foundation_id}/analysis")
+        assert response.status == 200
+        assert response.content_type == "application/x-ndjson"
+        results = await ndjson(response)
+        assert [result["number"] for result in results] == [1, 2, 3]
+        assert {"name", "p", "stress", "percentaje"} <= results[0].keys()
+
+        response = await client.get(f"/foundations/{foundation_id}/analysis", params={"top": "1", "cache": "false"})
+        governing = await ndjson(response)
+        assert len(governing) == 1
+        # Loads without solution govern
+        assert governing[0]["number"] == 3
+        assert governing[0]["stress"] is None
+
+        response = await client.get(f"/foundations/{foundation_id}/analysis", params={"method": "one-direction"})
+        assert {"stress_x", "stress_y"} <= (await ndjson(response))[0].keys()
+
+        assert (await client.get(f"/foundations/{foundation_id}/analysis", params={"method": "x"})).status == 400
+        assert (await client.get(f"/foundations/{foundation_id}/analysis", params={"top": "a"})).status == 400
+        assert (await client.get("/foundations/999/analysis")).status == 404
+
+    run(scenario)
+
+
+def test_stream_analysis(run: Callable[[Scenario], None], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Workers put the results in the queue chunk by chunk, and stop when the request is cancelled."""
+    monkeypatch.setattr(workers, "CHUNK_SIZE", 1)
+
+    def streamed(foundation_id: int, cancelled: bool = False) -> list:
+        chunks: Queue = Queue(maxsize=len(LOADS) + 1)
+        event = threading.Event()
+        if cancelled:
+            event.set()
+        workers.stream_analysis(chunks, event, foundation_id)
+        return [chunks.get_nowait() for _ in range(chunks.qsize())]
+
+    async def scenario(client: TestClient) -> None:
+        foundation_id = await add_foundation(client)
+
+        chunks = streamed(foundation_id)
+        assert chunks[-1] is None
+        assert [json.loads(chunk)["number"] for chunk in chunks[:-1]] == [1, 2, 3]
+
+        assert streamed(foundation_id, cancelled=True) == []
+        [error] = streamed(999)
+        assert isinstance(error, LookupError)
+
+        response = await client.get(f"/foundations/{foundation_id}/analysis")
+        assert [result["number"] for result in await ndjson(response)] == [1, 2, 3]
+
+    run(scenario)
+
+
+def test_receive_failed_worker() -> None:
+    """The receiver waiting on the queue is woken up when the worker fails without putting its error."""
+
+    async def scenario() -> None:
+        chunks: Queue = Queue()
+        receiver = ThreadPoolExecutor(1)
+        worker = asyncio.get_running_loop().create_future()
+        worker.set_exception(RuntimeError("worker died"))
+
+        with pytest.raises(RuntimeError, match="worker died"):
+            await receive(chunks, worker, receiver)
+        receiver.shutdown()
+        assert chunks.empty()
+
+    asyncio.run(scenario())
+
+
+def test_design(run: Callable[[Scenario], None]) -> None:
+    """The envelope has the maximum moment of every side and its governing load."""
+
+    async def scenario(client: TestClient) -> None:
+        foundation_id = await add_foundation(client)
+
+        response = await client.get(f"/foundations/{foundation_id}/design")
+        envelope = await response.json()
+        assert [side["side"] for side in envelope] == ["x left", "x right", "y left", "y right"]
+        assert all(side["load"]["name"] in ("D", "E", None) for side in envelope)
+
+        response = await client.get(f"/foundations/{foundation_id}/design", params={"combinations": "unknown"})
+        assert response.status == 400
+
+    run(scenario)
@@ -0,0 +1,161 @@
+"""CPU bound work of the HTTP API, run in a worker pool.
+
+Every function opens its own synchronous session, so only IDs and options go to the workers and only serialized
+results come back: design envelopes as JSON ready dictionaries, and analysis results as NDJSON chunks put in a queue
+as they are serialized, so the application writes every chunk to the client while the next one is serialized.
+"""
+import json
+from collections.abc import Iterator
+from itertools import chain
+from queue import Full
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.orm import Session
+
+from fastruct.config_db import get_session_local, session_scope
+from fastruct.foundations.analysis.methods import load_engines
+from fastruct.foundations.design import SIDES, moment_envelope, ultimate_moment_arrays
+from fastruct.foundations.export import records, results_columns
+from fastruct.foundations.results import analysis_loads, analysis_results, cached_analysis_results, ordered_results
+from fastruct.models.foundation import Foundation
+
+if TYPE_CHECKING:
+    from queue import Queue
+    from threading import Event
+
+# Records per NDJSON chunk
+CHUNK_SIZE = 1000
+# Seconds a worker waits for the client to take a chunk before checking whether the request was cancelled
+SEND_TIMEOUT = 1.0
+
+
+def initialize_worker() -> None:
+    """Register the analysis engines and configure the database once per worker process."""
+    load_engines()
+    get_session_local()
+
+
+def stream_analysis(chunks: "Queue[Any]", cancelled: "Event", foundation_id: int, *options: Any) -> None:
+    """Put the analysis results of a foundation in a queue, as NDJSON chunks of `CHUNK_SIZE` lines, and then None.
+
+    The queue is bounded, so the worker only serializes ahead of the client by a few chunks. An error that stops the
+    analysis is put in the queue instead, and the worker stops early when the request is cancelled.
+
+    Args:
+        chunks (Queue): Queue shared with the application.
+        cancelled (Event): Set by the application when the client is gone.
+        foundation_id (int): Foundation's ID.
+        *options: Method, combinations, order, top and use_cache, as taken by `analysis_columns`.
+    """
+    try:
+        columns = analysis_columns(foundation_id, *options)
+        for chunk in chain(ndjson_chunks(records(columns), CHUNK_SIZE), [None]):
+            if not send(chunks, cancelled, chunk):
+                return
+    except Exception as error:
+        send(chunks, cancelled, error)
+
+
+def send(chunks: "Queue[Any]", cancelled: "Event", item: Any) -> bool:
+    """Put an item in the queue, waiting while it is full. False when the request is cancelled first."""
+    while not cancelled.is_set():
+        try:
+            chunks.put(item, timeout=SEND_TIMEOUT)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def analysis_columns(
+    foundation_id: int,
+    method: str = "bi-direction",
+    combinations: str | None = None,
+    order: str | None = None,
+    top: int | None = None,
+    use_cache: bool = True,
+) -> dict[str, list]:
+    """Analysis results of a foundation by column.
+
+    Args:
+        foundation_id (int): Foundation's ID.
+        method (str, optional): Analysis method. Defaults to "bi-direction".
+        combinations (str | None, optional): Analyze the combinations of the load cases from this table instead of
+            the stored loads. Defaults to None.
+        order (str | None, optional): Sort the loads by "stress" or "percentaje". Defaults to the load order.
+        top (int | None, optional): Only keep this number of governing loads, by the order or by stress.
+        use_cache (bool, optional): Read and store the results of the stored loads in the results cache.
+
+    Returns:
+        dict[str, list]: Columns of the CSV export and the solver diagnostics, by load.
+
+    Raises:
+        LookupError: When the foundation doesn't exist.
+        ValueError: When the method, the combination table, the order or top are not valid.
+    """
+    with session_scope() as session:
+        foundation = get_foundation(session, foundation_id)
+        loads = analysis_loads(session, foundation, combinations)
+        if combinations is not None:
+            stresses, percentajes, diagnostics = analysis_results(foundation, method, loads)
+        else:
+            stresses, percentajes, diagnostics = cached_analysis_results(session, foundation, method, loads, use_cache)
+
+    numbers, loads, stresses, percentajes, diagnostics = ordered_results(
+        range(1, len(loads) + 1), loads, stresses, percentajes, diagnostics, order, top
+    )
+    return results_columns(numbers, loads, stresses, percentajes, method, diagnostics)
+
+
+def design_envelope(foundation_id: int, combinations: str | None = None) -> list[dict]:
+    """Maximum ultimate moment of every side of the column and the load that governs it.
+
+    Returns:
+        list[dict]: Side, moment, and number, name and forces of the governing load. Moment and load are None when
+            there are no loads.
+
+    Raises:
+        LookupError: When the foundation doesn't exist.
+        ValueError: When the combination table is not valid.
+    """
+    with session_scope() as session:
+        foundation = get_foundation(session, foundation_id)
+        loads = analysis_loads(session, foundation, combinations)
+        maximum, governing = moment_envelope(ultimate_moment_arrays(foundation, loads.p, loads.mx, loads.my))
+
+    envelope = []
+    for side, moment, index in zip(SIDES, maximum.tolist(), governing.tolist(), strict=True):
+        load = loads[index] if index >= 0 else None
+        envelope.append(
+            {
+                "side": side,
+                "moment": moment if load is not None else None,
+                "number": index + 1 if load is not None else None,
+                "load": load._asdict() if load is not None else None,
+            }
+        )
+    return envelope
+
+
+def get_foundation(session: Session, foundation_id: int) -> Foundation:
+    """Stored foundation.
+
+    Raises:
+        LookupError: When the foundation doesn't exist.
+    """
+    foundation = session.get(Foundation, foundation_id)
+    if foundation is None:
+        raise LookupError("Foundation not found")
+    return foundation
+
+
+def ndjson_chunks(rows: Iterator[dict], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """JSON Lines of the rows, joined in chunks of `chunk_size` lines."""
+    lines: list[str] = []
+    for row in rows:
+        lines.append(json.dumps(row))
+        if len(lines) == chunk_size:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
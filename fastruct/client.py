@@ -0,0 +1,184 @@
+"""Command line entry point that forwards commands to the fastruct daemon when it is running.
+
+Only the standard library is imported here, so forwarding a command to `fastruct serve` doesn't pay for importing
+Typer, SQLAlchemy or Rich. The standard streams are passed to the daemon as file descriptors, so the forwarded command
+reads and writes the terminal of the caller directly, with its colors, size and prompts.
+
+Environment variables:
+    FASTRUCT_SOCKET: Path of the daemon socket. Defaults to `fastruct.sock` in a private `fastruct-<uid>` directory
+        of `XDG_RUNTIME_DIR`, or of the temporary directory.
+    FASTRUCT_NO_DAEMON: Run every command in this process even if the daemon is running.
+"""
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+# Long-running commands, that always run in the calling process
+LOCAL_COMMANDS = ("serve", "api")
+# Global options of the command line application followed by a value
+VALUE_OPTIONS = ("--profile-output",)
+
+
+def socket_path() -> Path:
+    """Path of the daemon socket."""
+    if "FASTRUCT_SOCKET" in os.environ:
+        return Path(os.environ["FASTRUCT_SOCKET"])
+
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return Path(directory) / f"fastruct-{os.getuid()}" / "fastruct.sock"
+
+
+def trusted_directory(path: Path) -> bool:
+    """Whether only the user, or root, can create or replace files in a directory.
+
+    The directory must be owned by the user or by root, and not writable by others unless it is sticky, as `/tmp` is.
+    """
+    try:
+        status = path.lstat()
+    except OSError:
+        return False
+    shared_writable = status.st_mode & (stat.S_IWGRP | stat.S_IWOTH) and not status.st_mode & stat.S_ISVTX
+    return stat.S_ISDIR(status.st_mode) and status.st_uid in (os.getuid(), 0) and not shared_writable
+
+
+def trusted_socket(path: Path) -> bool:
+    """Whether a path is a socket of the user in a trusted directory, so it wasn't created by another user."""
+    try:
+        status = path.lstat()
+    except OSError:
+        return False
+    return stat.S_ISSOCK(status.st_mode) and status.st_uid == os.getuid() and trusted_directory(path.parent)
+
+
+def peer_is_user(connection: socket.socket) -> bool:
+    """Whether the process listening on a connected Unix socket runs as the user.
+
+    Peer credentials are only available on Linux. Elsewhere the ownership of the socket checked by `trusted_socket` is
+    relied on.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    credentials = connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid == os.getuid()
+
+
+def daemon_supported() -> bool:
+    """Whether the platform can pass file descriptors over Unix sockets and fork the daemon."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds") and hasattr(os, "fork")
+
+
+def subcommand(argv: list[str]) -> str | None:
+    """Subcommand of the command line arguments, the first one that is not a global option or its value."""
+    arguments = iter(argv)
+    for argument in arguments:
+        if argument == "--":
+            return next(arguments, None)
+        if argument in VALUE_OPTIONS:
+            next(arguments, None)
+        elif not argument.startswith("-"):
+            return argument
+    return None
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run a command in the daemon.
+
+    Args:
+        argv (list[str]): Command line arguments, without the program name.
+
+    Returns:
+        int | None: Exit code of the command, or None when there is no daemon to run it, so it must run locally.
+    """
+    if os.environ.get("FASTRUCT_NO_DAEMON") or not daemon_supported() or subcommand(argv) in LOCAL_COMMANDS:
+        return None
+
+    try:
+        fds = [stream.fileno() for stream in (sys.stdin, sys.stdout, sys.stderr)]
+    except (AttributeError, OSError, ValueError):
+        # Standard streams without a file descriptor can't be passed to the daemon
+        return None
+
+    client = connect(socket_path())
+    if client is None:
+        return None
+
+    with client:
+        request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+        socket.send_fds(client, [b"\0"], fds)
+        client.sendall(json.dumps(request).encode() + b"\n")
+        return wait(client.makefile("rb"))  # type: ignore
+
+
+def connect(path: Path) -> socket.socket | None:
+    """Connection to the daemon listening on a socket.
+
+    The environment and the terminal of the user are only sent to a daemon of the same user, so sockets that other
+    users could have created and daemons running as other users are ignored.
+
+    Returns:
+        socket.socket | None: Connected socket, or None when there is no trusted daemon listening on the path.
+    """
+    if not path.exists():
+        return None
+    if not trusted_socket(path):
+        print(f"Ignoring {path}: it is not a socket of this user in a private directory", file=sys.stderr)
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(path))
+    except OSError:
+        # Stale socket of a daemon that didn't stop cleanly
+        client.close()
+        return None
+
+    if not peer_is_user(client):
+        client.close()
+        print(f"Ignoring {path}: the fastruct daemon listening on it runs as another user", file=sys.stderr)
+        return None
+    return client
+
+
+def wait(responses: BinaryIO) -> int:
+    """Wait for the exit code of the forwarded command, passing interrupts on to the process that runs it."""
+    pid = None
+    while True:
+        try:
+            line = responses.readline()
+        except KeyboardInterrupt:
+            if pid is not None:
+                os.kill(pid, signal.SIGINT)
+            continue
+
+        if not line:
+            print("fastruct daemon closed the connection", file=sys.stderr)
+            return 1
+
+        response = json.loads(line)
+        if "pid" in response:
+            pid = response["pid"]
+        else:
+            return response["exit"]
+
+
+def main() -> None:
+    """Entrypoint function."""
+    code = forward(sys.argv[1:])
+    if code is None:
+        from fastruct.__main__ import main as run
+
+        run()
+    else:
+        sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,36 @@
 """Foundations Commands."""
-from typing import Optional
+import sys
+from pathlib import Path
+from typing import Annotated, Optional
 
 import sqlalchemy as sa
 import typer
 from rich.console import Console
 
+from fastruct import profiling
 from fastruct.config_db import session_scope
-from fastruct.foundations.tables import analize_table, display_page, foundation_table, prepare_row
+from fastruct.foundations.cache import invalidate_results
+from fastruct.foundations.tables import (
+    analize_table,
+    design_table,
+    display_page,
+    foundation_table,
+    governing_table,
+    paginate,
+    prepare_row,
+)
+from fastruct.loads.queries import update_loads_at_seal
 from fastruct.models.foundation import Foundation
 
-from .utils import get_max_value, stresses_and_percentajes_by_method
+from .utils import (
+    all_results,
+    get_analysis_loads,
+    get_max_value,
+    order_results,
+    results_by_page,
+    results_with_max,
+    write_results,
+)
 
 app = typer.Typer()
 console = Console()
@@ -147,12 +168,8 @@ def update(
         if description is not None:
             foundation.description = description
 
-        session.commit()
-
-        for user_load, load in zip(foundation.user_loads, foundation.loads, strict=True):
-            load.p = user_load.p + foundation.weight() + foundation.ground_weight()
-            load.mx = user_load.mx + user_load.vy * foundation.lz + user_load.p * foundation.ey
-            load.my = user_load.my + user_load.vx * foundation.lz + user_load.p * foundation.ex
+        update_loads_at_seal(session, foundation)
+        invalidate_results(session, [foundation.id])
 
         print(foundation)
 
@@ -186,6 +203,13 @@ def analyze_stresses_and_lifts(
     no_color: bool = False,
     rows_per_page: Optional[int] = None,
     order: Optional[str] = None,
+    prefilter: bool = False,
+    no_cache: bool = False,
+    interactive: bool = True,
+    top: Optional[int] = None,
+    export_format: Annotated[Optional[str], typer.Option("--format")] = None,
+    output: Annotated[Optional[Path], typer.Option("--output", "-o")] = None,
+    combinations: Optional[str] = None,
 ) -> None:
     """Analyze maximum stresses and lifts.\n
 
@@ -194,59 +218,175 @@ def analyze_stresses_and_lifts(
 
     Args:\n
         foundation_id (int): The ID of the foundation to analyze.\n
+        rows_per_page (int): Loads by page. Defaults to 20. Without order, top, prefilter nor format, results that are\n
+            not stored yet are analyzed page by page as the pages are shown, and the maximum stress of every page\n
+            is highlighted instead of the one of every load.\n
+        prefilter (bool): Only analyze and list the loads that may govern (bi-direction method).\n
+        no_cache (bool): Recompute the results even if they are stored for the current loads.\n
+        top (int): Only show the given number of governing loads, by the order or by stress.\n
+        interactive (bool): Prompt between pages. Every page is printed without prompts when disabled or when the\n
+            output is not a terminal.\n
+        export_format (str): Write the results by load as csv, jsonl or parquet instead of a table.\n
+        output (Path): File for the exported results. CSV and JSON Lines go to the standard output without it.\n
+        combinations (str): Analyze the combinations of the load cases from this table (service or ultimate)\n
+            instead of the stored loads.\n
     """
     with session_scope() as session:
-        foundation = session.query(Foundation).filter_by(id=foundation_id).first()
+        with profiling.phase("query"):
+            foundation = session.get(Foundation, foundation_id)
         if foundation is None:
             typer.secho("Foundation not found", fg=typer.colors.RED)
             raise typer.Exit()
 
-        stresses, percentajes = stresses_and_percentajes_by_method(foundation, method)  # type: ignore
-        max_stress = get_max_value(stresses)
+        loads = get_analysis_loads(session, foundation, combinations)
+        if rows_per_page is None:
+            rows_per_page = 20
+        if order is None and top is not None:
+            order = "stress"
 
-        loads = foundation.loads
-        if order is not None:
-            if order not in ("stress", "percentaje"):
-                typer.secho("Order must be 'stress' or 'percentaje'", fg=typer.colors.RED)
-                raise typer.Exit()
+        if not prefilter and order is None and export_format is None:
+            # Combinations are generated on the fly, so their results are not stored
+            stored = combinations is None
+            pages = results_by_page(session, foundation, method, loads, rows_per_page, stored and not no_cache, stored)
+        else:
+            numbers, loads, stresses, percentajes, diagnostics = all_results(
+                session, foundation, method, loads, prefilter, no_cache, combinations
+            )
+            max_stress = get_max_value(stresses)
 
-            data = list(zip(foundation.loads, stresses, percentajes, strict=True))
-            if order == "stress":
-                # Order desc by 'stress'
-                data.sort(key=lambda x: (x[1] is None, x[1]), reverse=True)
-            else:
-                # Order asc by 'percentaje'
-                data.sort(key=lambda x: x[2])
+            if order is not None:
+                numbers, loads, stresses, percentajes, diagnostics = order_results(
+                    numbers, loads, stresses, percentajes, diagnostics, order, top
+                )
 
-            loads, stresses, percentajes = zip(*data, strict=True)
+            if export_format is not None:
+                from fastruct.foundations.export import results_columns
 
-        all_rows = []
-        for i, (load, stress, percentaje) in enumerate(zip(loads, stresses, percentajes, strict=True), start=1):
-            row = prepare_row(
-                i, load, stress, percentaje, method, max_stress, limit, no_loads, no_color  # type: ignore
-            )
-            all_rows.append(row)
+                with profiling.phase("formatting"):
+                    columns = results_columns(
+                        numbers, loads, stresses, percentajes, method, diagnostics  # type: ignore
+                    )
+                write_results(columns, export_format, output)
+                return
 
-        table = analize_table(str(foundation), method, no_loads)  # type: ignore
-        if rows_per_page is None:
-            rows_per_page = 20
+            pages = paginate(
+                results_with_max(numbers, loads, stresses, percentajes, diagnostics, max_stress), rows_per_page
+            )
 
-        num_pages = len(all_rows) // rows_per_page + (1 if len(all_rows) % rows_per_page else 0)
-        for page in range(num_pages):
-            start_idx = page * rows_per_page
-            end_idx = start_idx + rows_per_page
-            table = analize_table(str(foundation), method, no_loads)  # type: ignore
-            display_page(start_idx, end_idx, all_rows, table)
-            if page < num_pages - 1:
-                user_input = input(f"Page {page+1}/{num_pages}, press Enter to watch next results, 'q' to quit... ")
+        # Stream every page without prompts when the output is piped
+        interactive = interactive and sys.stdout.isatty()
+        num_pages = -(-len(loads) // rows_per_page)
+        for page, page_results in enumerate(pages, start=1):
+            with profiling.phase("formatting"):
+                rows = [
+                    prepare_row(i, load, s, pct, method, max_s, limit, no_loads, no_color, diag)  # type: ignore
+                    for i, load, s, pct, diag, max_s in page_results
+                ]
+            with profiling.phase("rendering"):
+                display_page(rows, analize_table(str(foundation), method, no_loads))  # type: ignore
+            if interactive and page < num_pages:
+                user_input = input(f"Page {page}/{num_pages}, press Enter to watch next results, 'q' to quit... ")
                 if user_input == "q":
                     break
 
 
+@app.command(name="analize-all")
+def analyze_all(
+    foundation_ids: Annotated[Optional[list[int]], typer.Argument()] = None,
+    method: str = "bi-direction",
+    workers: Optional[int] = None,
+) -> None:
+    """Analyze the governing stress and lift of many foundations.\n
+
+    Foundations and loads are fetched in bulk and analyzed in parallel processes. One summary row is printed for\n
+    every foundation.\n
+
+    Args:\n
+        foundation_ids (list[int] | None): IDs of the foundations to analyze. Defaults to all foundations.\n
+        method (str): Analysis method: 'bi-direction', 'one-direction' or 'exact'. Defaults to 'bi-direction'.\n
+        workers (int | None): Number of worker processes. Defaults to the number of CPUs.\n
+    """
+    import numpy as np
+
+    from fastruct.foundations.analysis.batch import BATCH_METHODS, analyze_foundations
+    from fastruct.loads.queries import get_load_arrays_by_foundation
+
+    if method not in BATCH_METHODS:
+        typer.secho(f"Method must be one of: {', '.join(BATCH_METHODS)}", fg=typer.colors.RED)
+        raise typer.Exit()
+
+    with session_scope() as session:
+        query = session.query(Foundation).order_by(Foundation.id)
+        if foundation_ids:
+            query = query.filter(Foundation.id.in_(foundation_ids))
+        foundations = query.all()
+        loads = get_load_arrays_by_foundation(session, foundation_ids or None)
+
+        no_loads = (np.array([], dtype=np.int64), np.array([]), np.array([]), np.array([]))
+        data = [(foundation.lx, foundation.ly, *loads.get(foundation.id, no_loads)) for foundation in foundations]
+        results = analyze_foundations(method, data, workers)
+
+        table = governing_table(method)
+        for foundation, (_, _, load_ids, *_), result in zip(foundations, data, results, strict=True):
+            max_stress, max_stress_id, min_percentaje, min_percentaje_id, without_solution = result
+            stress = f"{max_stress:.2f}" if max_stress is not None else "∞" if without_solution else None
+            table.add_row(
+                f"{foundation.id:03}",
+                foundation.name,
+                str(len(load_ids)),
+                stress,
+                str(max_stress_id) if max_stress_id is not None else None,
+                f"{min_percentaje:.0f}%" if min_percentaje is not None else None,
+                str(min_percentaje_id) if min_percentaje_id is not None else None,
+                str(without_solution),
+            )
+    console.print(table)
+
+
 @app.command()
-def flexural_design(foundation_id: int) -> None:
-    """Flexural design of foundation."""
-    from foundations.design import get_ultimate_moments
+def optimize(
+    foundation_id: int,
+    stress_limit: float,
+    min_percentaje: float = 80,
+    lx_min: float = 1.0,
+    lx_max: float = 5.0,
+    ly_min: float = 1.0,
+    ly_max: float = 5.0,
+    lz_min: float = 0.5,
+    lz_max: Optional[float] = None,
+    step: float = 0.1,
+    lz_step: float = 0.1,
+    method: str = "bi-direction",
+    save: bool = False,
+) -> None:
+    """Search the smallest foundation size that satisfies the stress and lift limits.\n
+
+    Candidate sizes are ranked by volume and analyzed in batches against every load of the foundation. Loads at\n
+    the seal level are recomputed for every size. Column, eccentricities and depth are kept.\n
+
+    Args:\n
+        foundation_id (int): The ID of the foundation to resize.\n
+        stress_limit (float): Allowable soil stress (ton/m²).\n
+        min_percentaje (float): Minimum compressed area percentaje. Defaults to 80.\n
+        lx_min, lx_max (float): Bounds of the width in the x direction. Defaults to 1 and 5.\n
+        ly_min, ly_max (float): Bounds of the width in the y direction. Defaults to 1 and 5.\n
+        lz_min, lz_max (float): Bounds of the height. Defaults to 0.5 and the depth of the foundation.\n
+        step (float): Step of the widths. Defaults to 0.1.\n
+        lz_step (float): Step of the height. Defaults to 0.1.\n
+        method (str): Analysis method: 'bi-direction' or 'one-direction'. Defaults to 'bi-direction'.\n
+        save (bool): Update the foundation with the optimal size. Defaults to False.\n
+    """
+    from fastruct.foundations.optimization import (
+        OPTIMIZE_METHODS,
+        candidate_geometries,
+        dimension_range,
+        optimize_foundation,
+    )
+    from fastruct.loads.queries import get_user_load_arrays
+
+    if method not in OPTIMIZE_METHODS:
+        typer.secho(f"Method must be one of: {', '.join(OPTIMIZE_METHODS)}", fg=typer.colors.RED)
+        raise typer.Exit()
 
     with session_scope() as session:
         foundation = session.query(Foundation).filter_by(id=foundation_id).first()
@@ -254,4 +394,74 @@ def flexural_design(foundation_id: int) -> None:
             typer.secho("Foundation not found", fg=typer.colors.RED)
             raise typer.Exit()
 
-        print(get_ultimate_moments(foundation))
+        user_loads = get_user_load_arrays(session, foundation_id)
+        if len(user_loads[0]) == 0:
+            typer.secho("Foundation has no loads", fg=typer.colors.RED)
+            raise typer.Exit()
+
+        candidates = candidate_geometries(
+            dimension_range(lx_min, lx_max, step),
+            dimension_range(ly_min, ly_max, step),
+            dimension_range(lz_min, foundation.depth if lz_max is None else lz_max, lz_step),
+            foundation.depth,
+        )
+        geometry, max_stress, min_lift, evaluated = optimize_foundation(
+            foundation, user_loads, candidates, stress_limit, min_percentaje, method
+        )
+        if geometry is None:
+            typer.secho(
+                f"No size satisfies the limits within the bounds ({evaluated} candidates analyzed)",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit()
+
+        lx, ly, lz = geometry.tolist()
+        print(f"Lx={lx:.2f} Ly={ly:.2f} Lz={lz:.2f} Volume={lx * ly * lz:.3f} m³")
+        print(f"σ max={max_stress:.2f} ton/m², min %={min_lift:.0f}%")
+        print(f"{evaluated} of {len(candidates)} candidates analyzed with every load")
+
+        if save:
+            foundation.lx, foundation.ly, foundation.lz = lx, ly, lz
+            update_loads_at_seal(session, foundation)
+            invalidate_results(session, [foundation.id])
+            print(foundation)
+
+
+@app.command()
+def flexural_design(foundation_id: int, combinations: Optional[str] = None) -> None:
+    """Flexural design of foundation.\n
+
+    Computes the ultimate moments at both sides of the column, by direction, for every load and shows the envelope:\n
+    the maximum moment of every side and the load that governs it.\n
+
+    Args:\n
+        foundation_id (int): The ID of the foundation to design.\n
+        combinations (str): Design for the combinations of the load cases from this table (service or ultimate)\n
+            instead of the stored loads.\n
+    """
+    from fastruct.foundations.design import SIDES, moment_envelope, ultimate_moment_arrays
+
+    with session_scope() as session:
+        with profiling.phase("query"):
+            foundation = session.get(Foundation, foundation_id)
+        if foundation is None:
+            typer.secho("Foundation not found", fg=typer.colors.RED)
+            raise typer.Exit()
+
+        loads = get_analysis_loads(session, foundation, combinations)
+        with profiling.phase("analysis engine"):
+            moments = ultimate_moment_arrays(foundation, loads.p, loads.mx, loads.my)
+            maximum, governing = moment_envelope(moments)
+
+        table = design_table(str(foundation))
+        for side, moment, index in zip(SIDES, maximum.tolist(), governing.tolist(), strict=True):
+            if index < 0:
+                table.add_row(side, None, None, None, None, None, None)
+                continue
+
+            load = loads[index]
+            table.add_row(
+                side, f"{moment:.2f}", f"{index + 1:02}", load.name, f"{load.p:.1f}", f"{load.mx:.1f}", f"{load.my:.1f}"
+            )
+    with profiling.phase("rendering"):
+        console.print(table)
@@ -1,13 +1,19 @@
 """Utility functions for foundations commands."""
-from collections.abc import Iterable
-from typing import Literal
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
 
 import typer
+from sqlalchemy.orm import Session
 
-from fastruct.foundations.analysis.bi_direction import bi_direction_analysis
-from fastruct.foundations.analysis.one_direction import one_direction_analysis
+from fastruct import profiling
+from fastruct.foundations.tables import paginate
 from fastruct.models.foundation import Foundation
 
+if TYPE_CHECKING:
+    from fastruct.loads.loadset import LoadSet
+
 
 def get_max_value(data: list[float | None] | list[tuple[float | None, ...]]) -> float | None:
     """Get the maximum value from a list containing either floats, Nones, or tuples of floats and Nones.
@@ -33,29 +39,217 @@ def get_max_value(data: list[float | None] | list[tuple[float | None, ...]]) ->
 
 
 def stresses_and_percentajes_by_method(
-    foundation: Foundation, method: Literal["bi-directional", "one-direction", "compare"]
+    foundation: Foundation,
+    method: Literal["bi-directional", "one-direction", "compare", "exact"],
+    loads: "LoadSet | None" = None,
 ) -> tuple[
     list[float | None]
     | list[tuple[float | None, float | None]]
     | list[tuple[float | None, float | None, float | None]],
-    list[float] | list[tuple[float, float]] | list[tuple[float, float, float]],
+    list[float | None] | list[tuple[float, float]] | list[tuple[float, float, float]],
+    dict[str, list],
 ]:
-    """Utility funtion for getting stresses and percentajes by method."""
-    bi_stresses, bi_percentajes = bi_direction_analysis(foundation)
-    one_stresses, one_percentajes = one_direction_analysis(foundation)
-    all_stresses = [(s1, s2, s3) for s1, (s2, s3) in zip(bi_stresses, one_stresses, strict=True)]
-    all_percentajes = [(p1, p2, p3) for p1, (p2, p3) in zip(bi_percentajes, one_percentajes, strict=True)]
+    """Utility funtion for getting stresses, percentajes and solver diagnostics by method.
 
-    if method == "bi-direction":
-        stresses, percentajes = bi_stresses, bi_percentajes
+    Only the engine registered for the method runs, over the given loads or the loads of the foundation. The exact
+    method reports the iterations and convergence of its solver by load as diagnostics, the other methods none.
+    """
+    from fastruct.foundations.results import analysis_results
 
-    elif method == "one-direction":
-        stresses, percentajes = one_stresses, one_percentajes
+    try:
+        return analysis_results(foundation, method, loads)
+    except ValueError as error:
+        print(error)
+        raise typer.Exit() from error
 
-    elif method == "compare":
-        stresses, percentajes = all_stresses, all_percentajes
-    else:
-        print(f"Unkwnown method: {method}")
+
+def cached_stresses_and_percentajes(
+    session: Session, foundation: Foundation, method: str, loads: "LoadSet", no_cache: bool = False
+) -> tuple[list[Any], list[Any], dict[str, list]]:
+    """Stresses, percentajes and solver diagnostics of the loads by method, read from the results cache when stored.
+
+    Results computed here are stored for the next analysis of the same loads.
+    """
+    from fastruct.foundations.results import cached_analysis_results
+
+    try:
+        return cached_analysis_results(session, foundation, method, loads, not no_cache)
+    except ValueError as error:
+        print(error)
+        raise typer.Exit() from error
+
+
+def get_analysis_loads(session: Session, foundation: Foundation, combinations: str | None = None) -> "LoadSet":
+    """Stored loads of a foundation, or the combinations of its load cases from a combination table."""
+    from fastruct.foundations.results import analysis_loads
+
+    try:
+        return analysis_loads(session, foundation, combinations)
+    except ValueError as error:
+        print(error)
+        raise typer.Exit() from error
+
+
+def order_results(
+    numbers: Sequence[int],
+    loads: "LoadSet",
+    stresses: Sequence[Any],
+    percentajes: Sequence[Any],
+    diagnostics: dict[str, list],
+    order: str,
+    top: int | None = None,
+) -> tuple[list[int], "LoadSet", list[Any], list[Any], dict[str, list]]:
+    """Sort the results of the loads by stress (desc) or by percentaje (asc), with their solver diagnostics.
+
+    Loads are ranked by the same keys with or without `top`, and loads without solution go first. When `top` is given,
+    only that number of governing loads is selected, without sorting every result.
+    """
+    if order not in ("stress", "percentaje"):
+        typer.secho("Order must be 'stress' or 'percentaje'", fg=typer.colors.RED)
         raise typer.Exit()
 
-    return stresses, percentajes
+    from fastruct.foundations.results import ordered_results
+
+    try:
+        return ordered_results(numbers, loads, stresses, percentajes, diagnostics, order, top)
+    except ValueError as error:
+        print(error)
+        raise typer.Exit() from error
+
+
+def all_results(
+    session: Session,
+    foundation: Foundation,
+    method: str,
+    loads: "LoadSet",
+    prefilter: bool,
+    no_cache: bool,
+    combinations: str | None,
+) -> tuple[list[int], "LoadSet", list, list, dict[str, list]]:
+    """Numbers, loads, stresses, percentajes and solver diagnostics of every load, or of the prefiltered ones."""
+    numbers = list(range(1, len(loads) + 1))
+    if prefilter:
+        if method != "bi-direction":
+            typer.secho("Prefilter is only available for the bi-direction method", fg=typer.colors.RED)
+            raise typer.Exit()
+
+        from fastruct.foundations.analysis.prefilter import prefiltered_bi_direction_analysis
+        from fastruct.foundations.results import count_solver_cases
+
+        with profiling.phase("analysis engine"):
+            kept, stresses, percentajes = prefiltered_bi_direction_analysis(foundation, loads)
+        count_solver_cases(foundation, loads)
+        print(f"{len(loads) - len(kept)} of {len(loads)} loads pruned by the prefilter")
+        return [numbers[i] for i in kept], loads[kept], stresses, percentajes, {}
+
+    if combinations is not None:
+        # Combinations are generated on the fly, so their results are not stored
+        results = stresses_and_percentajes_by_method(foundation, method, loads)  # type: ignore
+    else:
+        results = cached_stresses_and_percentajes(session, foundation, method, loads, no_cache)
+    return numbers, loads, *results
+
+
+def results_by_page(
+    session: Session,
+    foundation: Foundation,
+    method: str,
+    loads: "LoadSet",
+    rows_per_page: int,
+    use_cache: bool = True,
+    store: bool = True,
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Results of the loads in load order, page by page, analyzing the loads of every page only when it is requested.
+
+    Every result is a (number, load, stress, percentaje, diagnostics, max stress) tuple. Results read from the cache
+    highlight the maximum stress of every load, while the ones analyzed by page highlight the maximum stress of their
+    page, since the next pages are not analyzed yet. Results are stored in the cache once every page is analyzed.
+    """
+    from fastruct.foundations.cache import get_cached_results, results_key, store_results
+
+    with profiling.phase("cache"):
+        key = results_key(foundation, method, loads) if use_cache or store else ""
+        cached = get_cached_results(session, foundation.id, method, key) if use_cache else None
+    if cached is not None:
+        yield from paginate(results_with_max(range(1, len(loads) + 1), loads, *cached), rows_per_page)
+        return
+
+    stresses: list[Any] = []
+    percentajes: list[Any] = []
+    diagnostics: dict[str, list] = {}
+    for start in range(0, len(loads), rows_per_page):
+        page = loads[start : start + rows_per_page]
+        results = stresses_and_percentajes_by_method(foundation, method, page)  # type: ignore
+        yield list(results_with_max(range(start + 1, start + len(page) + 1), page, *results))
+
+        stresses.extend(results[0])
+        percentajes.extend(results[1])
+        for name, values in results[2].items():
+            diagnostics.setdefault(name, []).extend(values)
+
+    if store:
+        with profiling.phase("cache"):
+            store_results(session, foundation.id, method, key, stresses, percentajes, diagnostics)
+
+
+def results_with_max(
+    numbers: Iterable[int],
+    loads: "LoadSet",
+    stresses: Sequence[Any],
+    percentajes: Sequence[Any],
+    diagnostics: dict[str, list],
+    max_stress: float | None = None,
+) -> Iterator[tuple[Any, ...]]:
+    """Results of the loads as (number, load, stress, percentaje, diagnostics, max stress) tuples.
+
+    The maximum stress defaults to the one of the given results.
+    """
+    if max_stress is None:
+        max_stress = get_max_value(stresses)  # type: ignore
+    by_load = diagnostics_by_load(diagnostics, len(loads))
+    for number, load, stress, percentaje, diagnostic in zip(
+        numbers, loads, stresses, percentajes, by_load, strict=True
+    ):
+        yield number, load, stress, percentaje, diagnostic, max_stress
+
+
+def diagnostics_by_load(diagnostics: dict[str, list], count: int) -> Iterator[dict[str, Any]]:
+    """Solver diagnostics of every load, as a dictionary from diagnostic name to value."""
+    if not diagnostics:
+        yield from ({} for _ in range(count))
+        return
+
+    for values in zip(*diagnostics.values(), strict=True):
+        yield dict(zip(diagnostics, values, strict=True))
+
+
+def write_results(columns: dict[str, list], export_format: str, output: Path | None) -> None:
+    """Write analysis results to a file, or to the standard output when no file is given.
+
+    Parquet is only written to files and requires the optional `pyarrow` dependency.
+    """
+    from fastruct.foundations.export import EXPORT_FORMATS, export_results, write_parquet
+
+    if export_format not in EXPORT_FORMATS:
+        typer.secho(f"Format must be one of: {', '.join(EXPORT_FORMATS)}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+    if export_format == "parquet":
+        if output is None:
+            typer.secho("Parquet results require an --output file", fg=typer.colors.RED, err=True)
+            raise typer.Exit(1)
+        try:
+            with profiling.phase("rendering"):
+                write_parquet(columns, output)
+        except ImportError as error:
+            typer.secho("Parquet results require pyarrow: pip install fastruct[parquet]", fg=typer.colors.RED, err=True)
+            raise typer.Exit(1) from error
+        return
+
+    with profiling.phase("rendering"):
+        if output is None:
+            export_results(columns, export_format, sys.stdout)
+            return
+
+        with output.open("w", newline="") as stream:
+            export_results(columns, export_format, stream)
@@ -1,16 +1,21 @@
 """Comandos para el módulo cargas."""
 import csv
+import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.table import Table
+from sqlalchemy.orm import selectinload
 
 from fastruct.config_db import session_scope
-from fastruct.loads.queries import is_load_duplicated
+from fastruct.foundations.cache import invalidate_results
+from fastruct.loads.queries import bulk_add_loads
 from fastruct.models.foundation import Foundation
 from fastruct.models.load import Load
+from fastruct.models.load_case import LoadCase
 from fastruct.models.user_load import UserLoad
 
 app = typer.Typer()
@@ -52,33 +57,21 @@ def add(
     }
 
     with session_scope() as session:
-        if not is_load_duplicated(session, user_load_dict):
-            foundation = session.query(Foundation).filter_by(id=foundation_id).first()
-            if foundation is None:
-                print("Foundation not found")
-                raise typer.Exit()
-
-            user_load = UserLoad(**user_load_dict)
-            session.add(user_load)
-            session.flush()
-
-            load = Load(
-                foundation_id=foundation_id,
-                user_load_id=user_load.id,
-                p=p + foundation.weight() + foundation.ground_weight(),
-                vx=vx,
-                vy=vy,
-                mx=mx + vy * foundation.lz + p * foundation.ey,
-                my=my + vx * foundation.lz + p * foundation.ex,
-            )
-            session.add(load)
-            print(f"{user_load.id=}")
+        foundation = session.query(Foundation).filter_by(id=foundation_id).first()
+        if foundation is None:
+            print("Foundation not found")
+            raise typer.Exit()
+
+        user_load_ids = bulk_add_loads(session, [user_load_dict], {foundation_id: foundation})
+        if user_load_ids:
+            invalidate_results(session, [foundation_id])
+            print(f"user_load.id={user_load_ids[0]}")
         else:
             print("Load already exists for foundation.")
 
 
 @app.command()
-def add_from_csv(path: Path) -> None:
+def add_from_csv(path: Path, chunk_size: int = 10_000) -> None:
     """Generate user_loads and loads from a CSV file.\n.
 
     Assumes the CSV file has the following header format:\n
@@ -87,44 +80,99 @@ def add_from_csv(path: Path) -> None:
     Lines starting with '#' will be ignored. The first line is considered\n
     the title and is automatically skipped.\n
 
+    The file is read in chunks and imported in a single transaction. Loads already\n
+    stored for the foundation, or repeated in the file, are skipped.\n
+
     Args:\n
         path (Path): Path to the CSV file.\n
+        chunk_size (int): Rows parsed and inserted at once. Defaults to 10000.\n
     """
     if not path.is_file():
         raise ValueError("Path is not valid.")
 
+    start = time.perf_counter()
+    read, added = 0, 0
+    foundations: dict[int, Foundation] = {}
+    missing_foundations: set[int] = set()
+
+    with session_scope() as session:
+        for chunk in read_csv_chunks(path, chunk_size):
+            new_ids = {load["foundation_id"] for load in chunk} - foundations.keys() - missing_foundations
+            if new_ids:
+                found = session.query(Foundation).filter(Foundation.id.in_(new_ids)).all()
+                foundations.update({foundation.id: foundation for foundation in found})
+                missing_foundations.update(new_ids - foundations.keys())
+
+            user_loads = [user_load for user_load in chunk if user_load["foundation_id"] in foundations]
+            user_load_ids = bulk_add_loads(session, user_loads, foundations)
+            if user_load_ids:
+                invalidate_results(session, {user_load["foundation_id"] for user_load in user_loads})
+            added += len(user_load_ids)
+            read += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"{read} rows read, {added} loads added ({read / elapsed:.0f} rows/s)")
+
+    if missing_foundations:
+        print(f"Foundations not found: {', '.join(map(str, sorted(missing_foundations)))}")
+
+    print(f"File loaded: {added} loads added, {read - added} skipped in {time.perf_counter() - start:.2f}s")
+
+
+def read_csv_chunks(path: Path, chunk_size: int) -> Iterator[list[dict]]:
+    """Read user loads from a CSV file in chunks of at most `chunk_size` rows.
+
+    Args:
+        path (Path): Path to the CSV file.
+        chunk_size (int): Maximum number of rows per chunk.
+
+    Yields:
+        list[dict]: User load values: foundation_id, name, p, vx, vy, mx and my.
+    """
     with open(path, newline="") as csv_file:
         reader = csv.reader(csv_file)
         next(reader)  # Skip title line
+        chunk: list[dict] = []
         for line in reader:
             # Skip empty lines or lines starting with '#'
             if not line or line[0].strip().startswith("#"):
                 continue
 
-            foundation_id = int(line[0])
-            name = str(line[1]) if line[1] else None
-            p = float(line[2])
-            vx = float(line[3])
-            vy = float(line[4])
-            mx = float(line[5])
-            my = float(line[6])
-
-            add(foundation_id, p, vx, vy, mx, my, name)
+            chunk.append(
+                {
+                    "foundation_id": int(line[0]),
+                    "name": str(line[1]) if line[1] else None,
+                    "p": float(line[2]),
+                    "vx": float(line[3]),
+                    "vy": float(line[4]),
+                    "mx": float(line[5]),
+                    "my": float(line[6]),
+                }
+            )
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
 
-    print("File loaded")
+        if chunk:
+            yield chunk
 
 
 @app.command(name="get")
 def get_by_id(foundation_id: int):
     """Display load details for the requested foundation."""
     with session_scope() as session:
-        foundation = session.query(Foundation).filter_by(id=foundation_id).first()
+        foundation = (
+            session.query(Foundation)
+            .options(selectinload(Foundation.loads).joinedload(Load.user_load))
+            .filter_by(id=foundation_id)
+            .first()
+        )
         table = Table("#", "ID", "NAME", "P", "Vx", "Vy", "Mx", "My")
         table.title = str(foundation)
         table.caption = "(value): loads at the f. CG and f. seal level"
         table.show_lines = True
 
-        for i, (user_load, load) in enumerate(zip(foundation.user_loads, foundation.loads, strict=True), start=1):
+        for i, load in enumerate(foundation.loads, start=1):
+            user_load = load.user_load
             row = [
                 f"{i:02}",
                 f"{user_load.id}",
@@ -157,5 +205,120 @@ def delete(user_load_id: int) -> None:
             raise typer.Exit()
 
         session.delete(user_load)
+        invalidate_results(session, [user_load.foundation_id])
 
         print(f"Foundation with ID {user_load_id} has been deleted.")
+
+
+@app.command(name="add-case", context_settings={"ignore_unknown_options": True})
+def add_case(
+    foundation_id: int,
+    kind: str,
+    p: float,
+    vx: float,
+    vy: float,
+    mx: float,
+    my: float,
+    name: Optional[str | None] = None,
+) -> None:
+    """Add a basic load case to a foundation.\n
+
+    Factored combinations of the load cases are generated when analyzing with\n
+    `fastruct f analize --combinations TABLE`, without storing them.\n
+
+    Args:\n
+        foundation_id (int): Foundation's ID to which the load case is applied.\n
+        kind (str): Load kind: dead, live, seismic-x, seismic-y or wind.\n
+        p (float): Vertical force.\n
+        vx (float): Horizontal force in the x direction.\n
+        vy (float): Horizontal force in the y direction.\n
+        mx (float): Moment around the x axis.\n
+        my (float): Moment around the y axis.\n
+        name (str | None): Optional name for the load case. Defaults to None.\n
+    """
+    from fastruct.loads.combinations import LOAD_KINDS
+
+    if kind not in LOAD_KINDS:
+        print(f"Kind must be one of: {', '.join(LOAD_KINDS)}")
+        raise typer.Exit()
+
+    with session_scope() as session:
+        foundation = session.get(Foundation, foundation_id)
+        if foundation is None:
+            print("Foundation not found")
+            raise typer.Exit()
+
+        load_case = LoadCase(foundation=foundation, name=name, kind=kind, p=p, vx=vx, vy=vy, mx=mx, my=my)
+        session.add(load_case)
+        session.flush()
+        print(f"load_case.id={load_case.id}")
+
+
+@app.command()
+def cases(foundation_id: int) -> None:
+    """Display the load cases of a foundation."""
+    with session_scope() as session:
+        foundation = session.get(Foundation, foundation_id)
+        if foundation is None:
+            print("Foundation not found")
+            raise typer.Exit()
+
+        table = Table("ID", "NAME", "KIND", "P", "Vx", "Vy", "Mx", "My")
+        table.title = str(foundation)
+        for load_case in foundation.load_cases:
+            table.add_row(
+                f"{load_case.id}",
+                load_case.name,
+                load_case.kind,
+                *(f"{value:.1f}" for value in (load_case.p, load_case.vx, load_case.vy, load_case.mx, load_case.my)),
+            )
+
+    console.print(table)
+
+
+@app.command()
+def combinations(foundation_id: int, table: str = "ultimate") -> None:
+    """Display the factored combinations of the load cases of a foundation.\n
+
+    Args:\n
+        foundation_id (int): Foundation's ID.\n
+        table (str): Combination table: service or ultimate. Defaults to ultimate.\n
+    """
+    from fastruct.loads.combinations import combine
+    from fastruct.loads.queries import get_load_cases
+
+    with session_scope() as session:
+        foundation = session.get(Foundation, foundation_id)
+        if foundation is None:
+            print("Foundation not found")
+            raise typer.Exit()
+
+        try:
+            names, forces = combine(table, *get_load_cases(session, foundation_id))
+        except ValueError as error:
+            print(error)
+            raise typer.Exit() from error
+
+        rich_table = Table("#", "NAME", "P", "Vx", "Vy", "Mx", "My")
+        rich_table.title = str(foundation)
+        for i, (name, *values) in enumerate(zip(names, *(force.tolist() for force in forces), strict=True), start=1):
+            rich_table.add_row(f"{i:02}", name, *(f"{value:.1f}" for value in values))
+
+    console.print(rich_table)
+
+
+@app.command(name="delete-case")
+def delete_case(load_case_id: int) -> None:
+    """Delete a load case from the database.\n
+
+    Args:\n
+        load_case_id (int): The ID of the load case to delete.
+    """
+    with session_scope() as session:
+        load_case = session.get(LoadCase, load_case_id)
+        if load_case is None:
+            print("Load case not found")
+            raise typer.Exit()
+
+        session.delete(load_case)
+        print(f"Load case with ID {load_case_id} has been deleted.")
@@ -1,32 +1,204 @@
-"""Configuración de la base de datos."""
-from contextlib import contextmanager
+"""Configuración de la base de datos.
+
+Los comandos usan un engine síncrono y la API HTTP un engine asíncrono sobre aiosqlite (`pip install fastruct[api]`),
+ambos con la misma base de datos, perfil y migraciones.
+
+Variables de entorno:
+    FASTRUCT_DATABASE: Ruta del archivo de la base de datos. Por defecto `fastructdb.db` en el directorio de
+        instalación.
+    FASTRUCT_DB_PROFILE: Perfil de configuración de SQLite, una de las llaves de `DATABASE_PROFILES`. Por defecto
+        "performance".
+"""
+import os
+from collections.abc import Callable
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
+from sqlite3 import Connection as SQLiteConnection
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, Engine, create_engine, delete, event, func, inspect, select
 from sqlalchemy.orm import sessionmaker
 
+from fastruct import profiling
+from fastruct.models.analysis_result import AnalysisResult
 from fastruct.models.db import BaseModel
+from fastruct.models.load import Load
+from fastruct.models.load_case import LoadCase
+from fastruct.models.user_load import UserLoad
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
 
 _session_local = None
+_async_session_local = None
+
+# PRAGMAs aplicados a cada conexión según el perfil
+DATABASE_PROFILES: dict[str, dict[str, str | int]] = {
+    # WAL permite lectores concurrentes con un escritor y con synchronous=NORMAL no hay fsync por transacción
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -64_000,  # KiB
+        "mmap_size": 268_435_456,  # 256 MiB
+        "temp_store": "MEMORY",
+        "busy_timeout": 5_000,  # ms
+        "foreign_keys": "ON",
+    },
+    "safe": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5_000,
+        "foreign_keys": "ON",
+    },
+}
+DEFAULT_PROFILE = "performance"
+
+
+def create_schema(connection: Connection) -> None:
+    """Crea las tablas que no existen."""
+    BaseModel.metadata.create_all(bind=connection)
+
+
+def create_load_key_index(connection: Connection) -> None:
+    """Crea el índice único de cargas en bases de datos anteriores a él.
+
+    Antes se eliminan las cargas repetidas de cada fundación, junto con sus cargas al nivel de sello, conservando la
+    primera que se ingresó.
+    """
+    key = (UserLoad.foundation_id, UserLoad.p, UserLoad.vx, UserLoad.vy, UserLoad.mx, UserLoad.my)
+    duplicated = select(UserLoad.id).where(UserLoad.id.not_in(select(func.min(UserLoad.id)).group_by(*key)))
+    connection.execute(delete(Load).where(Load.user_load_id.in_(duplicated)))
+    connection.execute(delete(UserLoad).where(UserLoad.id.in_(duplicated)))
+    for index in UserLoad.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def create_analysis_results(connection: Connection) -> None:
+    """Crea la tabla de resultados de análisis en bases de datos anteriores a ella."""
+    AnalysisResult.__table__.create(bind=connection, checkfirst=True)
+
+
+def create_load_cases(connection: Connection) -> None:
+    """Crea la tabla de casos de carga en bases de datos anteriores a ella."""
+    LoadCase.__table__.create(bind=connection, checkfirst=True)
+
+
+def create_load_foreign_key_indexes(connection: Connection) -> None:
+    """Crea los índices de las llaves foráneas de cargas, usados por sus consultas y borrados en cascada."""
+    for index in Load.__table__.indexes:
+        index.create(bind=connection, checkfirst=True)
+
+
+def add_analysis_diagnostics(connection: Connection) -> None:
+    """Agrega los diagnósticos a los resultados de análisis guardados.
+
+    Se borran los resultados del método exacto anteriores, que guardaban las iteraciones junto a los porcentajes.
+    """
+    columns = {column["name"] for column in inspect(connection).get_columns("analysis_results")}
+    if "diagnostics" not in columns:
+        connection.exec_driver_sql("ALTER TABLE analysis_results ADD COLUMN diagnostics JSON")
+    connection.exec_driver_sql("DELETE FROM analysis_results WHERE method = 'exact'")
+
+
+# Migración que lleva la base de datos a cada versión del esquema, guardada en `PRAGMA user_version`
+MIGRATIONS: dict[int, Callable[[Connection], None]] = {
+    1: create_schema,
+    2: create_load_key_index,
+    3: create_analysis_results,
+    4: create_load_cases,
+    5: create_load_foreign_key_indexes,
+    6: add_analysis_diagnostics,
+}
+SCHEMA_VERSION = max(MIGRATIONS)
 
 
 def config_database():
     """Configuración de base de datos."""
     global _session_local  # noqa: PLW0603
-    current_file_path = Path(__file__).resolve()
-    installation_directory = current_file_path.parent
-    # database_url = f"sqlite:///{Path.cwd() / 'fundaciones.db'}"
-    database_url = f"sqlite:///{installation_directory / 'fastructdb.db'}"
-    engine = create_engine(database_url)
-    _session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    BaseModel.metadata.create_all(bind=engine)
+    with profiling.phase("db config"):
+        engine = create_engine(f"sqlite:///{database_path()}")
+        apply_profile(engine, os.environ.get("FASTRUCT_DB_PROFILE", DEFAULT_PROFILE))
+        _session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        with engine.begin() as connection:
+            migrate(connection)
+
+
+async def config_async_database():
+    """Configuración de la base de datos asíncrona de la API."""
+    global _async_session_local  # noqa: PLW0603
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path()}")
+    apply_profile(engine.sync_engine, os.environ.get("FASTRUCT_DB_PROFILE", DEFAULT_PROFILE))
+    # Sin expirar al hacer commit, así los modelos se serializan sin volver a consultar la base de datos
+    _async_session_local = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    async with engine.begin() as connection:
+        await connection.run_sync(migrate)
+
+
+async def close_async_database() -> None:
+    """Cierra las conexiones de la base de datos asíncrona."""
+    global _async_session_local  # noqa: PLW0603
+    if _async_session_local is not None:
+        await _async_session_local.kw["bind"].dispose()
+        _async_session_local = None
+
+
+def database_path() -> Path:
+    """Ruta del archivo de la base de datos."""
+    installation_directory = Path(__file__).resolve().parent
+    return Path(os.environ.get("FASTRUCT_DATABASE", installation_directory / "fastructdb.db"))
+
+
+def apply_profile(engine: Engine, profile: str) -> None:
+    """Aplica los PRAGMAs de un perfil a cada nueva conexión del engine.
+
+    Args:
+        engine (Engine): Engine de SQLite.
+        profile (str): Nombre del perfil en `DATABASE_PROFILES`.
+    """
+    if profile not in DATABASE_PROFILES:
+        raise ValueError(f"Perfil de base de datos desconocido: {profile}. Opciones: {', '.join(DATABASE_PROFILES)}")
+
+    pragmas = DATABASE_PROFILES[profile]
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection: SQLiteConnection, _: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+
+def migrate(connection: Connection) -> int:
+    """Aplica las migraciones pendientes según la versión del esquema guardada en la base de datos.
+
+    Si el esquema está al día solo se lee `PRAGMA user_version`.
+
+    Args:
+        connection (Connection): Conexión a la base de datos.
+
+    Returns:
+        int: Versión del esquema antes de migrar.
+    """
+    version = connection.exec_driver_sql("PRAGMA user_version").scalar_one()
+    if version >= SCHEMA_VERSION:
+        return version
+
+    for target in range(version + 1, SCHEMA_VERSION + 1):
+        MIGRATIONS[target](connection)
+    connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return version
 
 
 def get_session_local() -> sessionmaker:
-    """Obtener la sesión de la base de datos."""
+    """Obtener la sesión de la base de datos.
+
+    La base de datos se configura la primera vez que se necesita, así los comandos que no la usan no la crean.
+    """
     if _session_local is None:
-        raise ValueError("_session_local es None")
-    return _session_local
+        config_database()
+    return _session_local  # type: ignore
 
 
 @contextmanager
@@ -41,3 +213,24 @@ def session_scope():
         raise
     finally:
         session.close()
+
+
+async def get_async_session_local() -> "async_sessionmaker":
+    """Obtener la sesión asíncrona de la base de datos, configurándola la primera vez que se necesita."""
+    if _async_session_local is None:
+        await config_async_database()
+    return _async_session_local  # type: ignore
+
+
+@asynccontextmanager
+async def async_session_scope():
+    """Proporciona una sesión asíncrona transaccional en torno a una serie de operaciones."""
+    session = (await get_async_session_local())()
+    try:
+        yield session
+        await session.commit()
+    except:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
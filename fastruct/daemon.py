@@ -0,0 +1,188 @@
+"""Daemon that keeps fastruct loaded and runs the commands forwarded by the command line client.
+
+`fastruct serve` imports the libraries and analysis modules and configures the database once, then listens on a Unix
+socket. Every forwarded command runs in a process forked from the daemon, so it starts with everything already
+imported, and it runs over the standard streams of the client, received as file descriptors. Commands are isolated
+from each other and from the daemon as if they ran in their own process.
+
+Command modules are imported in the forked processes, since their Rich consoles detect the terminal of the client when
+they are created. Forked processes open their own database connections.
+"""
+import json
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+from importlib import import_module
+from pathlib import Path
+
+from fastruct.client import daemon_supported, trusted_directory
+
+# Modules imported by the daemon, shared by every forwarded command
+WARM_MODULES = (
+    "click",
+    "typer",
+    "rich.console",
+    "rich.table",
+    "sqlalchemy",
+    "sqlalchemy.orm",
+    "numpy",
+    "fastruct.__main__",
+    "fastruct.config_db",
+    "fastruct.models",
+    "fastruct.loads.combinations",
+    "fastruct.loads.queries",
+    "fastruct.foundations.analysis.methods",
+    "fastruct.foundations.analysis.prefilter",
+    "fastruct.foundations.cache",
+    "fastruct.foundations.design",
+    "fastruct.foundations.export",
+    "fastruct.foundations.ranking",
+)
+
+# Database settings of the daemon, reused by the commands forwarded with the same ones
+DATABASE_VARIABLES = ("FASTRUCT_DATABASE", "FASTRUCT_DB_PROFILE")
+
+
+def warm_up() -> None:
+    """Import the shared modules, register the analysis engines and configure the database."""
+    for module in WARM_MODULES:
+        import_module(module)
+
+    from fastruct.config_db import get_session_local
+    from fastruct.foundations.analysis.methods import load_engines
+
+    load_engines()
+    # The engine is configured and migrated here, but its connections can't be shared with the forked processes
+    get_session_local().kw["bind"].dispose()
+
+
+def serve(path: Path) -> None:
+    """Listen on a Unix socket and run every forwarded command in a forked process until stopped.
+
+    Raises:
+        RuntimeError: When the platform doesn't support the daemon, the directory of the socket can be written by other
+            users or another daemon listens on the socket.
+    """
+    if not daemon_supported():
+        raise RuntimeError("The daemon requires Unix sockets and fork.")
+
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not trusted_directory(path.parent):
+        raise RuntimeError(f"Other users can write to {path.parent}, choose another socket path.")
+
+    remove_stale_socket(path)
+    warm_up()
+    server = listen(path)
+
+    # Finished commands are reaped by the system, and SIGTERM stops the daemon as Ctrl-C does
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    print(f"fastruct daemon listening on {path}", file=sys.stderr)
+    try:
+        while True:
+            connection, _ = server.accept()
+            if os.fork() == 0:
+                server.close()
+                run_forwarded(connection)
+            connection.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def remove_stale_socket(path: Path) -> None:
+    """Remove the socket of a daemon that didn't stop cleanly.
+
+    Raises:
+        RuntimeError: When a daemon is listening on the socket.
+    """
+    if not path.exists():
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+    else:
+        raise RuntimeError(f"A fastruct daemon is already listening on {path}.")
+    finally:
+        probe.close()
+
+
+def listen(path: Path) -> socket.socket:
+    """Unix socket listening on a path that only the owner can connect to."""
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(umask)
+    server.listen()
+    return server
+
+
+def run_forwarded(connection: socket.socket) -> None:
+    """Run a forwarded command in a forked process and exit with its exit code. Never returns."""
+    code = 1
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        _, fds, _, _ = socket.recv_fds(connection, 1, 3)
+        request = json.loads(connection.makefile("rb").readline())
+        attach_streams(fds)
+        connection.sendall(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+        code = run_command(request["argv"], request["cwd"], request["env"])
+        sys.stdout.flush()
+        sys.stderr.flush()
+        connection.sendall(json.dumps({"exit": code}).encode() + b"\n")
+    except BaseException:  # noqa: B036
+        traceback.print_exc()
+    finally:
+        os._exit(code)
+
+
+def attach_streams(fds: list[int]) -> None:
+    """Replace the standard streams by the ones of the client."""
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    sys.stdin = open(0, closefd=False)  # noqa: SIM115
+    sys.stdout = open(1, "w", buffering=1 if os.isatty(1) else -1, closefd=False)  # noqa: SIM115
+    sys.stderr = open(2, "w", buffering=1, errors="backslashreplace", closefd=False)  # noqa: SIM115
+
+
+def run_command(argv: list[str], cwd: str, env: dict[str, str]) -> int:
+    """Run a command of the command line application in the directory and environment of the client.
+
+    Returns:
+        int: Exit code of the command.
+    """
+    from fastruct import __main__, config_db
+
+    same_database = all(os.environ.get(name) == env.get(name) for name in DATABASE_VARIABLES)
+    os.chdir(cwd)
+    os.environ.clear()
+    os.environ.update(env)
+    if not same_database:
+        config_db._session_local = None
+
+    __main__.STARTED = time.perf_counter()
+    try:
+        __main__.app(args=argv, prog_name="fastruct")
+    except SystemExit as error:
+        if error.code is None or isinstance(error.code, int):
+            return error.code or 0
+        print(error.code, file=sys.stderr)
+        return 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
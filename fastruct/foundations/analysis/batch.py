@@ -0,0 +1,100 @@
+"""Foundations batch analysis.
+
+Governing results for many foundations at once, spread across worker processes.
+"""
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from .exact import exact_arrays
+from .vectorized import bi_direction_arrays, one_direction_arrays
+
+BATCH_METHODS = ("bi-direction", "one-direction", "exact")
+
+
+def analyze_foundations(
+    method: str,
+    foundations: Sequence[tuple[float, float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]],
+    workers: int | None = None,
+) -> list[tuple[float | None, int | None, float | None, int | None, int]]:
+    """Governing results for every foundation.
+
+    Args:
+        method (str): Analysis method, one of `BATCH_METHODS`.
+        foundations (Sequence): Foundation geometry and loads as `(lx, ly, load_ids, p, mx, my)`.
+        workers (int | None, optional): Number of worker processes. Analyze in the current process when 1.
+            Defaults to the number of CPUs.
+
+    Returns:
+        list: The `governing_results` of every foundation, in the same order.
+    """
+    if method not in BATCH_METHODS:
+        raise ValueError(f"Unkwnown method: {method}")
+
+    if workers == 1 or len(foundations) <= 1:
+        return [governing_results(method, *foundation) for foundation in foundations]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(foundations) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        columns = zip(*foundations, strict=True)
+        return list(executor.map(governing_results, repeat(method), *columns, chunksize=chunksize))
+
+
+def governing_results(
+    method: str, lx: float, ly: float, load_ids: np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray
+) -> tuple[float | None, int | None, float | None, int | None, int]:
+    """Maximum stress and minimum compressed percentaje over all the loads of a foundation.
+
+    Args:
+        method (str): Analysis method, one of `BATCH_METHODS`.
+        lx (float): Width of the foundation in the x direction.
+        ly (float): Width of the foundation in the y direction.
+        load_ids (np.ndarray): IDs of the loads.
+        p (np.ndarray): Axial forces.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+
+    Returns:
+        tuple: Maximum stress and the ID of its load, minimum percentaje and the ID of its load, and the number of
+            loads without solution. Values are None when the foundation has no loads.
+    """
+    stresses, percentajes = governing_arrays(method, lx, ly, p, mx, my)
+    without_solution = int(np.isnan(stresses).sum())
+
+    max_stress, max_stress_id = None, None
+    if without_solution < len(stresses):
+        index = int(np.nanargmax(stresses))
+        max_stress, max_stress_id = float(stresses[index]), int(load_ids[index])
+
+    min_percentaje, min_percentaje_id = None, None
+    if not np.isnan(percentajes).all():
+        index = int(np.nanargmin(percentajes))
+        min_percentaje, min_percentaje_id = float(percentajes[index]), int(load_ids[index])
+
+    return max_stress, max_stress_id, min_percentaje, min_percentaje_id, without_solution
+
+
+def governing_arrays(
+    method: str, lx: float | np.ndarray, ly: float | np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stress and compressed percentaje of every load, reduced to a single value per load.
+
+    The one-direction method keeps the worst of both directions, with NaN when any direction has no solution. The
+    bi-direction and one-direction methods broadcast the geometry against the loads.
+    """
+    if method == "bi-direction":
+        return bi_direction_arrays(lx, ly, p, mx, my)
+
+    elif method == "one-direction":
+        stresses, percentajes = one_direction_arrays(lx, ly, p, mx, my)
+        return np.maximum(stresses[..., 0], stresses[..., 2]), percentajes.min(axis=-1)
+
+    elif method == "exact":
+        stresses, percentajes, _ = exact_arrays(lx, ly, p, mx, my)
+        return stresses, percentajes
+
+    raise ValueError(f"Unkwnown method: {method}")
@@ -1,16 +1,29 @@
 """Foundations bi direction analysis."""
 from collections import OrderedDict
 from math import sqrt
+from typing import TYPE_CHECKING
 
-from shapely.geometry import LineString, Polygon
-
+from fastruct.loads.loadset import LoadSet
 from fastruct.models.foundation import Foundation
 from fastruct.models.load import Load
 
+if TYPE_CHECKING:
+    from shapely.geometry import LineString, Polygon
+
 
-def bi_direction_analysis(foundation: Foundation) -> tuple[list[float | None], list[float]]:
-    """Returns maximun stresses and support percentaje by directions x and y."""
-    results = [get_bi_directional_percentaje_and_stress(foundation, load) for load in foundation.loads]
+def bi_direction_analysis(
+    foundation: Foundation, loads: LoadSet | None = None, use_shapely: bool = False
+) -> tuple[list[float | None], list[float]]:
+    """Returns maximun stresses and support percentaje by directions x and y.
+
+    Args:
+        foundation (Foundation): The foundation to analyze.
+        loads (LoadSet | None, optional): Loads to analyze. Defaults to the loads of the foundation.
+        use_shapely (bool, optional): Compute the compressed area with shapely geometries instead of the analytic
+            solver. Slower, meant as a cross-check. Defaults to False.
+    """
+    loads = foundation.loads if loads is None else loads  # type: ignore
+    results = [get_bi_directional_percentaje_and_stress(foundation, load, use_shapely) for load in loads]
     stresses = [stress for stress, _ in results]
     percentajes = [percentaje for _, percentaje in results]
 
@@ -27,13 +40,13 @@ def calculate_bi_directional_stress(
     return axial / area + abs(moment_x) * ly / 2 / inertia_x + abs(moment_y) * lx / 2 / inertia_y
 
 
-def get_bi_directional_percentaje_and_stress(foundation: Foundation, load: Load) -> tuple[float | None, float]:
+def get_bi_directional_percentaje_and_stress(
+    foundation: Foundation, load: Load, use_shapely: bool = False
+) -> tuple[float | None, float]:
     """Lifting percentaje on the foundation due to combined axial and moment forces in both orthogonal directions."""
-    neutral_axis = get_neutral_axis(foundation, load)
-    foundation_polygon = get_foundation_xy_polygon(foundation.lx, foundation.ly)
     ex, ey = compute_excentrycity(load.p, load.mx, load.my)
 
-    if neutral_axis is None:
+    if ex == 0 and ey == 0:
         return calculate_bi_directional_stress(load.p, load.mx, load.my, foundation.lx, foundation.ly), 100
 
     if abs(ex) >= foundation.lx / 2 or abs(ey) >= foundation.ly / 2:
@@ -42,7 +55,82 @@ def get_bi_directional_percentaje_and_stress(foundation: Foundation, load: Load)
     elif abs(ex) <= foundation.lx / 6 and abs(ey) <= foundation.ly / 6:
         return calculate_bi_directional_stress(load.p, load.mx, load.my, foundation.lx, foundation.ly), 100
 
-    if not neutral_axis.intersects(foundation_polygon):
+    rx, ry = foundation.ly / sqrt(12), foundation.lx / sqrt(12)
+    if use_shapely:
+        compressed_area = get_compressed_area_with_shapely(foundation, load)
+    else:
+        compressed_area, _ = compressed_area_and_centroid(foundation.lx, foundation.ly, 1, ex / ry**2, ey / rx**2)
+
+    if ex == 0:
+        estimated_lx = foundation.lx
+    elif ey == 0:
+        estimated_lx = foundation.lx / 2 + abs(ry**2 / ex)
+    else:
+        estimated_lx = min(sqrt(abs(compressed_area * ey / ex)), foundation.lx)
+
+    estimated_ly = compressed_area / estimated_lx
+
+    if estimated_ly > foundation.ly:
+        estimated_ly = foundation.ly
+        estimated_lx = compressed_area / estimated_ly
+
+    return (
+        calculate_bi_directional_stress(load.p, load.mx, load.my, estimated_lx, estimated_ly),
+        100 * compressed_area / foundation.area(),
+    )
+
+
+def compressed_area_and_centroid(
+    lx: float, ly: float, a: float, b: float, c: float
+) -> tuple[float, tuple[float, float] | None]:
+    """Area and centroid of the part of the foundation where `a + b * x + c * y >= 0`.
+
+    The foundation's rectangle, centered at the origin, is clipped against the half-plane and the resulting polygon
+    properties are computed with the shoelace formula. No geometry objects are built.
+
+    Args:
+        lx (float): Width of the foundation in the x direction.
+        ly (float): Width of the foundation in the y direction.
+        a (float): Independent term of the line.
+        b (float): Coefficient of x.
+        c (float): Coefficient of y.
+
+    Returns:
+        tuple[float, tuple[float, float] | None]: The compressed area and its centroid, None if the area is zero.
+    """
+    corners = [(-lx / 2, -ly / 2), (lx / 2, -ly / 2), (lx / 2, ly / 2), (-lx / 2, ly / 2)]
+    polygon = []
+    for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1], strict=True):
+        value_1, value_2 = a + b * x1 + c * y1, a + b * x2 + c * y2
+        if value_1 >= 0:
+            polygon.append((x1, y1))
+        if (value_1 >= 0) != (value_2 >= 0):
+            t = value_1 / (value_1 - value_2)
+            polygon.append((x1 + t * (x2 - x1), y1 + t * (y2 - y1)))
+
+    area, moment_x, moment_y = 0.0, 0.0, 0.0
+    for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1], strict=True):
+        cross = x1 * y2 - x2 * y1
+        area += cross / 2
+        moment_x += (x1 + x2) * cross / 6
+        moment_y += (y1 + y2) * cross / 6
+
+    if area <= 0:
+        return 0.0, None
+
+    return area, (moment_x / area, moment_y / area)
+
+
+def get_compressed_area_with_shapely(foundation: Foundation, load: Load) -> float:
+    """Compressed area of the foundation computed with shapely geometries.
+
+    Requires the optional `shapely` dependency.
+    """
+    from shapely.geometry import Polygon
+
+    neutral_axis = get_neutral_axis(foundation, load)
+    foundation_polygon = get_foundation_xy_polygon(foundation.lx, foundation.ly)
+    if neutral_axis is None or not neutral_axis.intersects(foundation_polygon):
         raise ValueError("neutral axis does not intersect poligon")
 
     polygons = foundation_polygon.difference(neutral_axis.intersection(foundation_polygon).buffer(1e-9))
@@ -57,26 +145,10 @@ def get_bi_directional_percentaje_and_stress(foundation: Foundation, load: Load)
     if polygon_in_compresion is None:
         raise ValueError("The is no compressed area")
 
-    if ex == 0:
-        estimated_lx = foundation.lx
-    elif ey == 0:
-        estimated_lx = foundation.lx / 2 + abs(neutral_axis.xy[0][0])
-    else:
-        estimated_lx = min(sqrt(abs(polygon_in_compresion.area * ey / ex)), foundation.lx)
+    return polygon_in_compresion.area
 
-    estimated_ly = polygon_in_compresion.area / estimated_lx
 
-    if estimated_ly > foundation.ly:
-        estimated_ly = foundation.ly
-        estimated_lx = polygon_in_compresion.area / estimated_ly
-
-    return (
-        calculate_bi_directional_stress(load.p, load.mx, load.my, estimated_lx, estimated_ly),
-        100 * polygon_in_compresion.area / foundation_polygon.area,
-    )
-
-
-def is_in_compresion(foundation: Foundation, load: Load, polygon: Polygon) -> bool:
+def is_in_compresion(foundation: Foundation, load: Load, polygon: "Polygon") -> bool:
     """Determine if the foundation is entirely under compressive stress.
 
     This function evaluates the stress state over the exterior points of a polygon
@@ -109,7 +181,7 @@ def is_in_compresion(foundation: Foundation, load: Load, polygon: Polygon) -> bo
     return max_stress >= 0
 
 
-def get_foundation_xy_polygon(width: float, height: float) -> Polygon:
+def get_foundation_xy_polygon(width: float, height: float) -> "Polygon":
     """Generate a Polygon object representing a foundation in the XY plane.
 
     This function creates a Polygon object based on the width and height
@@ -129,6 +201,8 @@ def get_foundation_xy_polygon(width: float, height: float) -> Polygon:
         - The function assumes that the foundation is rectangular.
         - The foundation's centroid is at the origin (0, 0).
     """
+    from shapely.geometry import Polygon
+
     coordinates = (
         (-width / 2, -height / 2),
         (width / 2, -height / 2),
@@ -138,7 +212,7 @@ def get_foundation_xy_polygon(width: float, height: float) -> Polygon:
     return Polygon(coordinates)
 
 
-def get_neutral_axis(foundation: Foundation, load: Load) -> LineString | None:
+def get_neutral_axis(foundation: Foundation, load: Load) -> "LineString | None":
     """Calculate the neutral axis of the foundation under a given load.
 
     The function computes the equation of the neutral axis based on the
@@ -158,6 +232,8 @@ def get_neutral_axis(foundation: Foundation, load: Load) -> LineString | None:
         - The equation of the line is derived based on the neutral axis formula considering
           bending moments and axial force.
     """
+    from shapely.geometry import LineString
+
     rx, ry = foundation.ly / sqrt(12), foundation.lx / sqrt(12)
     ex, ey = compute_excentrycity(load.p, load.mx, load.my)
 
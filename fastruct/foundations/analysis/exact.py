@@ -0,0 +1,164 @@
+"""Foundations exact contact pressure analysis.
+
+Soil pressure is a linear function `σ = a + b * x + c * y` over the compressed zone of the foundation and zero
+elsewhere (no tension). The plane (a, b, c) is found so that the resultant of the pressures balances the axial force
+and both moments exactly, iterating over all the loads at once.
+"""
+import numpy as np
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+
+from .methods import register, register_diagnostics
+from .vectorized import clipped_boundary, excentricity_arrays, loads_as_arrays, nan_to_none
+
+TOLERANCE = 1e-8
+MAX_ITERATIONS = 200
+
+
+@register("exact")
+def exact_analysis(
+    foundation: Foundation, loads: LoadSet | None = None
+) -> tuple[list[float | None], list[float | None]]:
+    """Returns maximun stresses and support percentajes, None for the loads the solver did not converge for.
+
+    The loads of the foundation are analyzed unless a load set is given.
+    """
+    stresses, percentajes, _ = exact_results(foundation, loads)
+    return stresses, percentajes
+
+
+@register_diagnostics("exact")
+def exact_results(
+    foundation: Foundation, loads: LoadSet | None = None
+) -> tuple[list[float | None], list[float | None], dict[str, list]]:
+    """Returns the results of `exact_analysis` with the solver iterations and convergence of every load."""
+    p, mx, my = loads_as_arrays(foundation.loads if loads is None else loads)
+    stresses, percentajes, iterations = exact_arrays(foundation.lx, foundation.ly, p, mx, my)
+    converged = ~np.isnan(percentajes)
+    diagnostics = {"iterations": iterations.tolist(), "converged": converged.tolist()}
+    return nan_to_none(stresses), nan_to_none(percentajes), diagnostics
+
+
+def exact_arrays(
+    lx: float,
+    ly: float,
+    p: np.ndarray,
+    mx: np.ndarray,
+    my: np.ndarray,
+    tolerance: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Exact maximum stress and compressed area percentaje for every load.
+
+    Args:
+        lx (float): Width of the foundation in the x direction.
+        ly (float): Width of the foundation in the y direction.
+        p (np.ndarray): Axial forces.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+        tolerance (float, optional): Relative change of the pressure plane to stop iterating. Defaults to 1e-8.
+        max_iterations (int, optional): Maximum number of Newton iterations. Defaults to 200.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Stresses (NaN when there is no equilibrium or the solver did not
+            converge), compressed area percentajes (NaN when the solver did not converge) and iterations used by every
+            load.
+    """
+    planes, compressed_area, iterations = pressure_planes(lx, ly, p, mx, my, tolerance, max_iterations)
+    a, b, c = np.moveaxis(planes, -1, 0)
+    stresses = a + np.abs(b) * lx / 2 + np.abs(c) * ly / 2
+    return stresses, 100 * compressed_area / (lx * ly), iterations
+
+
+def pressure_planes(
+    lx: float,
+    ly: float,
+    p: np.ndarray,
+    mx: np.ndarray,
+    my: np.ndarray,
+    tolerance: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solve the pressure plane (a, b, c) that balances every load.
+
+    Pressures inside the compressed zone integrate to `J(θ) @ θ`, where θ = (a, b, c) and J is the matrix of area
+    moments (A, Sx, Sy, Ixx, Ixy, Iyy) of the zone. Pressures vanish on the neutral axis, so J is also the Jacobian of
+    the equilibrium equations and every Newton step reduces to `θ = J(θ)⁻¹ @ (P, P·ex, P·ey)`.
+
+    The iteration is warm-started from the elastic distribution over the whole foundation, whose neutral axis is the
+    one used by the bi-direction method. Loads inside the kern converge in the first iteration. Only loads that have
+    not converged are updated on every pass.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Pressure planes with shape `(..., 3)` (NaN when there is no
+            equilibrium or the solver did not converge), compressed areas (0 without equilibrium and NaN when the
+            solver did not converge) and iterations used by every load.
+    """
+    p, mx, my = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (p, mx, my)))
+    area = lx * ly
+    ry2, rx2 = lx**2 / 12, ly**2 / 12
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ex, ey = excentricity_arrays(p, mx, my)
+    solvable = (p > 0) & (np.abs(ex) < lx / 2) & (np.abs(ey) < ly / 2)
+
+    target = np.stack([p, my, -np.abs(mx)], axis=-1)[solvable]
+    theta = target / np.array([area, area * ry2, area * rx2])
+    iterations = np.zeros(len(theta), dtype=np.int64)
+    converged = np.zeros(len(theta), dtype=bool)
+    diverged = np.zeros(len(theta), dtype=bool)
+    compressed_area = np.zeros(len(theta))
+
+    for _ in range(max_iterations):
+        active = np.flatnonzero(~(converged | diverged))
+        if active.size == 0:
+            break
+
+        moments = compressed_zone_moments(lx, ly, *theta[active].T)
+        singular = ~(np.abs(np.linalg.det(moments)) > 0)
+        diverged[active[singular]] = True
+        active, moments = active[~singular], moments[~singular]
+
+        new_theta = np.linalg.solve(moments, target[active][..., None])[..., 0]
+        change = np.abs(new_theta - theta[active]).max(axis=-1)
+        scale = np.abs(new_theta[:, 0]) + np.abs(new_theta[:, 1]) * lx / 2 + np.abs(new_theta[:, 2]) * ly / 2
+        theta[active] = new_theta
+        compressed_area[active] = moments[:, 0, 0]
+        iterations[active] += 1
+        converged[active] = change <= tolerance * scale
+
+    all_planes = np.full((*p.shape, 3), np.nan)
+    all_areas = np.zeros(p.shape)
+    all_iterations = np.zeros(p.shape, dtype=np.int64)
+    all_planes[solvable] = np.where(converged[:, None], theta, np.nan)
+    all_areas[solvable] = np.where(converged, compressed_area, np.nan)
+    all_iterations[solvable] = iterations
+
+    return all_planes, all_areas, all_iterations
+
+
+def compressed_zone_moments(lx: float, ly: float, a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Matrix of area moments of the part of the foundation where `a + b * x + c * y >= 0`.
+
+    Returns:
+        np.ndarray: Symmetric matrices `[[A, Sx, Sy], [Sx, Ixx, Ixy], [Sy, Ixy, Iyy]]` with shape `(..., 3, 3)`, where
+            `Sx = ∫x dA`, `Ixx = ∫x² dA` and `Ixy = ∫xy dA` over the compressed zone.
+    """
+    x1, y1, x2, y2 = clipped_boundary(lx, ly, a, b, c)
+    cross = x1 * y2 - x2 * y1
+    area = cross.sum(axis=-1) / 2
+    first_x = ((x1 + x2) * cross).sum(axis=-1) / 6
+    first_y = ((y1 + y2) * cross).sum(axis=-1) / 6
+    second_x = ((x1**2 + x1 * x2 + x2**2) * cross).sum(axis=-1) / 12
+    second_y = ((y1**2 + y1 * y2 + y2**2) * cross).sum(axis=-1) / 12
+    product = ((x1 * y2 + 2 * x1 * y1 + 2 * x2 * y2 + x2 * y1) * cross).sum(axis=-1) / 24
+
+    return np.stack(
+        [
+            np.stack([area, first_x, first_y], axis=-1),
+            np.stack([first_x, second_x, product], axis=-1),
+            np.stack([first_y, product, second_y], axis=-1),
+        ],
+        axis=-2,
+    )
@@ -0,0 +1,108 @@
+"""Foundations analysis methods registry.
+
+Every analysis method is an engine that takes a foundation, and optionally a `LoadSet` with the loads to analyze, and
+returns its stresses and percentajes by load. Engines register themselves under a method name with the `register`
+decorator, and only the requested engine runs.
+
+Iterative methods also register, with `register_diagnostics`, a variant of their engine that returns the solver
+diagnostics by load next to the results, such as the iterations used, so they are not mixed with the results.
+"""
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+
+AnalysisMethod = Callable[..., tuple[list[Any], list[Any]]]
+
+DiagnosedMethod = Callable[..., tuple[list[Any], list[Any], dict[str, list]]]
+
+METHODS: dict[str, AnalysisMethod] = {}
+DIAGNOSED_METHODS: dict[str, DiagnosedMethod] = {}
+
+# Modules whose engines register themselves when imported
+ENGINE_MODULES = (
+    "fastruct.foundations.analysis.vectorized",
+    "fastruct.foundations.analysis.exact",
+)
+
+
+def register(name: str) -> Callable[[AnalysisMethod], AnalysisMethod]:
+    """Register the decorated function as the engine of an analysis method.
+
+    Args:
+        name (str): Method name, as given to the `--method` option.
+    """
+
+    def decorator(engine: AnalysisMethod) -> AnalysisMethod:
+        METHODS[name] = engine
+        return engine
+
+    return decorator
+
+
+def register_diagnostics(name: str) -> Callable[[DiagnosedMethod], DiagnosedMethod]:
+    """Register the decorated function as the engine of a method that also returns its diagnostics by load.
+
+    Args:
+        name (str): Method name, already registered with `register`.
+    """
+
+    def decorator(engine: DiagnosedMethod) -> DiagnosedMethod:
+        DIAGNOSED_METHODS[name] = engine
+        return engine
+
+    return decorator
+
+
+def get_method(name: str) -> AnalysisMethod:
+    """Engine registered for an analysis method.
+
+    Raises:
+        ValueError: When no engine is registered with that name.
+    """
+    load_engines()
+    if name not in METHODS:
+        raise ValueError(f"Unkwnown method: {name}")
+    return METHODS[name]
+
+
+def get_diagnosed_method(name: str) -> DiagnosedMethod:
+    """Engine of an analysis method that returns its stresses, percentajes and diagnostics by load.
+
+    Methods without diagnostics return an empty dictionary of them.
+
+    Raises:
+        ValueError: When no engine is registered with that name.
+    """
+    engine = get_method(name)
+    if name in DIAGNOSED_METHODS:
+        return DIAGNOSED_METHODS[name]
+
+    def diagnosed(foundation: Foundation, loads: LoadSet | None = None) -> tuple[list[Any], list[Any], dict[str, list]]:
+        return (*engine(foundation, loads), {})
+
+    return diagnosed
+
+
+def available_methods() -> list[str]:
+    """Names of every registered analysis method."""
+    load_engines()
+    return list(METHODS)
+
+
+def load_engines() -> None:
+    """Import the engine modules, so their methods are registered."""
+    for module in ENGINE_MODULES:
+        import_module(module)
+
+
+@register("compare")
+def compare_analysis(foundation: Foundation, loads: LoadSet | None = None) -> tuple[list[tuple], list[tuple]]:
+    """Returns the bi-direction and one-direction results side by side for every load."""
+    bi_stresses, bi_percentajes = get_method("bi-direction")(foundation, loads)
+    one_stresses, one_percentajes = get_method("one-direction")(foundation, loads)
+    stresses = [(s1, s2, s3) for s1, (s2, s3) in zip(bi_stresses, one_stresses, strict=True)]
+    percentajes = [(p1, p2, p3) for p1, (p2, p3) in zip(bi_percentajes, one_percentajes, strict=True)]
+    return stresses, percentajes
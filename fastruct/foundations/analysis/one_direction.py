@@ -1,14 +1,19 @@
 """Foundation one direction analysis."""
+from fastruct.loads.loadset import LoadSet
 from fastruct.models.foundation import Foundation
 from fastruct.models.load import Load
 
 
 def one_direction_analysis(
-    foundation: Foundation,
+    foundation: Foundation, loads: LoadSet | None = None
 ) -> tuple[list[tuple[float | None, float | None]], list[tuple[float, float]]]:
-    """Returns maximun stresses and support percentaje by directions x and y."""
-    percentajes = [get_percentaje_by_direction(foundation, load) for load in foundation.loads]
-    all_stresses = [get_stress_by_direction(foundation, load) for load in foundation.loads]
+    """Returns maximun stresses and support percentaje by directions x and y.
+
+    The loads of the foundation are analyzed unless a load set is given.
+    """
+    loads = foundation.loads if loads is None else loads  # type: ignore
+    percentajes = [get_percentaje_by_direction(foundation, load) for load in loads]
+    all_stresses = [get_stress_by_direction(foundation, load) for load in loads]
     stresses = [(max_x, max_y) for max_x, _, max_y, _ in all_stresses]
 
     return stresses, percentajes
@@ -0,0 +1,112 @@
+"""Governing loads prefilter for the bi-direction analysis.
+
+The compressed area of a load only depends on its absolute eccentricities (|ex|, |ey|) and never grows when any of
+them grows. It is tabulated once per foundation on a grid of eccentricities, so the area of every load is bounded by
+the values at the corners of its grid cell. The compressed percentaje grows with the area and the maximum stress never
+does, so every load gets cheap bounds of both results.
+
+Loads whose stress can't reach the largest lower bound and whose percentaje can't reach the smallest upper bound
+never govern and are pruned before the bi-direction solve.
+"""
+import numpy as np
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+
+from .vectorized import (
+    bi_direction_arrays,
+    bi_directional_stress_arrays,
+    compressed_zone,
+    cracked_stress_arrays,
+    excentricity_arrays,
+    loads_as_arrays,
+    nan_to_none,
+)
+
+GRID_SIZE = 128
+TOLERANCE = 1e-9  # Relative slack of the bounds for rounding errors
+
+
+def prefiltered_bi_direction_analysis(
+    foundation: Foundation, loads: LoadSet | None = None
+) -> tuple[list[int], list[float | None], list[float]]:
+    """Returns the indices of the loads that may govern, with their maximun stresses and support percentaje.
+
+    The loads of the foundation are analyzed unless a load set is given.
+    """
+    p, mx, my = loads_as_arrays(foundation.loads if loads is None else loads)
+    kept = np.flatnonzero(governing_candidates(foundation.lx, foundation.ly, p, mx, my))
+    stresses, percentajes = bi_direction_arrays(foundation.lx, foundation.ly, p[kept], mx[kept], my[kept])
+    return kept.tolist(), nan_to_none(stresses), percentajes.tolist()
+
+
+def governing_candidates(
+    lx: float, ly: float, p: np.ndarray, mx: np.ndarray, my: np.ndarray, grid_size: int = GRID_SIZE
+) -> np.ndarray:
+    """Mask of the loads that may set the maximum stress or the minimum percentaje of `bi_direction_arrays`.
+
+    Every load that may tie with the governing values is kept, so the kept loads yield the same governing values and
+    loads as the whole set.
+
+    Args:
+        lx (float): Width of the foundation in the x direction.
+        ly (float): Width of the foundation in the y direction.
+        p (np.ndarray): Axial forces.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+        grid_size (int, optional): Cells of the eccentricities grid by direction. Defaults to 128.
+
+    Returns:
+        np.ndarray: Boolean mask of the loads to analyze.
+    """
+    p, mx, my = (np.asarray(value, dtype=np.float64) for value in (p, mx, my))
+    if p.size == 0:
+        return np.zeros(p.shape, dtype=bool)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ex, ey = excentricity_arrays(p, mx, my)
+        abs_ex, abs_ey = np.abs(ex), np.abs(ey)
+        centered = (ex == 0) & (ey == 0)
+        overturned = ~centered & ((abs_ex >= lx / 2) | (abs_ey >= ly / 2) | np.isnan(ex) | np.isnan(ey))
+        cracked = ~(centered | overturned) & ((abs_ex > lx / 6) | (abs_ey > ly / 6))
+
+        min_area, max_area = compressed_area_bounds(
+            lx, ly, np.where(cracked, abs_ex, 0), np.where(cracked, abs_ey, 0), grid_size
+        )
+        elastic_stresses = bi_directional_stress_arrays(p, mx, my, lx, ly)
+        min_stresses = np.where(cracked, cracked_stress_arrays(lx, ly, p, mx, my, max_area), elastic_stresses)
+        max_stresses = np.where(cracked, cracked_stress_arrays(lx, ly, p, mx, my, min_area), elastic_stresses)
+        min_percentajes = np.where(cracked, 100 * min_area / (lx * ly), 100.0)
+        max_percentajes = np.where(cracked, 100 * max_area / (lx * ly), 100.0)
+
+    min_stresses[overturned] = max_stresses[overturned] = -np.inf
+    min_percentajes[overturned] = max_percentajes[overturned] = 0
+
+    stress_threshold = min_stresses.max()
+    stress_threshold -= TOLERANCE * abs(stress_threshold) if np.isfinite(stress_threshold) else 0
+    percentaje_threshold = max_percentajes.min() * (1 + TOLERANCE) + TOLERANCE
+    kept = (max_stresses >= stress_threshold) | (cracked & (min_percentajes <= percentaje_threshold))
+
+    # The percentaje of the other loads is exactly 0% or 100%, so only the first load of each tie may govern
+    for tied in (overturned, ~(cracked | overturned)):
+        first = np.flatnonzero(tied)[:1]
+        kept[first] |= min_percentajes[first] <= percentaje_threshold
+
+    return kept
+
+
+def compressed_area_bounds(
+    lx: float, ly: float, abs_ex: np.ndarray, abs_ey: np.ndarray, grid_size: int = GRID_SIZE
+) -> tuple[np.ndarray, np.ndarray]:
+    """Lower and upper bounds of the compressed area for the given absolute eccentricities.
+
+    Eccentricities must be within the foundation: `abs_ex <= lx / 2` and `abs_ey <= ly / 2`.
+    """
+    grid_ex, grid_ey = np.linspace(0, lx / 2, grid_size + 1), np.linspace(0, ly / 2, grid_size + 1)
+    grid_area, _, _ = compressed_zone(
+        lx, ly, 1.0, grid_ex[:, None] / (lx**2 / 12), -grid_ey[None, :] / (ly**2 / 12)
+    )
+
+    i = np.clip((abs_ex / (lx / 2) * grid_size).astype(np.int64), 0, grid_size - 1)
+    j = np.clip((abs_ey / (ly / 2) * grid_size).astype(np.int64), 0, grid_size - 1)
+    return grid_area[i + 1, j + 1], grid_area[i, j]
@@ -0,0 +1,297 @@
+"""Foundations vectorized analysis.
+
+Batch counterparts of the per-load analysis functions. Every function works over columnar numpy arrays (one value
+per load) and uses NaN where the scalar functions return None.
+"""
+from collections.abc import Iterable
+
+import numpy as np
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+
+from .methods import register
+
+# Cases of the bi-direction solver, by how much of the foundation is compressed
+SOLVER_CASES = ("trapezoidal", "triangular", "cracked", "overturned")
+
+
+@register("bi-direction")
+def vectorized_bi_direction_analysis(
+    foundation: Foundation, loads: LoadSet | None = None
+) -> tuple[list[float | None], list[float]]:
+    """Returns maximun stresses and support percentaje computed in a single pass over all the loads.
+
+    The loads of the foundation are analyzed unless a load set is given.
+    """
+    p, mx, my = loads_as_arrays(foundation.loads if loads is None else loads)
+    stresses, percentajes = bi_direction_arrays(foundation.lx, foundation.ly, p, mx, my)
+    return nan_to_none(stresses), percentajes.tolist()
+
+
+@register("one-direction")
+def vectorized_one_direction_analysis(
+    foundation: Foundation, loads: LoadSet | None = None
+) -> tuple[list[tuple[float | None, float | None]], list[tuple[float, float]]]:
+    """Returns maximun stresses and support percentaje by directions x and y computed over all the loads at once.
+
+    The loads of the foundation are analyzed unless a load set is given.
+    """
+    p, mx, my = loads_as_arrays(foundation.loads if loads is None else loads)
+    stresses, percentajes = one_direction_arrays(foundation.lx, foundation.ly, p, mx, my)
+    max_x, max_y = nan_to_none(stresses[:, 0]), nan_to_none(stresses[:, 2])
+    return list(zip(max_x, max_y, strict=True)), list(map(tuple, percentajes.tolist()))
+
+
+def loads_as_arrays(loads: LoadSet | Iterable[Load]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Columnar axial force and moments (p, mx, my) of the given loads."""
+    if isinstance(loads, LoadSet):
+        return loads.p, loads.mx, loads.my
+
+    data = np.array([(load.p, load.mx, load.my) for load in loads], dtype=np.float64).reshape(-1, 3)
+    return data[:, 0], data[:, 1], data[:, 2]
+
+
+def nan_to_none(values: np.ndarray) -> list[float | None]:
+    """Convert an array into a list where NaN values are replaced by None."""
+    return [None if np.isnan(value) else value for value in values.tolist()]
+
+
+def bi_direction_arrays(
+    lx: float | np.ndarray, ly: float | np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Maximum stress and compressed area percentaje for every load.
+
+    Vectorized equivalent of `get_bi_directional_percentaje_and_stress`. The compressed area is the part of the
+    foundation's rectangle on the compressed side of the neutral axis, computed in closed form.
+
+    Args:
+        lx (float | np.ndarray): Width of the foundation in the x direction.
+        ly (float | np.ndarray): Width of the foundation in the y direction.
+        p (np.ndarray): Axial forces.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Stresses (NaN when the foundation overturns) and compressed area percentajes.
+            Geometry and loads are broadcasted against each other.
+    """
+    lx, ly, p, mx, my = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (lx, ly, p, mx, my)))
+    ry2, rx2 = lx**2 / 12, ly**2 / 12
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ex, ey = excentricity_arrays(p, mx, my)
+        centered = (ex == 0) & (ey == 0)
+        overturned = ~centered & ((np.abs(ex) >= lx / 2) | (np.abs(ey) >= ly / 2) | np.isnan(ex) | np.isnan(ey))
+        in_kern = (np.abs(ex) <= lx / 6) & (np.abs(ey) <= ly / 6)
+        cracked = ~(centered | overturned | in_kern)
+
+        compressed_area, _, _ = compressed_zone(lx, ly, np.ones_like(p), ex / ry2, ey / rx2)
+        stresses = np.where(
+            cracked,
+            cracked_stress_arrays(lx, ly, p, mx, my, compressed_area),
+            bi_directional_stress_arrays(p, mx, my, lx, ly),
+        )
+        percentajes = np.where(cracked, 100 * compressed_area / (lx * ly), 100.0)
+
+    stresses[overturned] = np.nan
+    percentajes[overturned] = 0
+    return stresses, percentajes
+
+
+def solver_cases(
+    lx: float | np.ndarray, ly: float | np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray
+) -> np.ndarray:
+    """Case of the bi-direction solver of every load, as an index of `SOLVER_CASES`.
+
+    Loads inside the kern compress the whole foundation (trapezoidal). Loads outside it lift part of the foundation:
+    with a triangular distribution when the excentricity is in a single direction, and cracked when it is in both.
+    Loads outside the foundation overturn it.
+    """
+    lx, ly, p, mx, my = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (lx, ly, p, mx, my)))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ex, ey = excentricity_arrays(p, mx, my)
+        centered = (ex == 0) & (ey == 0)
+        overturned = ~centered & ((np.abs(ex) >= lx / 2) | (np.abs(ey) >= ly / 2) | np.isnan(ex) | np.isnan(ey))
+        in_kern = (np.abs(ex) <= lx / 6) & (np.abs(ey) <= ly / 6)
+
+    cases = np.where((ex == 0) | (ey == 0), 1, 2)
+    cases = np.where(centered | in_kern, 0, cases)
+    return np.where(overturned, 3, cases)
+
+
+def solver_case_counts(
+    lx: float | np.ndarray, ly: float | np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray
+) -> dict[str, int]:
+    """Number of loads in every case of the bi-direction solver."""
+    counts = np.bincount(solver_cases(lx, ly, p, mx, my).reshape(-1), minlength=len(SOLVER_CASES))
+    return dict(zip(SOLVER_CASES, counts.tolist(), strict=True))
+
+
+def cracked_stress_arrays(
+    lx: np.ndarray, ly: np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray, compressed_area: np.ndarray
+) -> np.ndarray:
+    """Maximum stress of loads outside the kern, over the estimated dimensions of their compressed area.
+
+    The estimated dimensions never decrease when the compressed area grows, so the stress never increases with it.
+    """
+    ry2 = lx**2 / 12
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ex, ey = excentricity_arrays(p, mx, my)
+        estimated_lx = np.where(
+            ex == 0,
+            lx,
+            np.where(ey == 0, lx / 2 + np.abs(ry2 / ex), np.minimum(np.sqrt(np.abs(compressed_area * ey / ex)), lx)),
+        )
+        estimated_ly = compressed_area / estimated_lx
+        exceeded = estimated_ly > ly
+        estimated_ly = np.where(exceeded, ly, estimated_ly)
+        estimated_lx = np.where(exceeded, compressed_area / ly, estimated_lx)
+        return bi_directional_stress_arrays(p, mx, my, estimated_lx, estimated_ly)
+
+
+def one_direction_arrays(
+    lx: float | np.ndarray, ly: float | np.ndarray, p: np.ndarray, mx: np.ndarray, my: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Stresses and lifting percentajes by directions x and y for every load.
+
+    Vectorized equivalent of `get_stress_by_direction` and `get_percentaje_by_direction`.
+
+    Args:
+        lx (float | np.ndarray): Width of the foundation in the x direction.
+        ly (float | np.ndarray): Width of the foundation in the y direction.
+        p (np.ndarray): Axial forces.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Stresses with columns (σx max, σx min, σy max, σy min), NaN when there is no
+            solution, and percentajes with columns (%x, %y).
+    """
+    lx, ly, p, mx, my = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64) for value in (lx, ly, p, mx, my)))
+    if (lx <= 0).any() or (ly <= 0).any():
+        raise ValueError("width can't be negative nor zero.")
+
+    max_x, min_x, percentaje_x = stress_and_percentaje_arrays(p, my, lx, ly)
+    max_y, min_y, percentaje_y = stress_and_percentaje_arrays(p, mx, ly, lx)
+    return np.stack([max_x, min_x, max_y, min_y], axis=-1), np.stack([percentaje_x, percentaje_y], axis=-1)
+
+
+def stress_and_percentaje_arrays(
+    axial: np.ndarray, moment: np.ndarray, width: np.ndarray, length: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized `compute_stress` and `compute_percentaje` for a single direction.
+
+    Widths and lengths must be already validated as positive.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Max stress, min stress and lifting percentaje.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        excentricity = np.abs(moment / axial)
+        loaded = axial > 0
+        trapezoidal = loaded & (excentricity <= width / 6)
+        triangular = loaded & (width / 6 < excentricity) & (excentricity <= width / 4)
+
+        axial_stress = axial / (width * length)
+        sigma_max = np.where(
+            trapezoidal,
+            axial_stress * (1 + 6 * excentricity / width),
+            (2 * axial) / (3 * length * (width / 2 - excentricity)),
+        )
+        sigma_min = np.where(trapezoidal, axial_stress * (1 - 6 * excentricity / width), 0.0)
+        compressed_width = 3 * (width / 2 - excentricity)
+        percentaje = np.where(trapezoidal, 100.0, np.where(triangular, compressed_width / width * 100, 0.0))
+
+    solved = trapezoidal | triangular
+    return np.where(solved, sigma_max, np.nan), np.where(solved, sigma_min, np.nan), percentaje
+
+
+def bi_directional_stress_arrays(
+    axial: np.ndarray, moment_x: np.ndarray, moment_y: np.ndarray, lx: np.ndarray, ly: np.ndarray
+) -> np.ndarray:
+    """Vectorized `calculate_bi_directional_stress`."""
+    area = lx * ly
+    inertia_x = lx**3 * ly / 12
+    inertia_y = ly**3 * lx / 12
+    return axial / area + np.abs(moment_x) * ly / 2 / inertia_x + np.abs(moment_y) * lx / 2 / inertia_y
+
+
+def excentricity_arrays(axial: np.ndarray, moment_x: np.ndarray, moment_y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `compute_excentrycity`."""
+    return moment_y / axial, -1 * np.abs(moment_x) / axial
+
+
+def compressed_zone(
+    lx: np.ndarray, ly: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Area and centroid of the part of the foundation where `a + b * x + c * y >= 0`.
+
+    The rectangle is centered at the origin. Its boundary is clipped against the half-plane and the area and centroid
+    are integrated over the clipped edges plus the chord along the line (Green's theorem), so no polygon is built.
+
+    Args:
+        lx (np.ndarray): Width of the foundation in the x direction.
+        ly (np.ndarray): Width of the foundation in the y direction.
+        a (np.ndarray): Independent term of the line.
+        b (np.ndarray): Coefficient of x.
+        c (np.ndarray): Coefficient of y.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Area and centroid coordinates (x, y). The centroid is NaN when the
+            area is zero.
+    """
+    x1, y1, x2, y2 = clipped_boundary(lx, ly, a, b, c)
+    cross = x1 * y2 - x2 * y1
+    area = cross.sum(axis=-1) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        centroid_x = ((x1 + x2) * cross).sum(axis=-1) / (6 * area)
+        centroid_y = ((y1 + y2) * cross).sum(axis=-1) / (6 * area)
+
+    return area, centroid_x, centroid_y
+
+
+def clipped_boundary(
+    lx: np.ndarray, ly: np.ndarray, a: np.ndarray, b: np.ndarray, c: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Counterclockwise boundary segments of the rectangle clipped by the half-plane `a + b * x + c * y >= 0`.
+
+    Returns five segments per load: the four (possibly clipped) edges of the rectangle and the chord along the line.
+    Segments that fall outside the half-plane collapse into a point, so they do not contribute to boundary integrals.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Start and end coordinates (x1, y1, x2, y2) with shape
+            `(..., 5)`.
+    """
+    half_x, half_y = np.asarray(lx)[..., None] / 2, np.asarray(ly)[..., None] / 2
+    x = half_x * np.array([-1.0, 1.0, 1.0, -1.0])
+    y = half_y * np.array([-1.0, -1.0, 1.0, 1.0])
+    values = np.asarray(a)[..., None] + np.asarray(b)[..., None] * x + np.asarray(c)[..., None] * y
+
+    next_x, next_y, next_values = (np.roll(array, -1, axis=-1) for array in (x, y, values))
+    inside, next_inside = values >= 0, next_values >= 0
+    crossing = inside != next_inside
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(crossing, values / (values - next_values), 0)
+
+    cut_x, cut_y = x + t * (next_x - x), y + t * (next_y - y)
+    start_x, start_y = np.where(inside, x, cut_x), np.where(inside, y, cut_y)
+    end_x, end_y = np.where(next_inside, next_x, cut_x), np.where(next_inside, next_y, cut_y)
+
+    # Edges entirely in tension collapse into the origin
+    outside = ~(inside | next_inside)
+    start_x, start_y, end_x, end_y = (np.where(outside, 0, array) for array in (start_x, start_y, end_x, end_y))
+
+    exiting, entering = inside & ~next_inside, ~inside & next_inside
+    chord = [
+        np.where(mask, cut, 0).sum(axis=-1, keepdims=True) for mask in (exiting, entering) for cut in (cut_x, cut_y)
+    ]
+
+    return (
+        np.concatenate([start_x, chord[0]], axis=-1),
+        np.concatenate([start_y, chord[1]], axis=-1),
+        np.concatenate([end_x, chord[2]], axis=-1),
+        np.concatenate([end_y, chord[3]], axis=-1),
+    )
@@ -0,0 +1,86 @@
+"""Foundations analysis results cache.
+
+Results are stored by foundation and method together with a content hash of the foundation geometry, its loads and
+the method. A stored result is only reused when the hash still matches, and commands that change a foundation or its
+loads drop its results right away.
+"""
+import hashlib
+import struct
+from collections.abc import Iterable
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.analysis_result import AnalysisResult
+from fastruct.models.foundation import Foundation
+
+
+def results_key(foundation: Foundation, method: str, loads: LoadSet | None = None) -> str:
+    """Content hash of the foundation geometry, its loads at the seal level and the analysis method.
+
+    The loads of the foundation are hashed unless a load set is given.
+    """
+    digest = hashlib.sha256(method.encode())
+    geometry = (foundation.lx, foundation.ly, foundation.lz, foundation.depth, foundation.ex, foundation.ey)
+    digest.update(struct.pack("8d", *geometry, foundation.col_x, foundation.col_y))
+    if loads is None:
+        loads = LoadSet.from_loads(foundation.loads)
+    digest.update(loads.ids.tobytes())
+    for values in loads.forces():
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def get_cached_results(
+    session: Session, foundation_id: int, method: str, key: str
+) -> tuple[list, list, dict[str, list]] | None:
+    """Stored stresses, percentajes and solver diagnostics of an analysis, or None when missing or stale.
+
+    Args:
+        session (Session): Database session.
+        foundation_id (int): Foundation's ID.
+        method (str): Analysis method.
+        key (str): Current `results_key` of the foundation.
+
+    Returns:
+        tuple[list, list, dict[str, list]] | None: Stresses, percentajes and diagnostics, as returned by the analysis.
+    """
+    query = sa.select(AnalysisResult.stresses, AnalysisResult.percentajes, AnalysisResult.diagnostics).where(
+        AnalysisResult.foundation_id == foundation_id, AnalysisResult.method == method, AnalysisResult.key == key
+    )
+    row = session.execute(query).first()
+    if row is None:
+        return None
+
+    # JSON has no tuples
+    stresses, percentajes = ([tuple(v) if isinstance(v, list) else v for v in values] for values in row[:2])
+    return stresses, percentajes, row.diagnostics or {}
+
+
+def store_results(
+    session: Session,
+    foundation_id: int,
+    method: str,
+    key: str,
+    stresses: list,
+    percentajes: list,
+    diagnostics: dict[str, list] | None = None,
+) -> None:
+    """Store the results of an analysis, replacing the previous ones of the same foundation and method."""
+    values = {"key": key, "stresses": stresses, "percentajes": percentajes, "diagnostics": diagnostics or None}
+    query = (
+        sqlite.insert(AnalysisResult)
+        .values(foundation_id=foundation_id, method=method, **values)
+        .on_conflict_do_update(
+            index_elements=[AnalysisResult.foundation_id, AnalysisResult.method],
+            set_={**values, "updated_at": sa.func.now()},
+        )
+    )
+    session.execute(query)
+
+
+def invalidate_results(session: Session, foundation_ids: Iterable[int]) -> None:
+    """Drop the stored results of the given foundations."""
+    session.execute(sa.delete(AnalysisResult).where(AnalysisResult.foundation_id.in_(list(foundation_ids))))
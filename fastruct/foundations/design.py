@@ -1,15 +1,111 @@
-"""Foundations design module."""
-from models.foundation import Foundation
-from models.load import Load
+"""Foundations design module.
+
+Ultimate moments are computed for every load at once over columnar arrays by `ultimate_moment_arrays`, with NaN where
+the stress distribution has no solution or is not trapezoidal on the side. The per-load functions are kept as the
+reference implementation.
+"""
+import numpy as np
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
 
 from .analysis.one_direction import compressed_width_for_triangular_distribution, compute_stress
+from .analysis.vectorized import loads_as_arrays, nan_to_none, stress_and_percentaje_arrays
+
+SIDES = ("x left", "x right", "y left", "y right")
 
 
 def get_ultimate_moments(
-    foundation: Foundation,
+    foundation: Foundation, loads: LoadSet | None = None
 ) -> list[tuple[tuple[float | None, float | None], tuple[float | None, float | None]]]:
-    """Ultimate moment for every load on foundation."""
-    return [ultimate_moment_by_direction(foundation, load) for load in foundation.loads]
+    """Ultimate moment for every load on foundation, as ((x left, x right), (y left, y right)).
+
+    The loads of the foundation are designed unless a load set is given.
+    """
+    p, mx, my = loads_as_arrays(foundation.loads if loads is None else loads)
+    moments = [nan_to_none(side) for side in ultimate_moment_arrays(foundation, p, mx, my).T]
+    return [((x_left, x_right), (y_left, y_right)) for x_left, x_right, y_left, y_right in zip(*moments, strict=True)]
+
+
+def ultimate_moment_arrays(foundation: Foundation, p: np.ndarray, mx: np.ndarray, my: np.ndarray) -> np.ndarray:
+    """Ultimate moments at both sides of the column, by direction, for every load.
+
+    Vectorized equivalent of `ultimate_moment_by_direction`.
+
+    Args:
+        foundation (Foundation): Foundation geometry.
+        p (np.ndarray): Axial forces.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+
+    Returns:
+        np.ndarray: Moments with columns `SIDES` (x left, x right, y left, y right) and NaN where there is no solution.
+    """
+    p, mx, my = (np.asarray(value, dtype=np.float64) for value in (p, mx, my))
+    lx, ly = np.float64(foundation.lx), np.float64(foundation.ly)
+    sigma_max_x, sigma_min_x, _ = stress_and_percentaje_arrays(p, my, lx, ly)
+    sigma_max_y, sigma_min_y, _ = stress_and_percentaje_arrays(p, mx, ly, lx)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        moments_x = ultimate_moments_by_side_arrays(
+            sigma_max_x, sigma_min_x, my >= 0, ly, lx, foundation.col_x, foundation.ex, np.abs(my / p)
+        )
+        moments_y = ultimate_moments_by_side_arrays(
+            sigma_max_y, sigma_min_y, mx >= 0, lx, ly, foundation.col_y, foundation.ey, np.abs(mx / p)
+        )
+    return np.stack([*moments_x, *moments_y], axis=-1)
+
+
+def ultimate_moments_by_side_arrays(
+    sigma_max: np.ndarray,
+    sigma_min: np.ndarray,
+    is_sigma_max_right: np.ndarray,
+    width: float,
+    length: float,
+    column_length: float,
+    column_excentricity: float,
+    load_excentricity: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized `ultimate_moments_by_side`."""
+    length_left = length / 2 + column_excentricity - column_length / 2
+    length_right = length - length_left - column_length
+    pivot_length = np.where(is_sigma_max_right, length_right, length_left)
+    compressed_length = np.where(
+        sigma_min == 0, compressed_width_for_triangular_distribution(length, load_excentricity), length
+    )
+    sigma_min_on_pivot = sigma_max * pivot_length / compressed_length
+    return (
+        ultimate_moment_arrays_by_length(sigma_max, sigma_min_on_pivot, width, length_left),
+        ultimate_moment_arrays_by_length(sigma_max, sigma_min_on_pivot, width, length_right),
+    )
+
+
+def ultimate_moment_arrays_by_length(
+    sigma_max: np.ndarray, sigma_min: np.ndarray, width: float, length: float
+) -> np.ndarray:
+    """Vectorized `ultimate_moment`."""
+    moment = (sigma_max - sigma_min) * length**2 * width / 3 + sigma_min * length**2 * width / 2
+    return np.where(sigma_min < 0, np.nan, moment)
+
+
+def moment_envelope(moments: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Maximum positive moment by side and the index of the load that governs it.
+
+    Args:
+        moments (np.ndarray): Moments by load with columns `SIDES`, as `ultimate_moment_arrays`.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Maximum moment by side, NaN when no load has a positive moment, and the
+            index of the governing load, -1 when there is none.
+    """
+    moments = np.where(np.isnan(moments) | (moments <= 0), -np.inf, moments).reshape(-1, len(SIDES))
+    if len(moments) == 0:
+        return np.full(len(SIDES), np.nan), np.full(len(SIDES), -1)
+
+    governing = moments.argmax(axis=0)
+    maximum = moments[governing, np.arange(len(SIDES))]
+    found = np.isfinite(maximum)
+    return np.where(found, maximum, np.nan), np.where(found, governing, -1)
 
 
 def ultimate_moment_by_direction(
@@ -0,0 +1,114 @@
+"""Foundations analysis results export.
+
+Results are written by load, with the load forces at the seal level and the results of the analysis method, as plain
+values instead of formatted table rows. CSV and JSON Lines are written row by row to any text stream, and Parquet
+writes the columns at once with a fixed Arrow schema. Parquet requires the optional `pyarrow` dependency.
+"""
+import csv
+import json
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, TextIO
+
+from fastruct.loads.loadset import LoadSet
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+
+LOAD_COLUMNS = ("number", "load_id", "name", "p", "vx", "vy", "mx", "my")
+
+# Stress and percentaje columns of every method, in the order of the values returned by its engine
+METHOD_COLUMNS = {
+    "bi-direction": (("stress",), ("percentaje",)),
+    "one-direction": (("stress_x", "stress_y"), ("percentaje_x", "percentaje_y")),
+    "compare": (("stress", "stress_x", "stress_y"), ("percentaje", "percentaje_x", "percentaje_y")),
+    "exact": (("stress",), ("percentaje",)),
+}
+
+
+def results_columns(
+    numbers: Sequence[int],
+    loads: LoadSet,
+    stresses: Sequence[Any],
+    percentajes: Sequence[Any],
+    method: str,
+    diagnostics: dict[str, list] | None = None,
+) -> dict[str, list]:
+    """Analysis results by column.
+
+    Args:
+        numbers (Sequence[int]): Row number of every load.
+        loads (LoadSet): Loads at the seal level.
+        stresses (Sequence): Stresses by load, as returned by the method engine.
+        percentajes (Sequence): Percentajes by load, as returned by the method engine.
+        method (str): Analysis method.
+        diagnostics (dict[str, list] | None, optional): Solver diagnostics by load, written after the results, as the
+            iterations and convergence of the exact method. Defaults to None.
+
+    Returns:
+        dict[str, list]: Values of every column, with None where the analysis has no solution.
+    """
+    stress_columns, percentaje_columns = METHOD_COLUMNS[method]
+    columns: dict[str, list] = {"number": list(numbers), "load_id": loads.user_load_ids.tolist(), "name": loads.names}
+    columns.update(zip(LOAD_COLUMNS[3:], (values.tolist() for values in loads.forces()), strict=True))
+
+    for names, values in ((stress_columns, stresses), (percentaje_columns, percentajes)):
+        if len(names) == 1:
+            columns[names[0]] = list(values)
+        else:
+            columns.update((name, [value[k] for value in values]) for k, name in enumerate(names))
+
+    columns.update(diagnostics or {})
+    return columns
+
+
+def records(columns: dict[str, list]) -> Iterator[dict[str, Any]]:
+    """Results by row, as dictionaries from column name to value."""
+    names = list(columns)
+    for values in zip(*columns.values(), strict=True):
+        yield dict(zip(names, values, strict=True))
+
+
+def write_csv(columns: dict[str, list], stream: TextIO) -> None:
+    """Write the results as CSV with a header row. Missing values are written as empty fields."""
+    writer = csv.writer(stream, lineterminator="\n")
+    writer.writerow(columns)
+    writer.writerows(zip(*columns.values(), strict=True))
+
+
+def write_jsonl(columns: dict[str, list], stream: TextIO) -> None:
+    """Write the results as JSON Lines, one object per load. Missing values are written as null."""
+    for record in records(columns):
+        stream.write(json.dumps(record))
+        stream.write("\n")
+
+
+def write_parquet(columns: dict[str, list], path: Path) -> None:
+    """Write the results as a Parquet file.
+
+    Raises:
+        ImportError: When `pyarrow` is not installed.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {
+        "number": pa.int64(),
+        "load_id": pa.int64(),
+        "name": pa.string(),
+        "iterations": pa.int32(),
+        "converged": pa.bool_(),
+    }
+    schema = pa.schema([(name, types.get(name, pa.float64())) for name in columns])
+    pq.write_table(pa.table(columns, schema=schema), path)
+
+
+def export_results(columns: dict[str, list], export_format: str, stream: TextIO) -> None:
+    """Write the results to a text stream in a streaming format.
+
+    Raises:
+        ValueError: When the format is unknown or can't be written to a text stream.
+    """
+    writers = {"csv": write_csv, "jsonl": write_jsonl}
+    if export_format not in writers:
+        raise ValueError(f"Format {export_format} can't be written to a text stream.")
+    writers[export_format](columns, stream)
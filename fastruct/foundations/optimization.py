@@ -0,0 +1,146 @@
+"""Foundations size optimization.
+
+Searches the smallest footing, by volume, whose governing stress and compressed percentaje satisfy the limits for
+every load. Candidate geometries are ranked by volume and analyzed in batches with the vectorized methods, so the
+search stops at the first feasible size and every larger candidate is never analyzed.
+"""
+import numpy as np
+
+from fastruct.loads.seal import loads_at_seal
+from fastruct.models.foundation import Foundation
+
+from .analysis.batch import governing_arrays
+
+OPTIMIZE_METHODS = ("bi-direction", "one-direction")
+BATCH_SIZE = 1_000_000  # Candidates × loads analyzed at once
+SCREENING_LOADS = 16  # Critical loads by criterion
+
+
+def dimension_range(minimum: float, maximum: float, step: float) -> np.ndarray:
+    """Values from `minimum` to `maximum`, both included, every `step`."""
+    if step <= 0 or minimum <= 0 or maximum < minimum:
+        raise ValueError("dimensions must be positive and step greater than zero.")
+    return np.round(np.arange(minimum, maximum + step / 2, step), 6)
+
+
+def candidate_geometries(lx: np.ndarray, ly: np.ndarray, lz: np.ndarray, depth: float) -> np.ndarray:
+    """Every combination of the given widths and heights, ranked by volume and then by area.
+
+    Heights greater than the depth of the foundation are discarded.
+
+    Returns:
+        np.ndarray: Candidate geometries (lx, ly, lz) with shape `(n, 3)`.
+    """
+    lz = lz[lz <= depth]
+    candidates = np.stack(np.meshgrid(lx, ly, lz, indexing="ij"), axis=-1).reshape(-1, 3)
+    area = candidates[:, 0] * candidates[:, 1]
+    return candidates[np.lexsort((area, area * candidates[:, 2]))]
+
+
+def optimize_foundation(
+    foundation: Foundation,
+    user_loads: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    candidates: np.ndarray,
+    stress_limit: float,
+    min_percentaje: float,
+    method: str = "bi-direction",
+    batch_size: int = BATCH_SIZE,
+) -> tuple[np.ndarray | None, float | None, float | None, int]:
+    """Smallest candidate geometry that satisfies the limits for every load.
+
+    The loads at the seal level are computed for every candidate, since the weight of the foundation and the ground
+    and the moments of the shear forces depend on its size. Column sizes, eccentricities and depth are kept.
+
+    Candidates that clearly fail are pruned before the full analysis:
+
+    - The maximum stress of a load is never lower than its average pressure P / A, so candidates where the largest
+      axial force exceeds the stress limit over the whole area are dropped without analysis.
+    - The remaining candidates are screened against a few critical loads (largest forces and moments). Failing any
+      of them means failing the full set, so only the candidates that pass are analyzed with every load.
+
+    Args:
+        foundation (Foundation): Foundation to resize.
+        user_loads (tuple): User loads p, vx, vy, mx and my arrays.
+        candidates (np.ndarray): Candidate geometries (lx, ly, lz) ranked by preference, as `candidate_geometries`.
+        stress_limit (float): Allowable soil stress.
+        min_percentaje (float): Minimum compressed area percentaje.
+        method (str, optional): Analysis method, one of `OPTIMIZE_METHODS`. Defaults to "bi-direction".
+        batch_size (int, optional): Maximum number of candidates times loads analyzed at once.
+
+    Returns:
+        tuple: The first feasible geometry (lx, ly, lz), its maximum stress and minimum percentaje, and the number of
+            candidates analyzed with every load. Geometry and results are None when no candidate is feasible.
+    """
+    if method not in OPTIMIZE_METHODS:
+        raise ValueError(f"Unkwnown method: {method}")
+
+    p = user_loads[0]
+    if len(p) == 0:
+        raise ValueError("foundation has no loads.")
+
+    axial, _, _ = seal_loads(foundation, candidates, (p.max(), 0.0, 0.0, 0.0, 0.0))
+    candidates = candidates[axial[:, 0] / (candidates[:, 0] * candidates[:, 1]) <= stress_limit]
+    screening = tuple(load[critical_loads(*user_loads)] for load in user_loads)
+
+    analyzed = 0
+    screening_step = max(1, batch_size // len(screening[0]))
+    full_step = max(1, batch_size // len(p))
+    for start in range(0, len(candidates), screening_step):
+        batch = candidates[start : start + screening_step]
+        batch = batch[evaluate(foundation, batch, screening, stress_limit, min_percentaje, method)[0]]
+
+        for full_start in range(0, len(batch), full_step):
+            chunk = batch[full_start : full_start + full_step]
+            feasible, max_stresses, min_percentajes = evaluate(
+                foundation, chunk, user_loads, stress_limit, min_percentaje, method
+            )
+            analyzed += len(chunk)
+            if feasible.any():
+                best = int(np.argmax(feasible))
+                return chunk[best], float(max_stresses[best]), float(min_percentajes[best]), analyzed
+
+    return None, None, None, analyzed
+
+
+def critical_loads(
+    p: np.ndarray, vx: np.ndarray, vy: np.ndarray, mx: np.ndarray, my: np.ndarray, size: int = SCREENING_LOADS
+) -> np.ndarray:
+    """Indices of the loads with the largest axial forces, smallest axial forces and largest moments and shears."""
+    criteria = (p, -p, np.abs(mx) + np.abs(vy), np.abs(my) + np.abs(vx), np.abs(mx) + np.abs(my))
+    size = min(size, len(p))
+    return np.unique(np.concatenate([np.argpartition(-values, size - 1)[:size] for values in criteria]))
+
+
+def seal_loads(
+    foundation: Foundation, candidates: np.ndarray, user_loads: tuple[np.ndarray | float, ...]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Axial forces and moments (P, Mx, My) at the seal level, with one row per candidate geometry."""
+    lx, ly, lz = (candidates[:, [i]] for i in range(3))
+    axial, _, _, moment_x, moment_y = loads_at_seal(
+        *user_loads,
+        lx=lx,
+        ly=ly,
+        lz=lz,
+        depth=foundation.depth,
+        ex=foundation.ex,
+        ey=foundation.ey,
+        col_x=foundation.col_x,
+        col_y=foundation.col_y,
+    )
+    return axial, moment_x, moment_y
+
+
+def evaluate(
+    foundation: Foundation,
+    candidates: np.ndarray,
+    user_loads: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    stress_limit: float,
+    min_percentaje: float,
+    method: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Whether every candidate satisfies the limits, with its maximum stress and minimum percentaje."""
+    axial, moment_x, moment_y = seal_loads(foundation, candidates, user_loads)
+    stresses, percentajes = governing_arrays(method, candidates[:, [0]], candidates[:, [1]], axial, moment_x, moment_y)
+    max_stresses = np.where(np.isnan(stresses), np.inf, stresses).max(axis=-1)
+    min_percentajes = percentajes.min(axis=-1)
+    return (max_stresses <= stress_limit) & (min_percentajes >= min_percentaje), max_stresses, min_percentajes
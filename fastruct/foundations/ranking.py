@@ -0,0 +1,62 @@
+"""Foundations governing loads ranking.
+
+Loads are ranked by a single key per load, so the governing ones are selected with a partial selection over an array
+instead of sorting every result.
+"""
+from collections.abc import Sequence
+from typing import Any, Literal
+
+import numpy as np
+
+RANKING_ORDERS = ("stress", "percentaje")
+
+
+def ranking_keys(
+    stresses: Sequence[Any], percentajes: Sequence[Any], order: Literal["stress", "percentaje"]
+) -> np.ndarray:
+    """Key of every load, where smaller keys govern.
+
+    Loads are ranked by their largest stress, descending, or by their smallest percentaje, ascending. Loads without
+    solution go first in both orders.
+
+    Args:
+        stresses (Sequence): Stresses by load, as returned by the method engine.
+        percentajes (Sequence): Percentajes by load, as returned by the method engine.
+        order (str): "stress" or "percentaje".
+
+    Returns:
+        np.ndarray: Keys with shape `(n,)`.
+    """
+    if order not in RANKING_ORDERS:
+        raise ValueError(f"Unkwnown order: {order}")
+
+    if order == "stress":
+        values = np.array(stresses, dtype=np.float64)  # None is converted to NaN
+        values = np.where(np.isnan(values), np.inf, values)
+        return -(values.max(axis=-1) if values.ndim > 1 else values)
+
+    values = np.array(percentajes, dtype=np.float64)
+    values = np.where(np.isnan(values), -np.inf, values)
+    return values.min(axis=-1) if values.ndim > 1 else values
+
+
+def top_indices(keys: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the `k` smallest keys, from the smallest and then by index, selected without sorting every key."""
+    k = min(k, len(keys))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k == len(keys):
+        return np.argsort(keys, kind="stable")
+
+    # Keys tied with the k-th one are taken in load order, as a stable full sort does
+    threshold = np.partition(keys, k - 1)[k - 1]
+    below = np.flatnonzero(keys < threshold)
+    selected = np.concatenate((below, np.flatnonzero(keys == threshold)[: k - len(below)]))
+    return selected[np.argsort(keys[selected], kind="stable")]
+
+
+def governing_indices(
+    stresses: Sequence[Any], percentajes: Sequence[Any], order: Literal["stress", "percentaje"], k: int
+) -> list[int]:
+    """Indices of the `k` governing loads by stress or by percentaje, from the most critical."""
+    return top_indices(ranking_keys(stresses, percentajes, order), k).tolist()
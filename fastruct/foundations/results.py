@@ -0,0 +1,114 @@
+"""Foundations analysis results, shared by the CLI and the HTTP API.
+
+Invalid options raise ValueError, so every interface reports them its own way.
+"""
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from fastruct import profiling
+from fastruct.foundations.analysis.methods import get_diagnosed_method
+from fastruct.foundations.cache import get_cached_results, results_key, store_results
+from fastruct.foundations.ranking import governing_indices
+from fastruct.loads.combinations import combination_loadset
+from fastruct.loads.loadset import LoadSet
+from fastruct.loads.queries import get_load_cases, get_loadset
+from fastruct.models.foundation import Foundation
+
+
+def analysis_loads(session: Session, foundation: Foundation, combinations: str | None = None) -> LoadSet:
+    """Stored loads of a foundation, or the combinations of its load cases from a combination table.
+
+    Raises:
+        ValueError: When the combination table or the kind of a load case is not valid.
+    """
+    if combinations is None:
+        return get_loadset(session, foundation.id)
+
+    kinds, forces = get_load_cases(session, foundation.id)
+    with profiling.phase("load hydration"):
+        return combination_loadset(foundation, combinations, kinds, forces)
+
+
+def analysis_results(
+    foundation: Foundation, method: str, loads: LoadSet | None = None
+) -> tuple[list[Any], list[Any], dict[str, list]]:
+    """Stresses, percentajes and solver diagnostics of the loads by method.
+
+    Only the engine registered for the method runs, over the given loads or the loads of the foundation.
+
+    Raises:
+        ValueError: When the method is not valid.
+    """
+    engine = get_diagnosed_method(method)
+    with profiling.phase("analysis engine"):
+        results = engine(foundation, loads)
+    count_solver_cases(foundation, loads)
+    return results
+
+
+def cached_analysis_results(
+    session: Session, foundation: Foundation, method: str, loads: LoadSet, use_cache: bool = True
+) -> tuple[list[Any], list[Any], dict[str, list]]:
+    """Stresses, percentajes and solver diagnostics of the loads by method, read from the results cache when stored.
+
+    Results computed here are stored for the next analysis of the same loads.
+
+    Raises:
+        ValueError: When the method is not valid.
+    """
+    with profiling.phase("cache"):
+        key = results_key(foundation, method, loads)
+        cached = get_cached_results(session, foundation.id, method, key) if use_cache else None
+    if cached is not None:
+        return cached
+
+    stresses, percentajes, diagnostics = analysis_results(foundation, method, loads)
+    with profiling.phase("cache"):
+        store_results(session, foundation.id, method, key, stresses, percentajes, diagnostics)
+    return stresses, percentajes, diagnostics
+
+
+def ordered_results(
+    numbers: Sequence[int],
+    loads: LoadSet,
+    stresses: Sequence[Any],
+    percentajes: Sequence[Any],
+    diagnostics: dict[str, list],
+    order: str | None = None,
+    top: int | None = None,
+) -> tuple[list[int], LoadSet, list[Any], list[Any], dict[str, list]]:
+    """Sort the results of the loads by stress (desc) or by percentaje (asc), with their solver diagnostics.
+
+    Loads without solution go first. When `top` is given, only that number of governing loads is selected, by the
+    order or by stress, without sorting every result. Results keep the load order without order nor top.
+
+    Raises:
+        ValueError: When the order or top are not valid.
+    """
+    if top is not None and top < 1:
+        raise ValueError("top must be positive")
+    if order is None and top is None:
+        return list(numbers), loads, list(stresses), list(percentajes), diagnostics
+
+    selected = governing_indices(stresses, percentajes, order or "stress", len(stresses) if top is None else top)
+    return (
+        [numbers[i] for i in selected],
+        loads[selected],
+        [stresses[i] for i in selected],
+        [percentajes[i] for i in selected],
+        {name: [values[i] for i in selected] for name, values in diagnostics.items()},
+    )
+
+
+def count_solver_cases(foundation: Foundation, loads: LoadSet | None = None) -> None:
+    """Record how many loads fall in every case of the bi-direction solver while profiling."""
+    if not profiling.enabled():
+        return
+
+    from fastruct.foundations.analysis.vectorized import loads_as_arrays, solver_case_counts
+
+    p, mx, my = loads_as_arrays(foundation.loads if loads is None else loads)
+    for case, count in solver_case_counts(foundation.lx, foundation.ly, p, mx, my).items():
+        profiling.count(f"{case} loads", count)
@@ -1,4 +1,6 @@
 """Foundations Rich tables configuration module."""
+from collections.abc import Iterable, Iterator
+from itertools import islice
 from typing import Any, Literal
 
 from rich.console import Console
@@ -15,7 +17,9 @@ LIMIT_STRESS_COLOR = "yellow"
 MIN_PERCENTAJE_COLOR = "blue"
 
 
-def analize_table(title: str, method: Literal["bi-directional", "one-direction", "compare"], no_loads: bool) -> Table:
+def analize_table(
+    title: str, method: Literal["bi-directional", "one-direction", "compare", "exact"], no_loads: bool
+) -> Table:
     """Table configuration."""
     columns = ["#", "NAME"]
     if not no_loads:
@@ -30,6 +34,9 @@ def analize_table(title: str, method: Literal["bi-directional", "one-direction",
     elif method == "compare":
         columns.extend(["σ (ton/m²)", "%", "σx max", r"%x", "σy max", r"%y"])
 
+    elif method == "exact":
+        columns.extend(["σ (ton/m²)", "%", "Iter."])
+
     table = Table(*columns)
     table.title = Text(title, style="black on white bold")
     table.show_lines = True
@@ -37,15 +44,30 @@ def analize_table(title: str, method: Literal["bi-directional", "one-direction",
     return table
 
 
+def governing_table(method: str) -> Table:
+    """Table configuration for governing results of many foundations."""
+    table = Table("F. ID", "Name", "Loads", "σ max (ton/m²)", "Load ID", "% min", "Load ID", "No solution")
+    table.title = Text(f"Governing results: {method}", style="black on white bold")
+    return table
+
+
+def design_table(title: str) -> Table:
+    """Table configuration for the ultimate moments envelope."""
+    table = Table("Side", "Mu max (ton·m)", "#", "NAME", "P", "Mx", "My")
+    table.title = Text(title, style="black on white bold")
+    return table
+
+
 def format_rows(
     stress: list[float],
     percentaje: list[float],
-    method: Literal["bi-directional", "one-direction", "compare"],
+    method: Literal["bi-directional", "one-direction", "compare", "exact"],
     max_stress: float,
     limit_stress: float | None = None,
     no_color: bool = False,
+    diagnostics: dict[str, Any] | None = None,
 ) -> list[str | Text]:
-    """Generate row data by analysis method."""
+    """Generate row data by analysis method, with the solver diagnostics of the load for the exact method."""
     if limit_stress is None:
         limit_stress = max_stress
 
@@ -109,6 +131,20 @@ def format_rows(
                 format_percentaje(percentaje_y),
             ]
         )
+    elif method == "exact":
+        diagnostics = diagnostics or {}
+        iterations = str(diagnostics.get("iterations", "-"))
+        if percentaje is None:
+            # The solver did not converge, so there are no results to show
+            data.extend(["-", "-", Text(iterations, style=f"{max_stress_color} bold")])
+        else:
+            data.extend(
+                [
+                    format_stress(stress) if stress is not None else "∞",  # type: ignore
+                    format_percentaje(percentaje),  # type: ignore
+                    iterations,
+                ]
+            )
 
     return data
 
@@ -118,11 +154,12 @@ def prepare_row(
     load,
     stress: float,
     percentaje: float,
-    method: Literal["bi-directional", "one-direction", "compare"],
+    method: Literal["bi-directional", "one-direction", "compare", "exact"],
     max_stress: float,
     limit: float | None,
     no_loads: bool,
     no_color: bool,
+    diagnostics: dict[str, Any] | None = None,
 ) -> tuple[Text]:
     """Prepare a single row for the output table.
 
@@ -132,21 +169,22 @@ def prepare_row(
 
     Args:
         i (int): The index of the row.
-        load: The load object containing user_load and other attributes.
+        load (LoadRow): The load, with its name and forces.
         stress (float): The stress value for the current load.
         percentaje (float): The percentage value for the current load.
-        method (str): The analysis method ("bi-direction", "one-direction", "compare").
+        method (str): The analysis method ("bi-direction", "one-direction", "compare", "exact").
         max_stress (float): The maximum stress value among all loads.
         limit (float | None): An optional limit value for stress or percentage.
         no_loads (bool): Whether to exclude load details in the row.
         no_color (bool): Whether to exclude color formatting.
+        diagnostics (dict[str, Any] | None): Solver diagnostics of the load, as the iterations of the exact method.
 
     Returns:
         tuple[Text]: The prepared row as a tuple of Text objects.
     """
     row = [
         Text(f"{i:02}", style="bold"),
-        Text(f"{load.user_load.name}", style="bold") if load.user_load.name is not None else None,
+        Text(f"{load.name}", style="bold") if load.name is not None else None,
     ]
 
     if not no_loads:
@@ -160,28 +198,43 @@ def prepare_row(
             ]
         )
 
-    extra_data = format_rows(stress, percentaje, method, max_stress, limit, no_color)  # type: ignore
+    extra_data = format_rows(stress, percentaje, method, max_stress, limit, no_color, diagnostics)  # type: ignore
     row.extend(extra_data)
 
     return tuple(row)
 
 
-def display_page(start_idx: int, end_idx: int, all_rows: list[tuple[Any, ...]], table) -> None:
+def paginate(rows: Iterable[tuple[Any, ...]], rows_per_page: int) -> Iterator[list[tuple[Any, ...]]]:
+    """Split rows into pages.
+
+    Rows are pulled from the iterable only when their page is requested, so a generator of rows is computed and
+    formatted one page at a time.
+
+    Args:
+        rows (Iterable[tuple[Any, ...]]): Rows to split, usually a generator.
+        rows_per_page (int): Maximum number of rows by page.
+
+    Yields:
+        list[tuple[Any, ...]]: The rows of every page, in order.
+    """
+    iterator = iter(rows)
+    while page := list(islice(iterator, rows_per_page)):
+        yield page
+
+
+def display_page(rows: list[tuple[Any, ...]], table) -> None:
     """Display a page of rows in the output table.
 
-    This function takes a range of indices and adds the corresponding rows to the table.
-    The table with these rows is then displayed on the console.
+    This function adds the rows to the table and then displays it on the console.
 
     Args:
-        start_idx (int): The starting index for the range of rows to be displayed.
-        end_idx (int): The ending index for the range of rows to be displayed.
-        all_rows (list[tuple[Any, ...]]): The list containing all the rows.
+        rows (list[tuple[Any, ...]]): The rows of the page.
         table: The table object where the rows will be added.
 
     Returns:
         None: The function outputs the table to the console and returns None.
     """
-    for row in all_rows[start_idx:end_idx]:
+    for row in rows:
         table.add_row(*row)
     console.print(table)
 
@@ -0,0 +1,49 @@
+"""Test for batch analysis module."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.analysis.batch import analyze_foundations, governing_results
+from fastruct.foundations.analysis.vectorized import bi_direction_arrays
+
+
+def foundation_data(seed: int, size: int) -> tuple[float, float, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Random foundation geometry and loads."""
+    rng = np.random.default_rng(seed)
+    lx, ly = rng.uniform(1, 4, 2)
+    p, mx, my = rng.uniform(1, 50, size), rng.uniform(-30, 30, size), rng.uniform(-30, 30, size)
+    return lx, ly, np.arange(1, size + 1), p, mx, my
+
+
+def test_governing_results() -> None:
+    """Maximum stress and minimum percentaje with the IDs of their loads."""
+    lx, ly, load_ids, p, mx, my = foundation_data(seed=0, size=200)
+    stresses, percentajes = bi_direction_arrays(lx, ly, p, mx, my)
+
+    max_stress, max_stress_id, min_percentaje, min_percentaje_id, without_solution = governing_results(
+        "bi-direction", lx, ly, load_ids, p, mx, my
+    )
+
+    assert max_stress == np.nanmax(stresses)
+    assert stresses[max_stress_id - 1] == max_stress
+    assert min_percentaje == percentajes.min()
+    assert percentajes[min_percentaje_id - 1] == min_percentaje
+    assert without_solution == np.isnan(stresses).sum()
+
+
+def test_governing_results_without_loads() -> None:
+    """Foundations without loads have no governing results."""
+    empty = np.array([])
+    assert governing_results("exact", 1, 1, empty, empty, empty, empty) == (None, None, None, None, 0)
+
+
+@pytest.mark.parametrize("method", ["bi-direction", "one-direction", "exact"])
+def test_analyze_foundations_in_parallel(method: str) -> None:
+    """Worker processes give the same results as the current process."""
+    foundations = [foundation_data(seed, size=50) for seed in range(6)]
+    assert analyze_foundations(method, foundations, workers=2) == analyze_foundations(method, foundations, workers=1)
+
+
+def test_analyze_foundations_unknown_method() -> None:
+    """Only methods with a single result per load are supported."""
+    with pytest.raises(ValueError, match="Unkwnown method: compare"):
+        analyze_foundations("compare", [foundation_data(seed=0, size=5)])
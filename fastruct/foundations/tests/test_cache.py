@@ -0,0 +1,78 @@
+"""Test for foundations analysis results cache module."""
+from collections.abc import Iterator
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fastruct.foundations.cache import get_cached_results, invalidate_results, results_key, store_results
+from fastruct.models.db import BaseModel
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+from fastruct.models.user_load import UserLoad
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Session over an empty in-memory database."""
+    engine = create_engine("sqlite:///:memory:")
+    BaseModel.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def foundation(session: Session) -> Foundation:
+    """Foundation with a single load."""
+    foundation = Foundation(lx=2, ly=2, lz=1, depth=1.5, ex=0, ey=0, col_x=0.5, col_y=0.5)
+    user_load = UserLoad(foundation=foundation, p=10, vx=1, vy=2, mx=3, my=4)
+    session.add(Load(foundation=foundation, user_load=user_load, p=10, vx=1, vy=2, mx=3, my=4))
+    session.flush()
+    return foundation
+
+
+def test_results_key(foundation: Foundation) -> None:
+    """The key changes with the method, the geometry and the loads."""
+    key = results_key(foundation, "bi-direction")
+
+    assert results_key(foundation, "bi-direction") == key
+    assert results_key(foundation, "exact") != key
+    foundation.lz = 1.2
+    assert results_key(foundation, "bi-direction") != key
+    foundation.lz = 1
+    foundation.loads[0].mx = 5
+    assert results_key(foundation, "bi-direction") != key
+
+
+def test_store_and_get_results(session: Session, foundation: Foundation) -> None:
+    """Stored results come back as stored while the key matches, and are replaced by newer ones."""
+    store_results(session, foundation.id, "compare", "key", [(1.0, None, 2.0)], [(100.0, 80.0, 90.0)])
+    assert get_cached_results(session, foundation.id, "compare", "key") == (
+        [(1.0, None, 2.0)],
+        [(100.0, 80.0, 90.0)],
+        {},
+    )
+    assert get_cached_results(session, foundation.id, "compare", "stale") is None
+    assert get_cached_results(session, foundation.id, "exact", "key") is None
+
+    store_results(session, foundation.id, "compare", "new", [(3.0, 4.0, 5.0)], [(100.0, 100.0, 100.0)])
+    assert get_cached_results(session, foundation.id, "compare", "key") is None
+    assert get_cached_results(session, foundation.id, "compare", "new") == (
+        [(3.0, 4.0, 5.0)],
+        [(100.0, 100.0, 100.0)],
+        {},
+    )
+
+
+def test_store_and_get_diagnostics(session: Session, foundation: Foundation) -> None:
+    """Solver diagnostics are stored apart from the results."""
+    diagnostics = {"iterations": [4, 200], "converged": [True, False]}
+    store_results(session, foundation.id, "exact", "key", [1.5, None], [80.0, None], diagnostics)
+    assert get_cached_results(session, foundation.id, "exact", "key") == ([1.5, None], [80.0, None], diagnostics)
+
+
+def test_invalidate_results(session: Session, foundation: Foundation) -> None:
+    """Invalidated foundations have no stored results."""
+    store_results(session, foundation.id, "bi-direction", "key", [None], [0.0])
+    invalidate_results(session, [foundation.id])
+    assert get_cached_results(session, foundation.id, "bi-direction", "key") is None
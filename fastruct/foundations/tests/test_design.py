@@ -0,0 +1,68 @@
+"""Test foundations flexural design."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.design import (
+    get_ultimate_moments,
+    moment_envelope,
+    ultimate_moment_arrays,
+    ultimate_moment_by_direction,
+)
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+
+
+@pytest.fixture
+def foundation() -> Foundation:
+    """Foundation with an eccentric column."""
+    return Foundation(lx=2.5, ly=2, lz=0.6, depth=1.5, ex=0.2, ey=-0.1, col_x=0.4, col_y=0.5)
+
+
+def test_ultimate_moment_arrays_match_per_load_design(foundation: Foundation) -> None:
+    """Vectorized moments match the per-load functions wherever these have a solution."""
+    rng = np.random.default_rng(1)
+    p = rng.uniform(10, 100, 500)
+    mx, my = rng.uniform(-20, 20, (2, 500))
+    moments = ultimate_moment_arrays(foundation, p, mx, my)
+
+    checked = 0
+    for i in range(len(p)):
+        try:
+            (x_left, x_right), (y_left, y_right) = ultimate_moment_by_direction(
+                foundation, Load(p=p[i], mx=mx[i], my=my[i])
+            )
+        except TypeError:  # Loads without solution
+            assert np.isnan(moments[i]).any()
+            continue
+
+        expected = [np.nan if value is None else value for value in (x_left, x_right, y_left, y_right)]
+        np.testing.assert_allclose(moments[i], expected, rtol=1e-12)
+        checked += 1
+    assert checked > 100
+
+
+def test_get_ultimate_moments_accepts_loadset(foundation: Foundation) -> None:
+    """Moments of a load set are returned by direction and side, with None where there is no solution."""
+    loads = LoadSet.from_rows([(1, 1, None, 50.0, 0, 0, 5.0, -3.0), (2, 2, None, 10.0, 0, 0, 0.0, 9.0)])
+    moments = get_ultimate_moments(foundation, loads)
+    (x_left, x_right), (y_left, y_right) = moments[0]
+    assert None not in (x_left, x_right, y_left, y_right)
+    assert moments[1][0] == (None, None)
+
+
+def test_moment_envelope() -> None:
+    """Envelope keeps the largest positive moment of every side and its load."""
+    moments = np.array(
+        [
+            [1.0, np.nan, -2.0, np.nan],
+            [3.0, 2.0, -1.0, np.nan],
+            [2.0, 5.0, -3.0, np.nan],
+        ]
+    )
+    maximum, governing = moment_envelope(moments)
+    np.testing.assert_array_equal(maximum, [3.0, 5.0, np.nan, np.nan])
+    np.testing.assert_array_equal(governing, [1, 2, -1, -1])
+
+    maximum, governing = moment_envelope(np.empty((0, 4)))
+    assert np.isnan(maximum).all() and (governing == -1).all()
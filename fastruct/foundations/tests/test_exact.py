@@ -0,0 +1,77 @@
+"""Test for exact analysis module."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.analysis.exact import compressed_zone_moments, exact_arrays, pressure_planes
+
+
+@pytest.mark.parametrize(
+    "lx, ly, p, excentricity", [(2.0, 3.0, 10.0, 0.5), (3.0, 1.0, 25.0, 0.9), (1.0, 1.0, 5.0, 0.2)]
+)
+def test_exact_uniaxial_triangular_distribution(lx: float, ly: float, p: float, excentricity: float) -> None:
+    """Past the kern in one direction the exact solution is the triangular distribution."""
+    stresses, percentajes, iterations = exact_arrays(
+        lx, ly, np.array([p]), np.array([0.0]), np.array([p * excentricity])
+    )
+    compressed_width = 3 * (lx / 2 - excentricity)
+
+    assert stresses[0] == pytest.approx(2 * p / (3 * ly * (lx / 2 - excentricity)))
+    assert percentajes[0] == pytest.approx(100 * compressed_width / lx)
+    assert iterations[0] > 1
+
+
+def test_exact_inside_kern_is_elastic() -> None:
+    """Loads inside the kern keep the elastic distribution and converge in the first iteration."""
+    p, mx, my = np.array([10.0, 20.0, 30.0]), np.array([0.0, 1.0, -2.0]), np.array([0.0, -1.0, 1.0])
+
+    stresses, percentajes, iterations = exact_arrays(2.0, 3.0, p, mx, my)
+    elastic_stresses = p / 6 + 6 * np.abs(my) / (3 * 2**2) + 6 * np.abs(mx) / (2 * 3**2)
+
+    np.testing.assert_allclose(stresses, elastic_stresses)
+    np.testing.assert_array_equal(percentajes, 100)
+    np.testing.assert_array_equal(iterations, 1)
+
+
+def test_exact_equilibrium() -> None:
+    """The converged pressures balance the axial force and both moments."""
+    rng = np.random.default_rng(0)
+    lx, ly = 2.0, 3.0
+    p = rng.uniform(1, 50, 1000)
+    ex, ey = rng.uniform(-0.45, 0.45, 1000) * lx, rng.uniform(-0.45, 0.45, 1000) * ly
+
+    planes, compressed_area, iterations = pressure_planes(lx, ly, p, p * ey, p * ex)
+
+    assert not np.isnan(planes).any()
+    assert (iterations < 50).all()
+    assert ((compressed_area > 0) & (compressed_area <= lx * ly)).all()
+
+    moments = compressed_zone_moments(lx, ly, *planes.T)
+    resultant = (moments @ planes[..., None])[..., 0]
+    np.testing.assert_allclose(resultant, np.stack([p, p * ex, -p * np.abs(ey)], axis=-1), rtol=1e-7, atol=1e-7)
+
+
+@pytest.mark.parametrize("p, mx, my", [(-10, 1, 1), (0, 1, 1), (10, 0, 10), (10, 15, 0)])
+def test_exact_without_equilibrium(p: float, mx: float, my: float) -> None:
+    """Tension or loads outside the foundation have no solution."""
+    stresses, percentajes, iterations = exact_arrays(2.0, 3.0, np.array([p]), np.array([mx]), np.array([my]))
+    assert np.isnan(stresses[0])
+    assert percentajes[0] == 0
+    assert iterations[0] == 0
+
+
+def test_exact_not_converged() -> None:
+    """Loads the solver does not converge for have no stress nor percentaje."""
+    stresses, percentajes, iterations = exact_arrays(
+        2.0, 3.0, np.array([10.0, 10.0]), np.array([0.0, 0.0]), np.array([0.0, 8.0]), max_iterations=1
+    )
+    assert stresses[0] == pytest.approx(10 / 6)
+    assert percentajes[0] == 100
+    assert np.isnan(stresses[1])
+    assert np.isnan(percentajes[1])
+    np.testing.assert_array_equal(iterations, 1)
+
+
+def test_compressed_zone_moments_full_rectangle() -> None:
+    """Moments of the whole rectangle."""
+    moments = compressed_zone_moments(2.0, 3.0, np.array([1.0]), np.array([0.0]), np.array([0.0]))
+    np.testing.assert_allclose(moments[0], np.diag([6.0, 2**3 * 3 / 12, 2 * 3**3 / 12]), atol=1e-12)
@@ -0,0 +1,90 @@
+"""Test analysis results export."""
+import io
+import json
+
+import pytest
+
+from fastruct.foundations.export import export_results, results_columns, write_parquet
+from fastruct.loads.loadset import LoadSet
+
+
+@pytest.fixture()
+def loads():
+    """Two loads at the seal level."""
+    return LoadSet.from_rows([(1, 7, "D+L", 10.0, 1.0, 0.0, 2.0, 0.5), (2, 9, None, 5.0, 0.0, 1.0, -1.0, 3.0)])
+
+
+def test_results_columns_by_method(loads):
+    """Test results by load are split in one column by value of the method."""
+    columns = results_columns([1, 2], loads, [(1.5, None), (2.5, 3.0)], [(100.0, 0.0), (90.0, 80.0)], "one-direction")
+    assert list(columns) == [
+        "number",
+        "load_id",
+        "name",
+        "p",
+        "vx",
+        "vy",
+        "mx",
+        "my",
+        "stress_x",
+        "stress_y",
+        "percentaje_x",
+        "percentaje_y",
+    ]
+    assert columns["load_id"] == [7, 9]
+    assert columns["name"] == ["D+L", None]
+    assert columns["stress_y"] == [None, 3.0]
+    assert columns["percentaje_x"] == [100.0, 90.0]
+
+
+def test_export_csv(loads):
+    """Test CSV has a header and missing values are empty fields."""
+    columns = results_columns([1, 2], loads, [None, 2.5], [0.0, 100.0], "bi-direction")
+    stream = io.StringIO()
+    export_results(columns, "csv", stream)
+    assert stream.getvalue().splitlines() == [
+        "number,load_id,name,p,vx,vy,mx,my,stress,percentaje",
+        "1,7,D+L,10.0,1.0,0.0,2.0,0.5,,0.0",
+        "2,9,,5.0,0.0,1.0,-1.0,3.0,2.5,100.0",
+    ]
+
+
+def test_export_jsonl(loads):
+    """Test JSON Lines has an object by load and missing values are null."""
+    diagnostics = {"iterations": [200, 3], "converged": [False, True]}
+    columns = results_columns([1, 2], loads, [None, 2.5], [None, 100.0], "exact", diagnostics)
+    stream = io.StringIO()
+    export_results(columns, "jsonl", stream)
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records[0]["stress"] is None
+    assert records[1] == {
+        "number": 2,
+        "load_id": 9,
+        "name": None,
+        "p": 5.0,
+        "vx": 0.0,
+        "vy": 1.0,
+        "mx": -1.0,
+        "my": 3.0,
+        "stress": 2.5,
+        "percentaje": 100.0,
+        "iterations": 3,
+        "converged": True,
+    }
+
+
+def test_export_parquet_is_not_a_stream_format(loads):
+    """Test Parquet can't be written to a text stream."""
+    columns = results_columns([1, 2], loads, [None, 2.5], [0.0, 100.0], "bi-direction")
+    with pytest.raises(ValueError):
+        export_results(columns, "parquet", io.StringIO())
+
+
+def test_write_parquet(loads, tmp_path):
+    """Test Parquet keeps the schema and missing values."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    columns = results_columns([1, 2], loads, [None, 2.5], [0.0, 100.0], "bi-direction")
+    write_parquet(columns, tmp_path / "results.parquet")
+    table = pq.read_table(tmp_path / "results.parquet")
+    assert str(table.schema.field("load_id").type) == "int64"
+    assert table.column("stress").to_pylist() == [None, 2.5]
@@ -6,3 +6,62 @@ import pytest
 from shapely.geometry import Polygon
 
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
+
+from fastruct.foundations.analysis.bi_direction import (  # noqa: E402
+    compressed_area_and_centroid,
+    get_bi_directional_percentaje_and_stress,
+)
+from fastruct.models.foundation import Foundation  # noqa: E402
+from fastruct.models.load import Load  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "a, b, c",
+    [
+        (1, 0, 0),
+        (-1, 0, 0),
+        (0, 1, 0),
+        (1, -2, 0.5),
+        (2, -1, -1),
+        (0.3, 1.5, -3),
+    ],
+)
+def test_compressed_area_and_centroid(a: float, b: float, c: float) -> None:
+    """The analytic compressed zone of a 4x2 rectangle matches the clipped shapely polygon."""
+    area, centroid = compressed_area_and_centroid(4, 2, a, b, c)
+    rectangle = Polygon([(-2, -1), (2, -1), (2, 1), (-2, 1)])
+    if b == 0 and c == 0:
+        expected = rectangle if a >= 0 else Polygon()
+    else:
+        # Large polygon covering the half-plane near the rectangle
+        norm = b**2 + c**2
+        x0, y0 = -a * b / norm, -a * c / norm
+        dx, dy = -c * 100, b * 100
+        nx, ny = b * 100, c * 100
+        half_plane = Polygon(
+            [(x0 - dx, y0 - dy), (x0 + dx, y0 + dy), (x0 + dx + nx, y0 + dy + ny), (x0 - dx + nx, y0 - dy + ny)]
+        )
+        expected = rectangle.intersection(half_plane)
+
+    assert area == pytest.approx(expected.area)
+    if expected.area:
+        assert centroid == pytest.approx((expected.centroid.x, expected.centroid.y))
+    else:
+        assert centroid is None
+
+
+@pytest.mark.parametrize(
+    "p, mx, my",
+    [(20, 8, 0), (20, 0, 10), (20, -8, 12), (15, 9, -6), (30, -12, -15)],
+)
+def test_analytic_solver_matches_shapely_cross_check(p: float, mx: float, my: float) -> None:
+    """The analytic solver and the shapely cross-check mode give the same results."""
+    foundation = Foundation(lx=2, ly=2, lz=1, depth=1)
+    load = Load(p=p, mx=mx, my=my)
+
+    stress, percentaje = get_bi_directional_percentaje_and_stress(foundation, load)
+    expected_stress, expected_percentaje = get_bi_directional_percentaje_and_stress(foundation, load, True)
+
+    assert percentaje < 100
+    assert stress == pytest.approx(expected_stress, rel=1e-5)
+    assert percentaje == pytest.approx(expected_percentaje, abs=1e-4)
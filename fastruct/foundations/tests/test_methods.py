@@ -0,0 +1,68 @@
+"""Test for foundations analysis methods registry module."""
+import pytest
+
+from fastruct.foundations.analysis.exact import exact_analysis
+from fastruct.foundations.analysis.methods import (
+    METHODS,
+    available_methods,
+    get_diagnosed_method,
+    get_method,
+    register,
+)
+from fastruct.foundations.analysis.vectorized import vectorized_bi_direction_analysis, vectorized_one_direction_analysis
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+
+
+@pytest.fixture
+def foundation() -> Foundation:
+    """Foundation with loads inside and outside the kern."""
+    foundation = Foundation(lx=2, ly=3, lz=1, depth=1)
+    foundation.loads = [Load(p=10, mx=1, my=1), Load(p=20, mx=8, my=-5), Load(p=5, mx=0, my=0)]
+    return foundation
+
+
+def test_builtin_methods() -> None:
+    """Built-in engines are registered under their method names."""
+    assert {"bi-direction", "one-direction", "compare", "exact"} <= set(available_methods())
+    assert get_method("bi-direction") is vectorized_bi_direction_analysis
+    assert get_method("one-direction") is vectorized_one_direction_analysis
+    assert get_method("exact") is exact_analysis
+
+
+def test_unknown_method() -> None:
+    """Unknown methods are rejected."""
+    with pytest.raises(ValueError, match="Unkwnown method: unknown"):
+        get_method("unknown")
+
+
+def test_compare_runs_both_methods(foundation: Foundation) -> None:
+    """Compare puts the bi-direction and one-direction results side by side."""
+    stresses, percentajes = get_method("compare")(foundation)
+    bi_stresses, bi_percentajes = vectorized_bi_direction_analysis(foundation)
+    one_stresses, one_percentajes = vectorized_one_direction_analysis(foundation)
+
+    assert stresses == [(s1, *s2) for s1, s2 in zip(bi_stresses, one_stresses, strict=True)]
+    assert percentajes == [(p1, *p2) for p1, p2 in zip(bi_percentajes, one_percentajes, strict=True)]
+
+
+def test_register(foundation: Foundation, monkeypatch: pytest.MonkeyPatch) -> None:
+    """New engines register themselves with the decorator."""
+    monkeypatch.setattr("fastruct.foundations.analysis.methods.METHODS", dict(METHODS))
+
+    @register("constant")
+    def constant_analysis(foundation: Foundation) -> tuple[list, list]:
+        return [1.0] * len(foundation.loads), [100.0] * len(foundation.loads)
+
+    assert get_method("constant")(foundation) == ([1.0, 1.0, 1.0], [100.0, 100.0, 100.0])
+
+
+def test_diagnosed_methods(foundation: Foundation) -> None:
+    """The exact method reports its solver diagnostics apart from the results, and the other methods none."""
+    stresses, percentajes, diagnostics = get_diagnosed_method("exact")(foundation)
+    assert (stresses, percentajes) == exact_analysis(foundation)
+    assert all(isinstance(percentaje, float) for percentaje in percentajes)
+    assert set(diagnostics) == {"iterations", "converged"}
+    assert len(diagnostics["iterations"]) == len(foundation.loads)
+
+    assert get_diagnosed_method("bi-direction")(foundation) == (*vectorized_bi_direction_analysis(foundation), {})
@@ -0,0 +1,70 @@
+"""Test for foundations optimization module."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.analysis.batch import governing_arrays
+from fastruct.foundations.optimization import candidate_geometries, dimension_range, optimize_foundation
+from fastruct.models.foundation import Foundation
+
+
+def random_user_loads(seed: int, size: int) -> tuple[np.ndarray, ...]:
+    """Random user loads (p, vx, vy, mx, my)."""
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0, 60, size), *rng.uniform(-3, 3, (2, size)), *rng.uniform(-15, 15, (2, size)))
+
+
+def brute_force(
+    foundation: Foundation, user_loads: tuple, candidates: np.ndarray, stress_limit: float, min_percentaje: float
+) -> np.ndarray | None:
+    """First candidate that satisfies the limits, analyzing each one with its own foundation."""
+    for lx, ly, lz in candidates:
+        candidate = Foundation(
+            lx=lx, ly=ly, lz=lz, depth=foundation.depth, ex=foundation.ex, ey=foundation.ey, col_x=0.4, col_y=0.4
+        )
+        p, mx, my = np.array([candidate.load_at_seal(*load) for load in zip(*user_loads, strict=True)])[:, [0, 3, 4]].T
+        stresses, percentajes = governing_arrays("bi-direction", lx, ly, p, mx, my)
+        if not np.isnan(stresses).any() and stresses.max() <= stress_limit and percentajes.min() >= min_percentaje:
+            return np.array([lx, ly, lz])
+    return None
+
+
+def test_candidate_geometries() -> None:
+    """Candidates are ranked by volume and heights over the depth are discarded."""
+    candidates = candidate_geometries(dimension_range(1, 2, 0.5), dimension_range(1, 2, 0.5), np.array([0.5, 2]), 1.5)
+    volumes = candidates.prod(axis=-1)
+
+    assert candidates.shape == (9, 3)
+    assert (np.diff(volumes) >= 0).all()
+    assert (candidates[:, 2] == 0.5).all()
+
+
+@pytest.mark.parametrize("stress_limit, min_percentaje", [(20, 80), (30, 100), (15, 50)])
+def test_optimize_foundation_matches_brute_force(stress_limit: float, min_percentaje: float) -> None:
+    """The optimizer finds the same geometry as analyzing every candidate in order."""
+    foundation = Foundation(lx=1, ly=1, lz=0.5, depth=1.5, ex=0.1, ey=-0.2, col_x=0.4, col_y=0.4)
+    user_loads = random_user_loads(seed=0, size=300)
+    candidates = candidate_geometries(
+        dimension_range(1, 4, 0.25), dimension_range(1, 4, 0.25), dimension_range(0.5, 1.5, 0.25), foundation.depth
+    )
+
+    geometry, max_stress, min_lift, analyzed = optimize_foundation(
+        foundation, user_loads, candidates, stress_limit, min_percentaje, batch_size=5_000
+    )
+
+    np.testing.assert_allclose(geometry, brute_force(foundation, user_loads, candidates, stress_limit, min_percentaje))
+    assert max_stress <= stress_limit
+    assert min_lift >= min_percentaje
+    assert analyzed < len(candidates)
+
+
+def test_optimize_foundation_without_solution() -> None:
+    """No geometry within the bounds satisfies an impossible stress limit."""
+    foundation = Foundation(lx=1, ly=1, lz=0.5, depth=1.5, ex=0, ey=0, col_x=0.4, col_y=0.4)
+    candidates = candidate_geometries(dimension_range(1, 2, 0.5), dimension_range(1, 2, 0.5), np.array([0.5]), 1.5)
+
+    assert optimize_foundation(foundation, random_user_loads(seed=1, size=50), candidates, 1, 80) == (
+        None,
+        None,
+        None,
+        0,
+    )
@@ -0,0 +1,50 @@
+"""Test for governing loads prefilter module."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.analysis.prefilter import compressed_area_bounds, governing_candidates
+from fastruct.foundations.analysis.vectorized import bi_direction_arrays, compressed_zone
+
+
+def random_loads(seed: int, size: int, scale: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Random loads with eccentricities up to `scale` times the kern, plus their sign permutations."""
+    rng = np.random.default_rng(seed)
+    p = rng.uniform(20, 80, size)
+    mx, my = rng.normal(0, scale, (2, size)) * p / 6
+    return np.tile(p, 4), np.concatenate([mx, -mx, mx, -mx]), np.concatenate([my, my, -my, -my])
+
+
+@pytest.mark.parametrize("lx, ly", [(2.0, 3.0), (1.0, 1.0), (4.0, 1.5)])
+@pytest.mark.parametrize("scale", [0.3, 1.0, 2.0, 6.0])
+def test_governing_candidates_keep_governing_loads(lx: float, ly: float, scale: float) -> None:
+    """Analyzing the kept loads gives the same governing values and loads as analyzing all of them."""
+    p, mx, my = random_loads(seed=int(10 * scale), size=2_500, scale=scale)
+
+    kept = np.flatnonzero(governing_candidates(lx, ly, p, mx, my))
+    stresses, percentajes = bi_direction_arrays(lx, ly, p, mx, my)
+    kept_stresses, kept_percentajes = bi_direction_arrays(lx, ly, p[kept], mx[kept], my[kept])
+
+    assert len(kept) < len(p) / 10
+    assert kept[np.argmin(kept_percentajes)] == np.argmin(percentajes)
+    assert kept_percentajes.min() == percentajes.min()
+    if not np.isnan(stresses).all():
+        assert kept[np.nanargmax(kept_stresses)] == np.nanargmax(stresses)
+        assert np.nanmax(kept_stresses) == np.nanmax(stresses)
+
+
+def test_governing_candidates_without_loads() -> None:
+    """No loads, nothing to keep."""
+    assert governing_candidates(1, 1, np.array([]), np.array([]), np.array([])).shape == (0,)
+
+
+def test_compressed_area_bounds() -> None:
+    """The compressed area of every load lies between its bounds."""
+    rng = np.random.default_rng(0)
+    lx, ly = 2.0, 3.0
+    ex, ey = rng.uniform(-lx / 2, lx / 2, 1000), rng.uniform(-ly / 2, ly / 2, 1000)
+
+    min_area, max_area = compressed_area_bounds(lx, ly, np.abs(ex), np.abs(ey), grid_size=16)
+    area, _, _ = compressed_zone(lx, ly, np.ones(1000), ex / (lx**2 / 12), -np.abs(ey) / (ly**2 / 12))
+
+    assert (min_area <= area + 1e-12).all()
+    assert (area <= max_area + 1e-12).all()
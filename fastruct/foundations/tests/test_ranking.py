@@ -0,0 +1,53 @@
+"""Test governing loads ranking."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.ranking import governing_indices, ranking_keys, top_indices
+
+
+def test_top_indices_match_full_sort():
+    """Test the partial selection returns the same loads as a full sort."""
+    keys = np.random.default_rng(0).normal(size=1000)
+    for k in (1, 10, 1000, 2000):
+        np.testing.assert_array_equal(top_indices(keys, k), np.argsort(keys)[:k])
+    assert top_indices(keys, 0).size == 0
+
+    ties = np.random.default_rng(0).integers(0, 5, size=1000).astype(np.float64)
+    for k in (1, 10, 500, 1000):
+        np.testing.assert_array_equal(top_indices(ties, k), np.argsort(ties, kind="stable")[:k])
+
+
+def test_governing_indices_by_stress():
+    """Test stresses rank descending, with the loads without solution first."""
+    stresses = [1.0, None, 3.0, 2.0]
+    percentajes = [100.0, 0.0, 50.0, 80.0]
+    assert governing_indices(stresses, percentajes, "stress", 3) == [1, 2, 3]
+
+
+def test_governing_indices_by_percentaje():
+    """Test percentajes rank ascending by the smallest value of every load."""
+    percentajes = [(100.0, 90.0), (70.0, 100.0), (80.0, 85.0)]
+    stresses = [(1.0, 2.0), (3.0, None), (1.0, 1.0)]
+    assert governing_indices(stresses, percentajes, "percentaje", 2) == [1, 2]
+    assert governing_indices(stresses, percentajes, "stress", 1) == [1]
+
+
+def test_ranking_keys_without_percentaje():
+    """Test loads without percentaje, as the ones the exact solver did not converge for, rank first."""
+    keys = ranking_keys([1.0, None, 2.0], [90.0, None, 50.0], "percentaje")
+    assert top_indices(keys, 3).tolist() == [1, 2, 0]
+
+
+def test_ranking_keys_unknown_order():
+    """Test an unknown order raises ValueError."""
+    with pytest.raises(ValueError):
+        ranking_keys([1.0], [100.0], "lift")
+
+
+def test_governing_indices_full_order_with_missing_component():
+    """Test every load is ranked, as the first `k` ones, when a component of a load has no solution."""
+    stresses = [(1.0, 2.0), (3.0, None), (4.0, 1.0), (0.5, 0.5)]
+    percentajes = [(100.0, 90.0), (70.0, None), (80.0, 85.0), (100.0, 100.0)]
+    assert governing_indices(stresses, percentajes, "stress", len(stresses)) == [1, 2, 0, 3]
+    assert governing_indices(stresses, percentajes, "stress", 2) == [1, 2]
+    assert governing_indices(stresses, percentajes, "percentaje", len(percentajes)) == [1, 2, 0, 3]
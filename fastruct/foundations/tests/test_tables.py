@@ -0,0 +1,24 @@
+"""Test tables helpers."""
+from fastruct.foundations.tables import paginate
+
+
+def test_paginate_splits_rows():
+    """Test every row is in a page, in order, and only the last page may be shorter."""
+    rows = [(i,) for i in range(7)]
+    assert list(paginate(rows, 3)) == [rows[:3], rows[3:6], rows[6:]]
+    assert list(paginate([], 3)) == []
+
+
+def test_paginate_is_lazy():
+    """Test rows are only pulled from the generator when their page is requested."""
+    pulled = []
+
+    def rows():
+        for i in range(10):
+            pulled.append(i)
+            yield (i,)
+
+    pages = paginate(rows(), 4)
+    assert pulled == []
+    assert next(pages) == [(0,), (1,), (2,), (3,)]
+    assert pulled == [0, 1, 2, 3]
@@ -0,0 +1,110 @@
+"""Test for vectorized analysis module."""
+from random import Random
+
+import numpy as np
+import pytest
+
+from fastruct.foundations.analysis.bi_direction import get_bi_directional_percentaje_and_stress
+from fastruct.foundations.analysis.one_direction import get_percentaje_by_direction, get_stress_by_direction
+from fastruct.foundations.analysis.vectorized import (
+    bi_direction_arrays,
+    compressed_zone,
+    one_direction_arrays,
+    solver_case_counts,
+    solver_cases,
+)
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+
+
+def random_loads(seed: int, size: int) -> list[tuple[float, float, float]]:
+    """Random (p, mx, my) loads covering every stress distribution."""
+    rng = Random(seed)
+    return [(rng.uniform(-5, 50), rng.uniform(-40, 40), rng.uniform(-40, 40)) for _ in range(size)]
+
+
+@pytest.mark.parametrize("lx, ly", [(1.0, 1.0), (2.0, 3.0), (4.0, 1.5)])
+def test_bi_direction_arrays_match_per_load_analysis(lx: float, ly: float) -> None:
+    """Vectorized results must match the per-load shapely analysis."""
+    loads = [*random_loads(seed=1, size=500), (10, 0, 0), (10, 5, 0), (10, 0, -5), (-10, 0.1, 0.2), (10, 0.1, 30)]
+    foundation = Foundation(lx=lx, ly=ly, lz=1, depth=1)
+    p, mx, my = (np.array(values) for values in zip(*loads, strict=True))
+
+    stresses, percentajes = bi_direction_arrays(lx, ly, p, mx, my)
+
+    for (axial, moment_x, moment_y), stress, percentaje in zip(loads, stresses, percentajes, strict=True):
+        load = Load(p=axial, mx=moment_x, my=moment_y)
+        expected_stress, expected_percentaje = get_bi_directional_percentaje_and_stress(foundation, load, True)
+        if expected_stress is None:
+            assert np.isnan(stress)
+        else:
+            assert stress == pytest.approx(expected_stress, rel=1e-5)
+        assert percentaje == pytest.approx(expected_percentaje, abs=1e-4)
+
+
+def test_bi_direction_arrays_zero_axial() -> None:
+    """Loads without axial force have no solution instead of raising."""
+    stresses, percentajes = bi_direction_arrays(1, 1, np.array([0.0, 0.0]), np.array([1.0, 0.0]), np.array([1.0, 0.0]))
+    assert np.isnan(stresses).all()
+    assert (percentajes == 0).all()
+
+
+def test_bi_direction_arrays_broadcast_geometry() -> None:
+    """Geometry arrays broadcast against the load arrays."""
+    p, mx, my = (np.array(values) for values in zip(*random_loads(seed=2, size=50), strict=True))
+    lx = np.array([[1.0], [2.0]])
+    stresses, percentajes = bi_direction_arrays(lx, 2.0, p, mx, my)
+    assert stresses.shape == percentajes.shape == (2, 50)
+    np.testing.assert_array_equal(percentajes[1], bi_direction_arrays(2.0, 2.0, p, mx, my)[1])
+
+
+@pytest.mark.parametrize("lx, ly", [(1.0, 1.0), (2.0, 3.0)])
+def test_one_direction_arrays_match_per_load_analysis(lx: float, ly: float) -> None:
+    """Vectorized results must match the per-load one direction analysis, NaN standing for None."""
+    loads = [*random_loads(seed=3, size=500), (10, 0, 0), (0, 1, 1), (-10, 0.1, 0.2)]
+    foundation = Foundation(lx=lx, ly=ly, lz=1, depth=1)
+    p, mx, my = (np.array(values) for values in zip(*loads, strict=True))
+
+    stresses, percentajes = one_direction_arrays(lx, ly, p, mx, my)
+
+    assert stresses.shape == (len(loads), 4)
+    assert percentajes.shape == (len(loads), 2)
+    for (axial, moment_x, moment_y), stress, percentaje in zip(loads, stresses, percentajes, strict=True):
+        load = Load(p=axial, mx=moment_x, my=moment_y)
+        if axial == 0:
+            continue
+        expected_stress = [np.nan if value is None else value for value in get_stress_by_direction(foundation, load)]
+        np.testing.assert_allclose(stress, expected_stress, rtol=1e-12)
+        np.testing.assert_allclose(percentaje, get_percentaje_by_direction(foundation, load), rtol=1e-12)
+
+
+def test_one_direction_arrays_invalid_width() -> None:
+    """Widths are validated once for the whole batch."""
+    with pytest.raises(ValueError, match="width can't be negative nor zero."):
+        one_direction_arrays(np.array([1.0, 0.0]), 1.0, np.ones(2), np.ones(2), np.ones(2))
+
+
+@pytest.mark.parametrize(
+    "a, b, c, expected_area, expected_x, expected_y",
+    [
+        (1, 0, 0, 8.0, 0.0, 0.0),
+        (-1, 0, 0, 0.0, np.nan, np.nan),
+        (0, 1, 0, 4.0, 1.0, 0.0),
+        (0, 0, -1, 4.0, 0.0, -0.5),
+        (2, -1, -1, 7.5, -0.1111111, -0.0444444),
+    ],
+)
+def test_compressed_zone(a: float, b: float, c: float, expected_area: float, expected_x: float, expected_y: float):
+    """Area and centroid of a 4x2 rectangle clipped by a half-plane."""
+    area, centroid_x, centroid_y = compressed_zone(4.0, 2.0, a, b, c)
+    assert area == pytest.approx(expected_area)
+    np.testing.assert_allclose([centroid_x, centroid_y], [expected_x, expected_y], atol=1e-6)
+
+
+def test_solver_case_counts() -> None:
+    """Loads are classified by the case of the bi-direction solver that analyzes them."""
+    loads = [(10, 0, 0), (10, 1, 1), (10, 0, 5), (10, 5, 0), (10, 5, 5), (10, 0, 15), (10, 15, 0), (0, 1, 0)]
+    p, mx, my = (np.array(values, dtype=np.float64) for values in zip(*loads, strict=True))
+
+    np.testing.assert_array_equal(solver_cases(2, 2, p, mx, my), [0, 0, 1, 1, 2, 3, 3, 3])
+    assert solver_case_counts(2, 2, p, mx, my) == {"trapezoidal": 2, "triangular": 2, "cracked": 1, "overturned": 3}
@@ -0,0 +1,135 @@
+"""Load combinations.
+
+Factored loads are generated from the basic load cases of a foundation instead of being stored. Every combination
+table is a list of factors by load kind. Reversible kinds (seismic and wind) act in both senses, so every combination
+that includes them is expanded into all their sign permutations. The forces of every combination are a single matrix
+product between the factors and the forces of the cases summed by kind.
+
+The tables follow the basic service (ASD) and ultimate (LRFD) combinations of ASCE 7 and NCh3171. Projects under other
+codes can add their own tables to `COMBINATION_TABLES`.
+"""
+from collections.abc import Sequence
+from itertools import product
+
+import numpy as np
+
+from fastruct.loads.loadset import LoadSet
+from fastruct.models.foundation import Foundation
+
+LOAD_KINDS = ("dead", "live", "seismic-x", "seismic-y", "wind")
+REVERSIBLE_KINDS = ("seismic-x", "seismic-y", "wind")
+KIND_SYMBOLS = {"dead": "D", "live": "L", "seismic-x": "Ex", "seismic-y": "Ey", "wind": "W"}
+
+COMBINATION_TABLES: dict[str, list[dict[str, float]]] = {
+    "service": [
+        {"dead": 1.0},
+        {"dead": 1.0, "live": 1.0},
+        {"dead": 1.0, "wind": 1.0},
+        {"dead": 1.0, "live": 0.75, "wind": 0.75},
+        {"dead": 1.0, "seismic-x": 1.0},
+        {"dead": 1.0, "seismic-y": 1.0},
+        {"dead": 1.0, "live": 0.75, "seismic-x": 0.75},
+        {"dead": 1.0, "live": 0.75, "seismic-y": 0.75},
+        {"dead": 0.6, "wind": 1.0},
+        {"dead": 0.6, "seismic-x": 1.0},
+        {"dead": 0.6, "seismic-y": 1.0},
+    ],
+    "ultimate": [
+        {"dead": 1.4},
+        {"dead": 1.2, "live": 1.6},
+        {"dead": 1.2, "live": 1.0, "wind": 1.6},
+        {"dead": 1.2, "live": 1.0, "seismic-x": 1.4},
+        {"dead": 1.2, "live": 1.0, "seismic-y": 1.4},
+        {"dead": 0.9, "wind": 1.6},
+        {"dead": 0.9, "seismic-x": 1.4},
+        {"dead": 0.9, "seismic-y": 1.4},
+    ],
+}
+
+
+def factor_matrix(table: str, kinds: Sequence[str] = LOAD_KINDS) -> tuple[list[str], np.ndarray]:
+    """Factors of every combination of a table, with the sign permutations of the reversible kinds.
+
+    Kinds not given in `kinds` have a factor of 0, so every combination is kept with the kinds that have load cases.
+    Combinations that come out empty or identical to a previous one are dropped.
+
+    Args:
+        table (str): Combination table, one of the keys of `COMBINATION_TABLES`.
+        kinds (Sequence[str], optional): Load kinds with cases. Defaults to every kind.
+
+    Returns:
+        tuple[list[str], np.ndarray]: Names of the combinations, as "1.2D+1.0L-1.4Ex", and their factors with shape
+            `(combinations, len(LOAD_KINDS))`.
+    """
+    if table not in COMBINATION_TABLES:
+        raise ValueError(f"Unkwnown combination table: {table}")
+
+    names, rows = [], []
+    for combination in COMBINATION_TABLES[table]:
+        present = {kind: factor for kind, factor in combination.items() if kind in kinds}
+        reversible = [kind for kind in present if kind in REVERSIBLE_KINDS]
+        for signs in product((1, -1), repeat=len(reversible)):
+            factors = present | {kind: sign * present[kind] for kind, sign in zip(reversible, signs, strict=True)}
+            row = [factors.get(kind, 0.0) for kind in LOAD_KINDS]
+            if factors and row not in rows:
+                names.append(combination_name(factors))
+                rows.append(row)
+
+    return names, np.array(rows, dtype=np.float64).reshape(-1, len(LOAD_KINDS))
+
+
+def combination_name(factors: dict[str, float]) -> str:
+    """Name of a combination from its factors by kind, as "1.2D+1.0L-1.4Ex"."""
+    terms = []
+    for kind, factor in factors.items():
+        value = f"{abs(factor):.2f}".rstrip("0").removesuffix(".")
+        value = value if "." in value else f"{value}.0"
+        terms.append(f"{'-' if factor < 0 else '+'}{value}{KIND_SYMBOLS[kind]}")
+    return "".join(terms).removeprefix("+")
+
+
+def case_matrix(kinds: Sequence[str], forces: np.ndarray) -> np.ndarray:
+    """Forces (p, vx, vy, mx, my) of the load cases summed by kind.
+
+    Args:
+        kinds (Sequence[str]): Kind of every load case, one of `LOAD_KINDS`.
+        forces (np.ndarray): Forces of every load case with shape `(cases, 5)`.
+
+    Returns:
+        np.ndarray: Forces by kind with shape `(len(LOAD_KINDS), 5)`, in the order of `LOAD_KINDS`.
+    """
+    unknown = set(kinds) - set(LOAD_KINDS)
+    if unknown:
+        raise ValueError(f"Unkwnown load kinds: {', '.join(sorted(unknown))}")
+
+    matrix = np.zeros((len(LOAD_KINDS), 5))
+    np.add.at(matrix, [LOAD_KINDS.index(kind) for kind in kinds], np.asarray(forces, dtype=np.float64).reshape(-1, 5))
+    return matrix
+
+
+def combine(
+    table: str, kinds: Sequence[str], forces: np.ndarray
+) -> tuple[list[str], tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Factored forces of every combination of a table, applied over the foundation.
+
+    Args:
+        table (str): Combination table, one of the keys of `COMBINATION_TABLES`.
+        kinds (Sequence[str]): Kind of every load case.
+        forces (np.ndarray): Forces (p, vx, vy, mx, my) of every load case with shape `(cases, 5)`.
+
+    Returns:
+        tuple: Names of the combinations and their p, vx, vy, mx and my arrays.
+    """
+    names, factors = factor_matrix(table, kinds)
+    combined = factors @ case_matrix(kinds, forces)
+    return names, tuple(combined[:, i] for i in range(5))  # type: ignore
+
+
+def combination_loadset(foundation: Foundation, table: str, kinds: Sequence[str], forces: np.ndarray) -> LoadSet:
+    """Combinations of the load cases of a foundation at its seal level, ready to be analyzed.
+
+    Combinations are not stored, so their IDs and user load IDs are their position in the table, from 1.
+    """
+    names, user_loads = combine(table, kinds, forces)
+    numbers = np.arange(1, len(names) + 1)
+    return LoadSet(numbers, numbers, names, *foundation.load_at_seal(*user_loads))
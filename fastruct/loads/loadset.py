@@ -0,0 +1,112 @@
+"""Array backed set of loads at the seal level.
+
+A `LoadSet` keeps the loads of a foundation as contiguous columns (one float64 array per force) instead of one ORM
+instance per load, so analysis and design functions read the forces straight from the arrays. Single loads are only
+built as light `LoadRow` tuples, for the rows that are actually displayed.
+"""
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, NamedTuple, overload
+
+import numpy as np
+
+FORCES = ("p", "vx", "vy", "mx", "my")
+
+
+class LoadRow(NamedTuple):
+    """A single load of a `LoadSet`, with the attributes of a `Load` read by the analysis functions."""
+
+    id: int
+    user_load_id: int
+    name: str | None
+    p: float
+    vx: float
+    vy: float
+    mx: float
+    my: float
+
+
+class LoadSet:
+    """Loads at the seal level of a foundation, as columnar arrays.
+
+    Attributes:
+        ids (np.ndarray): Load IDs.
+        user_load_ids (np.ndarray): User load IDs of every load.
+        names (list[str | None]): User load names.
+        p (np.ndarray): Axial forces.
+        vx (np.ndarray): Shear forces in the x direction.
+        vy (np.ndarray): Shear forces in the y direction.
+        mx (np.ndarray): Moments around the x axis.
+        my (np.ndarray): Moments around the y axis.
+    """
+
+    __slots__ = ("ids", "user_load_ids", "names", *FORCES)
+
+    def __init__(
+        self,
+        ids: Sequence[int] | np.ndarray,
+        user_load_ids: Sequence[int] | np.ndarray,
+        names: Sequence[str | None],
+        p: Sequence[float] | np.ndarray,
+        vx: Sequence[float] | np.ndarray,
+        vy: Sequence[float] | np.ndarray,
+        mx: Sequence[float] | np.ndarray,
+        my: Sequence[float] | np.ndarray,
+    ) -> None:
+        """Set the columns of the loads, converted to contiguous arrays."""
+        self.ids = np.ascontiguousarray(ids, dtype=np.int64)
+        self.user_load_ids = np.ascontiguousarray(user_load_ids, dtype=np.int64)
+        self.names = list(names)
+        for name, values in zip(FORCES, (p, vx, vy, mx, my), strict=True):
+            setattr(self, name, np.ascontiguousarray(values, dtype=np.float64))
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> "LoadSet":
+        """Load set from rows of (id, user_load_id, name, p, vx, vy, mx, my)."""
+        columns = list(zip(*rows, strict=True)) or [()] * 8
+        return cls(*columns)
+
+    @classmethod
+    def from_loads(cls, loads: Iterable[Any]) -> "LoadSet":
+        """Load set from `Load` instances with their user load."""
+        return cls.from_rows(
+            (load.id, load.user_load_id, load.user_load.name, load.p, load.vx, load.vy, load.mx, load.my)
+            for load in loads
+        )
+
+    def __len__(self) -> int:
+        """Number of loads."""
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> LoadRow:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice | Sequence[int] | np.ndarray) -> "LoadSet":
+        ...
+
+    def __getitem__(self, index: int | slice | Sequence[int] | np.ndarray) -> "LoadRow | LoadSet":
+        """The load at an integer index, or a new load set with the loads at a slice or array of indices."""
+        if isinstance(index, int | np.integer):
+            return LoadRow(
+                int(self.ids[index]),
+                int(self.user_load_ids[index]),
+                self.names[index],
+                *(float(getattr(self, name)[index]) for name in FORCES),
+            )
+
+        if isinstance(index, slice):
+            names = self.names[index]
+        else:
+            index = np.asarray(index, dtype=np.intp).reshape(-1)
+            names = [self.names[i] for i in index.tolist()]
+        return LoadSet(self.ids[index], self.user_load_ids[index], names, *self.forces(index))
+
+    def __iter__(self) -> Iterator[LoadRow]:
+        """Every load, in order."""
+        return (self[i] for i in range(len(self)))
+
+    def forces(self, index: slice | np.ndarray | None = None) -> tuple[np.ndarray, ...]:
+        """Force arrays (p, vx, vy, mx, my), of the loads at the given indices when given."""
+        arrays = tuple(getattr(self, name) for name in FORCES)
+        return arrays if index is None else tuple(values[index] for values in arrays)
@@ -1,8 +1,22 @@
 """Loads queries and database related functions."""
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.orm import Session
 
+from fastruct import profiling
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+from fastruct.models.load_case import LoadCase
 from fastruct.models.user_load import UserLoad
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from fastruct.loads.loadset import LoadSet
+
 
 def is_load_duplicated(session: Session, load: dict) -> bool:
     """Cjeck if load exist in database.
@@ -27,3 +41,166 @@ def is_load_duplicated(session: Session, load: dict) -> bool:
         .first()
     )
     return existing_load is not None
+
+
+def bulk_add_loads(session: Session, user_loads: list[dict], foundations: dict[int, Foundation]) -> list[int]:
+    """Insert user loads and their loads at the foundation's seal level using executemany-style inserts.
+
+    User loads already stored for the foundation, or repeated in `user_loads`, are ignored by the load key unique
+    index instead of being checked one by one.
+
+    Args:
+        session (Session): Database session.
+        user_loads (list[dict]): User load values: foundation_id, name, p, vx, vy, mx and my.
+        foundations (dict[int, Foundation]): Foundations of the loads by ID.
+
+    Returns:
+        list[int]: IDs of the new user loads.
+    """
+    if not user_loads:
+        return []
+
+    query = (
+        sqlite.insert(UserLoad)
+        .on_conflict_do_nothing()
+        .returning(UserLoad.id, UserLoad.foundation_id, UserLoad.p, UserLoad.vx, UserLoad.vy, UserLoad.mx, UserLoad.my)
+    )
+    inserted = session.execute(query, user_loads).all()
+
+    loads = []
+    for user_load_id, foundation_id, *values in inserted:
+        p, vx, vy, mx, my = foundations[foundation_id].load_at_seal(*values)
+        loads.append(
+            {
+                "foundation_id": foundation_id,
+                "user_load_id": user_load_id,
+                "p": p,
+                "vx": vx,
+                "vy": vy,
+                "mx": mx,
+                "my": my,
+            }
+        )
+    if loads:
+        session.execute(sa.insert(Load), loads)
+
+    return [user_load_id for user_load_id, *_ in inserted]
+
+
+def update_loads_at_seal(session: Session, foundation: Foundation) -> int:
+    """Recompute the loads at the seal level of a foundation from its user loads with a single UPDATE ... FROM.
+
+    The geometry dependent terms are computed once and bound to the statement, so the user loads and loads are not
+    loaded into the session.
+
+    Args:
+        session (Session): Database session.
+        foundation (Foundation): Foundation with its new geometry.
+
+    Returns:
+        int: Number of updated loads.
+    """
+    p, vx, vy, mx, my = foundation.load_at_seal(UserLoad.p, UserLoad.vx, UserLoad.vy, UserLoad.mx, UserLoad.my)
+    query = (
+        sa.update(Load)
+        .where(Load.user_load_id == UserLoad.id, Load.foundation_id == foundation.id)
+        .values(p=p, vx=vx, vy=vy, mx=mx, my=my)
+        .execution_options(synchronize_session=False)
+    )
+    return session.execute(query).rowcount
+
+
+def get_load_arrays_by_foundation(
+    session: Session, foundation_ids: Iterable[int] | None = None
+) -> dict[int, tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """Fetch the loads of many foundations in a single query, as columnar arrays.
+
+    Args:
+        session (Session): Database session.
+        foundation_ids (Iterable[int] | None, optional): Foundations to fetch. Defaults to all of them.
+
+    Returns:
+        dict: Load IDs, p, mx and my arrays by foundation ID. Foundations without loads are not included.
+    """
+    import numpy as np
+
+    query = sa.select(Load.foundation_id, Load.id, Load.p, Load.mx, Load.my).order_by(Load.foundation_id, Load.id)
+    if foundation_ids is not None:
+        query = query.where(Load.foundation_id.in_(list(foundation_ids)))
+
+    data = np.array(session.execute(query).all(), dtype=np.float64).reshape(-1, 5)
+    foundation_column, starts = np.unique(data[:, 0], return_index=True)
+    return {
+        int(foundation_id): (rows[:, 1].astype(np.int64), rows[:, 2], rows[:, 3], rows[:, 4])
+        for foundation_id, rows in zip(foundation_column, np.split(data, starts[1:]), strict=True)
+    }
+
+
+def get_user_load_arrays(
+    session: Session, foundation_id: int
+) -> tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Fetch the user loads of a foundation as columnar arrays.
+
+    Args:
+        session (Session): Database session.
+        foundation_id (int): Foundation's ID.
+
+    Returns:
+        tuple: p, vx, vy, mx and my arrays.
+    """
+    import numpy as np
+
+    query = sa.select(UserLoad.p, UserLoad.vx, UserLoad.vy, UserLoad.mx, UserLoad.my).where(
+        UserLoad.foundation_id == foundation_id
+    )
+    data = np.array(session.execute(query).all(), dtype=np.float64).reshape(-1, 5)
+    return data[:, 0], data[:, 1], data[:, 2], data[:, 3], data[:, 4]
+
+
+def get_loadset(session: Session, foundation_id: int) -> "LoadSet":
+    """Fetch the loads at the seal level of a foundation, with their user load names, as a load set.
+
+    Rows are read with a single core SELECT, so no ORM instances are built.
+
+    Args:
+        session (Session): Database session.
+        foundation_id (int): Foundation's ID.
+
+    Returns:
+        LoadSet: Loads of the foundation, by ID.
+    """
+    from fastruct.loads.loadset import LoadSet
+
+    query = (
+        sa.select(Load.id, Load.user_load_id, UserLoad.name, Load.p, Load.vx, Load.vy, Load.mx, Load.my)
+        .join(UserLoad, Load.user_load_id == UserLoad.id)
+        .where(Load.foundation_id == foundation_id)
+        .order_by(Load.id)
+    )
+    with profiling.phase("query"):
+        rows = session.execute(query).all()
+    with profiling.phase("load hydration"):
+        return LoadSet.from_rows(rows)
+
+
+def get_load_cases(session: Session, foundation_id: int) -> tuple[list[str], "np.ndarray"]:
+    """Fetch the load cases of a foundation as their kinds and a forces matrix.
+
+    Args:
+        session (Session): Database session.
+        foundation_id (int): Foundation's ID.
+
+    Returns:
+        tuple[list[str], np.ndarray]: Kind of every load case and their forces (p, vx, vy, mx, my) with shape `(n, 5)`.
+    """
+    import numpy as np
+
+    query = (
+        sa.select(LoadCase.kind, LoadCase.p, LoadCase.vx, LoadCase.vy, LoadCase.mx, LoadCase.my)
+        .where(LoadCase.foundation_id == foundation_id)
+        .order_by(LoadCase.id)
+    )
+    with profiling.phase("query"):
+        rows = session.execute(query).all()
+    forces = np.array([values for _, *values in rows], dtype=np.float64).reshape(-1, 5)
+    return [kind for kind, *_ in rows], forces
@@ -0,0 +1,38 @@
+"""Loads translation to the seal level of a foundation.
+
+This module does not depend on numpy, so the models can import it without loading the analysis stack.
+"""
+from typing import Any
+
+CONCRETE_DENSITY = 2.5  # ton/m³
+GROUND_DENSITY = 1.6  # ton/m³
+
+
+def loads_at_seal(
+    p: Any,
+    vx: Any,
+    vy: Any,
+    mx: Any,
+    my: Any,
+    *,
+    lx: Any,
+    ly: Any,
+    lz: Any,
+    depth: Any,
+    ex: Any,
+    ey: Any,
+    col_x: Any,
+    col_y: Any,
+) -> tuple[Any, Any, Any, Any, Any]:
+    """Translate loads applied over a foundation to its seal level.
+
+    The axial force includes the weight of the foundation and the ground above it. Moments include the shear forces
+    over the foundation's height and the axial force over the column's eccentricities. Forces and geometry can be
+    numbers, numpy arrays that broadcast together, as the loads of many candidate geometries, or SQL expressions.
+
+    Returns:
+        tuple: The loads (p, vx, vy, mx, my) at the seal level.
+    """
+    weight = lx * ly * lz * CONCRETE_DENSITY
+    ground_weight = (lx * ly - col_x * col_y) * (depth - lz) * GROUND_DENSITY
+    return p + weight + ground_weight, vx, vy, mx + vy * lz + p * ey, my + vx * lz + p * ex
@@ -0,0 +1,88 @@
+"""Test load combinations."""
+import numpy as np
+import pytest
+
+from fastruct.loads.combinations import (
+    LOAD_KINDS,
+    case_matrix,
+    combination_loadset,
+    combination_name,
+    combine,
+    factor_matrix,
+)
+from fastruct.models.foundation import Foundation
+
+FORCES = np.array(
+    [
+        [50.0, 0.0, 0.0, 2.0, 1.0],  # dead
+        [10.0, 0.0, 0.0, 0.0, 0.0],  # dead
+        [15.0, 0.0, 0.0, 1.0, 0.5],  # live
+        [3.0, 4.0, 0.0, 0.0, 12.0],  # seismic-x
+    ]
+)
+KINDS = ["dead", "dead", "live", "seismic-x"]
+
+
+def test_factor_matrix_sign_permutations() -> None:
+    """Reversible kinds are expanded in both senses, and kinds without cases don't repeat combinations."""
+    names, factors = factor_matrix("ultimate", ["dead", "live", "seismic-x"])
+    assert names == [
+        "1.4D",
+        "1.2D+1.6L",
+        "1.2D+1.0L",
+        "1.2D+1.0L+1.4Ex",
+        "1.2D+1.0L-1.4Ex",
+        "0.9D",
+        "0.9D+1.4Ex",
+        "0.9D-1.4Ex",
+    ]
+    assert factors.shape == (8, len(LOAD_KINDS))
+    np.testing.assert_array_equal(factors[4], [1.2, 1.0, -1.4, 0.0, 0.0])
+
+
+def test_factor_matrix_missing_kinds() -> None:
+    """Kinds without cases have a factor of 0, so combinations with them are kept without them."""
+    names, factors = factor_matrix("ultimate", ["dead", "seismic-x"])
+    assert names == ["1.4D", "1.2D", "1.2D+1.4Ex", "1.2D-1.4Ex", "0.9D", "0.9D+1.4Ex", "0.9D-1.4Ex"]
+    np.testing.assert_array_equal(factors[2], [1.2, 0.0, 1.4, 0.0, 0.0])
+    assert len({tuple(row) for row in factors}) == len(names)
+
+
+def test_factor_matrix_unknown_table() -> None:
+    """Unknown tables raise ValueError."""
+    with pytest.raises(ValueError):
+        factor_matrix("extreme")
+
+
+def test_combination_name() -> None:
+    """Names keep one decimal at least and the sign of every term."""
+    assert combination_name({"dead": 1.0, "live": 0.75, "wind": -1.6}) == "1.0D+0.75L-1.6W"
+
+
+def test_case_matrix_sums_by_kind() -> None:
+    """Cases of the same kind are added."""
+    matrix = case_matrix(KINDS, FORCES)
+    np.testing.assert_array_equal(matrix[LOAD_KINDS.index("dead")], [60.0, 0.0, 0.0, 2.0, 1.0])
+    np.testing.assert_array_equal(matrix[LOAD_KINDS.index("wind")], np.zeros(5))
+    with pytest.raises(ValueError):
+        case_matrix(["snow"], FORCES[:1])
+
+
+def test_combine_matches_factored_sum() -> None:
+    """Every combination is the factored sum of the cases."""
+    names, (p, vx, vy, mx, my) = combine("ultimate", KINDS, FORCES)
+    i = names.index("0.9D-1.4Ex")
+    expected = 0.9 * (FORCES[0] + FORCES[1]) - 1.4 * FORCES[3]
+    np.testing.assert_allclose([p[i], vx[i], vy[i], mx[i], my[i]], expected)
+
+
+def test_combination_loadset_at_seal_level() -> None:
+    """Combinations are translated to the seal level of the foundation."""
+    foundation = Foundation(lx=2, ly=2, lz=1, depth=1.5, ex=0.1, ey=0.2, col_x=0.5, col_y=0.5)
+    loads = combination_loadset(foundation, "service", KINDS, FORCES)
+    names, user_loads = combine("service", KINDS, FORCES)
+    assert loads.names == names
+    np.testing.assert_array_equal(loads.ids, np.arange(1, len(names) + 1))
+    for i in (0, len(names) - 1):
+        expected = foundation.load_at_seal(*(float(values[i]) for values in user_loads))
+        np.testing.assert_allclose(loads.forces(np.array([i])), np.array(expected)[:, None])
@@ -0,0 +1,76 @@
+"""Test array backed load sets."""
+import numpy as np
+import pytest
+
+from fastruct.foundations.analysis.exact import exact_analysis
+from fastruct.foundations.analysis.methods import compare_analysis
+from fastruct.foundations.analysis.vectorized import vectorized_bi_direction_analysis
+from fastruct.loads.loadset import LoadRow, LoadSet
+from fastruct.loads.seal import loads_at_seal
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+from fastruct.models.user_load import UserLoad
+
+
+@pytest.fixture
+def loads() -> LoadSet:
+    """Three loads."""
+    return LoadSet.from_rows(
+        [
+            (1, 11, "D", 10.0, 0.0, 0.0, 1.0, 1.0),
+            (2, 12, None, 20.0, 1.0, 2.0, 8.0, -5.0),
+            (3, 13, "E", 5.0, 0.0, 0.0, 0.0, 0.0),
+        ]
+    )
+
+
+def test_loadset_columns(loads: LoadSet) -> None:
+    """Forces are contiguous float64 arrays."""
+    assert len(loads) == 3
+    for values in loads.forces():
+        assert values.dtype == np.float64
+        assert values.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(loads.mx, [1.0, 8.0, 0.0])
+
+
+def test_loadset_indexing(loads: LoadSet) -> None:
+    """An integer gives a row, and slices or indices give a new load set."""
+    assert loads[1] == LoadRow(2, 12, None, 20.0, 1.0, 2.0, 8.0, -5.0)
+    subset = loads[[2, 0]]
+    assert isinstance(subset, LoadSet)
+    assert subset.names == ["E", "D"]
+    np.testing.assert_array_equal(subset.ids, [3, 1])
+    assert [row.id for row in loads[1:]] == [2, 3]
+
+
+def test_empty_loadset() -> None:
+    """Load sets without loads have empty columns."""
+    loads = LoadSet.from_rows([])
+    assert len(loads) == 0
+    assert loads.p.shape == (0,)
+
+
+def test_engines_accept_loadsets(loads: LoadSet) -> None:
+    """Analysis of a load set matches the analysis of the same ORM loads."""
+    foundation = Foundation(lx=2, ly=3, lz=1, depth=1.5, ex=0, ey=0, col_x=0.5, col_y=0.5)
+    foundation.loads = [
+        Load(id=row.id, user_load_id=row.user_load_id, user_load=UserLoad(name=row.name), p=row.p, mx=row.mx, my=row.my)
+        for row in loads
+    ]
+    assert LoadSet.from_loads(foundation.loads).names == loads.names
+    for engine in (vectorized_bi_direction_analysis, exact_analysis, compare_analysis):
+        assert engine(foundation, loads) == engine(foundation)
+
+
+def test_loads_at_seal_broadcast() -> None:
+    """Loads at the seal level of many geometries at once match the ones of every foundation."""
+    geometry = {"depth": 1.5, "ex": 0.1, "ey": -0.2, "col_x": 0.4, "col_y": 0.5}
+    lx, ly, lz = np.array([[1.5], [2.0]]), np.array([[2.0], [2.5]]), np.array([[0.5], [1.0]])
+    p, vx, vy, mx, my = np.array([10.0, 20.0]), 1.0, np.array([-2.0, 2.0]), 3.0, np.array([4.0, -4.0])
+
+    translated = loads_at_seal(p, vx, vy, mx, my, lx=lx, ly=ly, lz=lz, **geometry)
+    for i in range(2):
+        foundation = Foundation(lx=lx[i, 0], ly=ly[i, 0], lz=lz[i, 0], **geometry)
+        for j in range(2):
+            expected = foundation.load_at_seal(p[j], vx, vy[j], mx, my[j])
+            assert [np.broadcast_to(value, (2, 2))[i, j] for value in translated] == pytest.approx(expected)
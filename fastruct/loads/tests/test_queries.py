@@ -0,0 +1,108 @@
+"""Test for loads queries."""
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from fastruct.loads.queries import bulk_add_loads, get_loadset, is_load_duplicated, update_loads_at_seal
+from fastruct.models.db import BaseModel
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+from fastruct.models.user_load import UserLoad
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    """Session over an empty in-memory database."""
+    engine = create_engine("sqlite:///:memory:")
+    BaseModel.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def foundation(session: Session) -> Foundation:
+    """Foundation instance."""
+    foundation = Foundation(lx=2, ly=2, lz=1, depth=1.5, ex=0.1, ey=0.2, col_x=0.5, col_y=0.5)
+    session.add(foundation)
+    session.flush()
+    return foundation
+
+
+def user_load(foundation_id: int, p: float, name: str | None = None) -> dict:
+    """User load values."""
+    return {"foundation_id": foundation_id, "name": name, "p": p, "vx": 1.0, "vy": 2.0, "mx": 3.0, "my": 4.0}
+
+
+def test_bulk_add_loads(session: Session, foundation: Foundation) -> None:
+    """User loads and their loads at the seal level are inserted."""
+    user_load_ids = bulk_add_loads(
+        session, [user_load(foundation.id, 10), user_load(foundation.id, 20)], {1: foundation}
+    )
+
+    assert len(user_load_ids) == 2
+    loads = session.query(Load).order_by(Load.id).all()
+    assert [load.user_load_id for load in loads] == user_load_ids
+    assert [load.as_list() for load in loads] == [
+        list(foundation.load_at_seal(10, 1, 2, 3, 4)),
+        list(foundation.load_at_seal(20, 1, 2, 3, 4)),
+    ]
+
+
+def test_bulk_add_loads_ignores_duplicates(session: Session, foundation: Foundation) -> None:
+    """Loads already stored or repeated are ignored by the load key index."""
+    bulk_add_loads(session, [user_load(foundation.id, 10)], {1: foundation})
+
+    user_loads = [user_load(foundation.id, 10, "stored"), user_load(foundation.id, 20), user_load(foundation.id, 20)]
+    user_load_ids = bulk_add_loads(session, user_loads, {1: foundation})
+
+    assert len(user_load_ids) == 1
+    assert session.query(UserLoad).count() == session.query(Load).count() == 2
+    assert is_load_duplicated(session, user_load(foundation.id, 20))
+    assert not is_load_duplicated(session, user_load(foundation.id, 30))
+
+
+def test_update_loads_at_seal(session: Session, foundation: Foundation) -> None:
+    """Loads at the seal level follow the new geometry of the foundation."""
+    bulk_add_loads(session, [user_load(foundation.id, 10), user_load(foundation.id, 20)], {1: foundation})
+    foundation.lx, foundation.lz, foundation.depth, foundation.ex = 3, 1.2, 2, -0.3
+
+    assert update_loads_at_seal(session, foundation) == 2
+
+    loads = session.query(Load).order_by(Load.id).all()
+    assert [load.as_list() for load in loads] == [
+        pytest.approx(foundation.load_at_seal(10, 1, 2, 3, 4)),
+        pytest.approx(foundation.load_at_seal(20, 1, 2, 3, 4)),
+    ]
+
+
+def test_get_loadset(session: Session, foundation: Foundation) -> None:
+    """Loads at the seal level are fetched as arrays, matching the ORM loads."""
+    bulk_add_loads(
+        session, [user_load(foundation.id, 10.0, "D"), user_load(foundation.id, 20.0)], {foundation.id: foundation}
+    )
+    session.refresh(foundation)
+
+    loads = get_loadset(session, foundation.id)
+    assert len(loads) == 2
+    assert loads.names == ["D", None]
+    assert loads.p.dtype == np.float64
+    for row, load in zip(loads, sorted(foundation.loads, key=lambda load: load.id), strict=True):
+        assert row.id == load.id
+        assert row.user_load_id == load.user_load_id
+        assert (row.p, row.vx, row.vy, row.mx, row.my) == pytest.approx((load.p, load.vx, load.vy, load.mx, load.my))
+    assert len(get_loadset(session, foundation.id + 1)) == 0
+
+
+def test_foundation_loads_follow_insertion_order(session: Session, foundation: Foundation) -> None:
+    """User loads and loads of a foundation are listed by ID, not by the load key index order."""
+    bulk_add_loads(
+        session, [user_load(foundation.id, 20.0, "B"), user_load(foundation.id, 5.0, "A")], {foundation.id: foundation}
+    )
+    session.expire_all()
+
+    assert [user_load.name for user_load in foundation.user_loads] == ["B", "A"]
+    assert [load.user_load_id for load in foundation.loads] == [user_load.id for user_load in foundation.user_loads]
+    assert [load.user_load.p for load in foundation.loads] == [20.0, 5.0]
@@ -1,4 +1,6 @@
 """Init module."""
+from .analysis_result import AnalysisResult  # noqa: F401
 from .foundation import Foundation  # noqa: F401
 from .load import Load  # noqa: F401
+from .load_case import LoadCase  # noqa: F401
 from .user_load import UserLoad  # noqa: F401
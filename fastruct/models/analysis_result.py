@@ -0,0 +1,25 @@
+"""Analysis Result Model."""
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from .db import BaseModel
+
+
+class AnalysisResult(BaseModel):
+    """Cached stresses, percentajes and solver diagnostics of a foundation analysis.
+
+    `key` is a content hash of the foundation geometry, its loads and the method, so results are reused only while
+    none of them change.
+    """
+
+    __tablename__ = "analysis_results"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True, autoincrement=True)
+    foundation_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("foundations.id", ondelete="CASCADE"))
+    method: so.Mapped[str] = so.mapped_column(sa.String(16))
+    key: so.Mapped[str] = so.mapped_column(sa.String(64))
+    stresses: so.Mapped[list] = so.mapped_column(sa.JSON)
+    percentajes: so.Mapped[list] = so.mapped_column(sa.JSON)
+    diagnostics: so.Mapped[dict | None] = so.mapped_column(sa.JSON)
+
+    __table_args__ = (sa.UniqueConstraint("foundation_id", "method"),)
@@ -2,6 +2,8 @@
 import sqlalchemy as sa
 import sqlalchemy.orm as so
 
+from fastruct.loads.seal import CONCRETE_DENSITY, GROUND_DENSITY, loads_at_seal
+
 from .db import BaseModel
 
 
@@ -22,9 +24,14 @@ class Foundation(BaseModel):
     col_x: so.Mapped[float] = so.mapped_column(sa.Float)
     col_y: so.Mapped[float] = so.mapped_column(sa.Float)
 
-    loads: so.Mapped[list["Load"]] = so.relationship(cascade="all, delete", back_populates="foundation")  # noqa: F821
+    loads: so.Mapped[list["Load"]] = so.relationship(  # noqa: F821
+        cascade="all, delete", passive_deletes=True, back_populates="foundation", order_by="Load.id"
+    )
     user_loads: so.Mapped[list["UserLoad"]] = so.relationship(  # noqa: F821
-        cascade="all, delete", back_populates="foundation"
+        cascade="all, delete", passive_deletes=True, back_populates="foundation", order_by="UserLoad.id"
+    )
+    load_cases: so.Mapped[list["LoadCase"]] = so.relationship(  # noqa: F821
+        cascade="all, delete", passive_deletes=True, back_populates="foundation"
     )
 
     __table_args__ = (
@@ -73,7 +80,7 @@ class Foundation(BaseModel):
         """
         return self.lx**3 * self.ly / 12, self.lx * self.ly**3 / 12
 
-    def weight(self, concrete_density: float = 2.5) -> float:
+    def weight(self, concrete_density: float = CONCRETE_DENSITY) -> float:
         """Calculate the foundation's weight.
 
         Args:
@@ -85,7 +92,7 @@ class Foundation(BaseModel):
         """
         return self.volume() * concrete_density
 
-    def ground_weight(self, ground_density: float = 1.6) -> float:
+    def ground_weight(self, ground_density: float = GROUND_DENSITY) -> float:
         """Calculate the weight of the ground above the foundation.
 
         Args:
@@ -98,6 +105,27 @@ class Foundation(BaseModel):
         ground_height = self.depth - self.lz
         return (self.area() - self.column_area()) * ground_height * ground_density
 
+    def load_at_seal(
+        self, p: float, vx: float, vy: float, mx: float, my: float
+    ) -> tuple[float, float, float, float, float]:
+        """Translate a load applied over the foundation to its seal level.
+
+        The axial force includes the weight of the foundation and the ground above it. Moments include the shear
+        forces over the foundation's height and the axial force over the column's eccentricities.
+
+        Args:
+            p (float): Vertical force.
+            vx (float): Horizontal force in the x direction.
+            vy (float): Horizontal force in the y direction.
+            mx (float): Moment around the x axis.
+            my (float): Moment around the y axis.
+
+        Returns:
+            tuple[float, float, float, float, float]: The load (p, vx, vy, mx, my) at the seal level.
+        """
+        geometry = {name: getattr(self, name) for name in ("lx", "ly", "lz", "depth", "ex", "ey", "col_x", "col_y")}
+        return loads_at_seal(p, vx, vy, mx, my, **geometry)
+
     def __str__(self) -> str:
         """Return a string representation of the foundation.
 
@@ -17,10 +17,10 @@ class Load(BaseModel):
     mx: so.Mapped[float] = so.mapped_column(sa.Float)
     my: so.Mapped[float] = so.mapped_column(sa.Float)
 
-    foundation_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("foundations.id", ondelete="CASCADE"))
+    foundation_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("foundations.id", ondelete="CASCADE"), index=True)
     foundation: so.Mapped["Foundation"] = so.relationship(back_populates="loads")  # noqa: F821
 
-    user_load_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("user_loads.id", ondelete="CASCADE"))
+    user_load_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("user_loads.id", ondelete="CASCADE"), index=True)
     user_load: so.Mapped["UserLoad"] = so.relationship(back_populates="load")  # noqa: F821
 
     def as_list(self):
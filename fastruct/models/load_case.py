@@ -0,0 +1,34 @@
+"""Load Case Model."""
+import sqlalchemy as sa
+import sqlalchemy.orm as so
+
+from .db import BaseModel
+
+
+class LoadCase(BaseModel):
+    """Basic load case of a foundation (dead, live, seismic or wind), applied over the foundation.
+
+    Factored combinations of the cases are generated when analyzing and never stored.
+    """
+
+    __tablename__ = "load_cases"
+
+    id: so.Mapped[int] = so.mapped_column(primary_key=True, autoincrement=True)
+    name: so.Mapped[str | None] = so.mapped_column(sa.String(32))
+    kind: so.Mapped[str] = so.mapped_column(sa.String(16))
+    p: so.Mapped[float] = so.mapped_column(sa.Float)
+    vx: so.Mapped[float] = so.mapped_column(sa.Float)
+    vy: so.Mapped[float] = so.mapped_column(sa.Float)
+    mx: so.Mapped[float] = so.mapped_column(sa.Float)
+    my: so.Mapped[float] = so.mapped_column(sa.Float)
+
+    foundation_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("foundations.id", ondelete="CASCADE"), index=True)
+    foundation: so.Mapped["Foundation"] = so.relationship(back_populates="load_cases")  # noqa: F821
+
+    def __str__(self) -> str:
+        """Representation of load case as string.
+
+        Returns:
+            str: The string representation of load case.
+        """
+        return f"Load Case id: {self.id}"
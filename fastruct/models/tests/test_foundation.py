@@ -132,3 +132,16 @@ def test_foundation_weight(lx: float, ly: float, lz: float, expected_weight: flo
     """
     foundation = Foundation(lx=lx, ly=ly, lz=lz, depth=lz)
     assert foundation.weight() == expected_weight
+
+
+def test_foundation_load_at_seal() -> None:
+    """Test load translation to the foundation's seal level.
+
+    The axial force adds the foundation and ground weights, moments add shear and eccentricity effects.
+    """
+    foundation = Foundation(lx=2, ly=2, lz=1, depth=1.5, ex=0.1, ey=0.2, col_x=0.5, col_y=0.5)
+    p, vx, vy, mx, my = foundation.load_at_seal(10, 1, 2, 3, 4)
+    assert p == pytest.approx(10 + 10 + 3.75 * 0.5 * 1.6)
+    assert (vx, vy) == (1, 2)
+    assert mx == pytest.approx(3 + 2 * 1 + 10 * 0.2)
+    assert my == pytest.approx(4 + 1 * 1 + 10 * 0.1)
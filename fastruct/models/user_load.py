@@ -20,7 +20,11 @@ class UserLoad(BaseModel):
 
     foundation_id: so.Mapped[int] = so.mapped_column(sa.ForeignKey("foundations.id", ondelete="CASCADE"))
     foundation: so.Mapped["Foundation"] = so.relationship(back_populates="user_loads")  # noqa: F821
-    load: so.Mapped["Load"] = so.relationship(back_populates="user_load")  # noqa: F821
+    load: so.Mapped["Load"] = so.relationship(  # noqa: F821
+        cascade="all, delete", passive_deletes=True, back_populates="user_load"
+    )
+
+    __table_args__ = (sa.Index("ix_user_loads_load_key", "foundation_id", "p", "vx", "vy", "mx", "my", unique=True),)
 
     def as_list(self):
         """List serialization."""
@@ -0,0 +1,141 @@
+"""Command profiling.
+
+Enabled with `fastruct --profile` or `FASTRUCT_PROFILE=1`. Commands mark their phases (database configuration, queries,
+load hydration, analysis, formatting and rendering) with `phase` and `timed`, and record counters with `count`. The
+wall time of every phase and the counters are printed to stderr when the command ends, so stdout stays clean for
+piping. With `--profile-output FILE` (or `FASTRUCT_PROFILE_OUTPUT`) the whole command also runs under cProfile and its
+stats are dumped to the file, to be read with `pstats` or `snakeviz`.
+
+Every function is a no-op while profiling is disabled.
+"""
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TextIO, TypeVar
+
+T = TypeVar("T")
+
+
+class Profile:
+    """Wall time by phase and counters of a command."""
+
+    def __init__(self, output: Path | None = None, started: float | None = None) -> None:
+        """Start timing the command, and start cProfile when an output file is given.
+
+        Args:
+            output (Path | None, optional): File for the cProfile stats. Defaults to no cProfile.
+            started (float | None, optional): `time.perf_counter` value when the command started. Defaults to now.
+        """
+        self.start = time.perf_counter() if started is None else started
+        self.phases: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+        self.output = output
+        self.profiler: Any = None
+        if output is not None:
+            import cProfile
+
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add wall time to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def stop(self, stream: TextIO | None = None) -> None:
+        """Stop cProfile, dump its stats and print the report."""
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.output)
+
+        self.report(stream or sys.stderr)
+
+    def report(self, stream: TextIO) -> None:
+        """Print the wall time of every phase, in the order they first ran, and the counters."""
+        total = time.perf_counter() - self.start
+        lines = ["Profile (wall time):"]
+        lines.extend(f"  {name:<20}{1000 * seconds:>10.1f} ms" for name, seconds in self.phases.items())
+        lines.append(f"  {'other':<20}{1000 * (total - sum(self.phases.values())):>10.1f} ms")
+        lines.append(f"  {'total':<20}{1000 * total:>10.1f} ms")
+        if self.counters:
+            lines.append("Counters:")
+            lines.extend(f"  {name:<20}{value:>10}" for name, value in self.counters.items())
+        if self.output is not None:
+            lines.append(f"cProfile stats: {self.output}")
+        print("\n".join(lines), file=stream)
+
+
+_profile: Profile | None = None
+
+
+def start(output: Path | None = None, started: float | None = None) -> Profile:
+    """Enable profiling for the rest of the command."""
+    global _profile  # noqa: PLW0603
+    _profile = Profile(output, started)
+    return _profile
+
+
+def stop() -> None:
+    """Disable profiling and print the report."""
+    global _profile  # noqa: PLW0603
+    if _profile is not None:
+        profile, _profile = _profile, None
+        profile.stop()
+
+
+def enabled() -> bool:
+    """Whether profiling is enabled."""
+    return _profile is not None
+
+
+def add(name: str, seconds: float) -> None:
+    """Add wall time to a phase."""
+    if _profile is not None:
+        _profile.add(name, seconds)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add to a counter."""
+    if _profile is not None:
+        _profile.count(name, value)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the wall time of the block to a phase."""
+    if _profile is None:
+        yield
+        return
+
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        add(name, time.perf_counter() - start_time)
+
+
+def timed(iterable: Iterable[T], name: str) -> Iterator[T]:
+    """Iterate, adding the time spent producing every item to a phase.
+
+    Meant for generators that interleave work with their consumer, as rows formatted lazily while pages are rendered.
+    """
+    if _profile is None:
+        return iter(iterable)
+    return _timed(iter(iterable), name)
+
+
+def _timed(iterator: Iterator[T], name: str) -> Iterator[T]:
+    while True:
+        start_time = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            add(name, time.perf_counter() - start_time)
+        yield item
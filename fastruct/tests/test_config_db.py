@@ -0,0 +1,132 @@
+"""Test for database configuration module."""
+from pathlib import Path
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from fastruct.config_db import SCHEMA_VERSION, apply_profile, migrate
+from fastruct.models.db import BaseModel
+from fastruct.models.foundation import Foundation
+from fastruct.models.load import Load
+from fastruct.models.user_load import UserLoad
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> sa.Engine:
+    """Engine over an empty database file."""
+    return sa.create_engine(f"sqlite:///{tmp_path / 'fastructdb.db'}")
+
+
+def user_version(engine: sa.Engine) -> int:
+    """Schema version stored in the database."""
+    with engine.connect() as connection:
+        return connection.exec_driver_sql("PRAGMA user_version").scalar_one()
+
+
+def test_migrate_new_database(engine: sa.Engine) -> None:
+    """New databases get every table and the current schema version."""
+    with engine.begin() as connection:
+        assert migrate(connection) == 0
+
+    assert set(sa.inspect(engine).get_table_names()) == set(BaseModel.metadata.tables)
+    assert user_version(engine) == SCHEMA_VERSION
+
+
+def test_migrate_unversioned_database(engine: sa.Engine) -> None:
+    """Databases created before the load key index get it."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE TABLE user_loads (id INTEGER PRIMARY KEY, foundation_id INTEGER, name VARCHAR(32), "
+            "p FLOAT, vx FLOAT, vy FLOAT, mx FLOAT, my FLOAT, created_at DATETIME, updated_at DATETIME)"
+        )
+        migrate(connection)
+
+    indexes = {index["name"] for index in sa.inspect(engine).get_indexes("user_loads")}
+    assert "ix_user_loads_load_key" in indexes
+    assert user_version(engine) == SCHEMA_VERSION
+
+
+def test_migrate_duplicated_loads(engine: sa.Engine) -> None:
+    """Repeated loads of databases created before the load key index are removed with their loads at the seal level."""
+    with engine.begin() as connection:
+        migrate(connection)
+        for index in UserLoad.__table__.indexes:
+            index.drop(bind=connection)
+        connection.exec_driver_sql("PRAGMA user_version = 1")
+        connection.exec_driver_sql(
+            "INSERT INTO foundations (id, lx, ly, lz, depth, ex, ey, col_x, col_y) VALUES "
+            "(1, 1, 1, 1, 1, 0, 0, 0.2, 0.2), (2, 1, 1, 1, 1, 0, 0, 0.2, 0.2)"
+        )
+        for user_load_id, foundation_id, p in ((1, 1, 10), (2, 1, 20), (3, 1, 10), (4, 2, 10), (5, 1, 10)):
+            connection.exec_driver_sql(
+                "INSERT INTO user_loads (id, foundation_id, p, vx, vy, mx, my) VALUES (?, ?, ?, 0, 0, 0, 0)",
+                (user_load_id, foundation_id, p),
+            )
+            connection.exec_driver_sql(
+                "INSERT INTO loads (foundation_id, user_load_id, p, vx, vy, mx, my) VALUES (?, ?, ?, 0, 0, 0, 0)",
+                (foundation_id, user_load_id, p),
+            )
+        migrate(connection)
+
+        assert connection.exec_driver_sql("SELECT id FROM user_loads ORDER BY id").scalars().all() == [1, 2, 4]
+        assert connection.exec_driver_sql("SELECT user_load_id FROM loads ORDER BY id").scalars().all() == [1, 2, 4]
+    assert user_version(engine) == SCHEMA_VERSION
+
+
+def test_migrate_load_foreign_key_indexes(engine: sa.Engine) -> None:
+    """Databases created before the indexes of the load foreign keys get them, and use them to find the loads."""
+    with engine.begin() as connection:
+        migrate(connection)
+        for index in Load.__table__.indexes:
+            index.drop(bind=connection)
+        connection.exec_driver_sql("PRAGMA user_version = 4")
+        migrate(connection)
+
+        for column in ("foundation_id", "user_load_id"):
+            plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN SELECT id FROM loads WHERE {column} = 1").all()
+            assert f"ix_loads_{column}" in plan[0][-1]
+
+
+def test_migrate_current_database(engine: sa.Engine, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Current databases only read the schema version."""
+    with engine.begin() as connection:
+        migrate(connection)
+
+    monkeypatch.setattr(BaseModel.metadata, "create_all", pytest.fail)
+    with engine.begin() as connection:
+        assert migrate(connection) == SCHEMA_VERSION
+
+
+def test_apply_profile(engine: sa.Engine) -> None:
+    """Profile PRAGMAs are set on every connection."""
+    apply_profile(engine, "performance")
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar_one() == "wal"
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar_one() == 1
+        assert connection.exec_driver_sql("PRAGMA foreign_keys").scalar_one() == 1
+
+
+def test_apply_unknown_profile(engine: sa.Engine) -> None:
+    """Unknown profiles are rejected."""
+    with pytest.raises(ValueError, match="desconocido"):
+        apply_profile(engine, "unknown")
+
+
+def test_foreign_keys_cascade(engine: sa.Engine) -> None:
+    """Deleting a user load deletes its load at the seal level."""
+    apply_profile(engine, "performance")
+    with engine.begin() as connection:
+        migrate(connection)
+
+    with Session(engine) as session:
+        foundation = Foundation(lx=2, ly=2, lz=1, depth=1, ex=0, ey=0, col_x=0, col_y=0)
+        user_load = UserLoad(foundation=foundation, p=10, vx=1, vy=2, mx=3, my=4)
+        session.add(Load(foundation=foundation, user_load=user_load, p=10, vx=1, vy=2, mx=3, my=4))
+        session.commit()
+
+        session.delete(session.get(UserLoad, user_load.id))
+        session.commit()
+
+        assert session.query(Load).count() == 0
+        assert session.query(Foundation).count() == 1
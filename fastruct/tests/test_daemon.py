@@ -0,0 +1,158 @@
+"""Test for daemon and command line client modules."""
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from fastruct.client import (
+    daemon_supported,
+    forward,
+    peer_is_user,
+    socket_path,
+    subcommand,
+    trusted_socket,
+)
+
+pytestmark = pytest.mark.skipif(not daemon_supported(), reason="The daemon requires Unix sockets and fork")
+
+
+@pytest.fixture
+def environment(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> dict[str, str]:
+    """Environment with a temporary database and daemon socket."""
+    monkeypatch.setenv("FASTRUCT_DATABASE", str(tmp_path / "fastructdb.db"))
+    monkeypatch.setenv("FASTRUCT_SOCKET", str(tmp_path / "fastruct.sock"))
+    monkeypatch.delenv("FASTRUCT_NO_DAEMON", raising=False)
+    return dict(os.environ)
+
+
+@pytest.fixture
+def daemon(environment: dict[str, str]) -> Iterator[subprocess.Popen]:
+    """Running daemon, stopped at the end of the test."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "fastruct", "serve"], env=environment, stderr=subprocess.PIPE, text=True
+    )
+    path = Path(environment["FASTRUCT_SOCKET"])
+    deadline = time.monotonic() + 30
+    while not path.exists():
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            pytest.fail(f"Daemon didn't start: {process.stderr.read()}")  # type: ignore
+        time.sleep(0.05)
+
+    yield process
+
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=10)
+
+
+def run(environment: dict[str, str], *args: str) -> subprocess.CompletedProcess:
+    """Run a command through the command line client."""
+    return subprocess.run(
+        [sys.executable, "-m", "fastruct.client", *args],
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=False,
+    )
+
+
+def test_socket_path(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """The socket path is read from FASTRUCT_SOCKET, or built from the runtime directory and the user ID."""
+    monkeypatch.delenv("FASTRUCT_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert socket_path() == tmp_path / f"fastruct-{os.getuid()}" / "fastruct.sock"
+
+    monkeypatch.setenv("FASTRUCT_SOCKET", "/run/fastruct.sock")
+    assert socket_path() == Path("/run/fastruct.sock")
+
+
+def test_subcommand() -> None:
+    """Only the first argument that is not a global option decides the subcommand."""
+    assert subcommand(["--profile", "serve"]) == "serve"
+    assert subcommand(["--profile-output", "api", "f", "analize", "1"]) == "f"
+    assert subcommand(["--profile-output=stats", "api"]) == "api"
+    assert subcommand(["l", "add", "1", "10", "0", "0", "0", "0", "--name", "serve"]) == "l"
+    assert subcommand(["--help"]) is None
+
+
+def test_trusted_socket(tmp_path: Path) -> None:
+    """Only sockets of the user in directories that other users can't write to are trusted."""
+    path = tmp_path / "fastruct.sock"
+    path.touch()
+    assert not trusted_socket(path)
+
+    path.unlink()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        assert trusted_socket(path)
+
+        tmp_path.chmod(0o777)
+        try:
+            assert not trusted_socket(path)
+        finally:
+            tmp_path.chmod(0o700)
+
+
+def test_peer_is_user(tmp_path: Path) -> None:
+    """A daemon of the same user is accepted as the peer."""
+    path = tmp_path / "fastruct.sock"
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        server.listen()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(str(path))
+            assert peer_is_user(client)
+
+
+def test_forward_without_daemon(environment: dict[str, str]) -> None:
+    """Commands run locally when no daemon is listening."""
+    assert forward(["f", "analize", "1"]) is None
+
+
+def test_forwarded_commands(daemon: subprocess.Popen, environment: dict[str, str]) -> None:
+    """Forwarded commands write to the streams of the client and return their exit codes."""
+    added = run(environment, "f", "add", "2", "2", "1")
+    assert added.returncode == 0
+    assert "id=" in added.stdout
+
+    foundation_id = added.stdout.strip().split("=")[-1]
+    assert run(environment, "l", "add", foundation_id, "10", "1", "1", "2", "3").returncode == 0
+
+    analysis = run(environment, "f", "analize", foundation_id, "--format", "csv")
+    assert analysis.returncode == 0
+    assert analysis.stdout.splitlines()[0].startswith("number,load_id,name")
+    assert len(analysis.stdout.splitlines()) == 2
+
+    unknown = run(environment, "f", "unknown")
+    assert unknown.returncode == 2
+    assert "No such command" in unknown.stderr
+
+
+def test_daemon_removes_socket_when_stopped(daemon: subprocess.Popen, environment: dict[str, str]) -> None:
+    """The socket is removed when the daemon stops, so commands run locally again."""
+    daemon.send_signal(signal.SIGTERM)
+    daemon.wait(timeout=10)
+
+    assert not Path(environment["FASTRUCT_SOCKET"]).exists()
+    assert forward(["f", "analize", "1"]) is None
+
+
+def test_second_daemon_is_rejected(daemon: subprocess.Popen, environment: dict[str, str]) -> None:
+    """Only one daemon listens on a socket."""
+    second = subprocess.run(
+        [sys.executable, "-m", "fastruct", "serve"],
+        env=environment,
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=False,
+    )
+    assert second.returncode == 1
+    assert "already listening" in second.stderr
@@ -0,0 +1,78 @@
+"""Test for profiling module."""
+import io
+import pstats
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from fastruct import profiling
+
+
+@pytest.fixture(autouse=True)
+def disabled() -> Iterator[None]:
+    """Profiling is disabled after every test."""
+    yield
+    profiling._profile = None
+
+
+def test_disabled_profiling_is_a_no_op() -> None:
+    """Phases and counters are ignored, and iterables are returned as plain iterators."""
+    with profiling.phase("query"):
+        profiling.count("loads", 3)
+
+    assert not profiling.enabled()
+    assert list(profiling.timed([1, 2], "formatting")) == [1, 2]
+
+
+def test_phases_and_counters() -> None:
+    """Time is summed by phase, in the order the phases first run."""
+    profile = profiling.start()
+    with profiling.phase("query"):
+        pass
+    assert list(profiling.timed(iter([1, 2, 3]), "formatting")) == [1, 2, 3]
+    with profiling.phase("query"):
+        profiling.count("loads", 2)
+    profiling.count("loads", 3)
+
+    assert list(profile.phases) == ["query", "formatting"]
+    assert profile.counters == {"loads": 5}
+
+
+def test_phase_is_recorded_on_errors() -> None:
+    """Phases that raise are still timed."""
+    profile = profiling.start()
+    with pytest.raises(ValueError), profiling.phase("analysis engine"):
+        raise ValueError
+
+    assert "analysis engine" in profile.phases
+
+
+def test_report() -> None:
+    """The report lists every phase, the rest of the time, the total and the counters."""
+    profile = profiling.Profile()
+    profile.add("query", 0.5)
+    profile.count("overturned loads", 4)
+    stream = io.StringIO()
+
+    profile.report(stream)
+
+    report = stream.getvalue()
+    assert "query" in report and "500.0 ms" in report
+    assert "other" in report and "total" in report
+    assert "overturned loads" in report
+
+
+def test_stop_dumps_stats(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """The cProfile stats are dumped to the output file and the report goes to stderr."""
+    output = tmp_path / "fastruct.prof"
+    profiling.start(output)
+    sum(range(100))
+
+    profiling.stop()
+
+    assert not profiling.enabled()
+    assert pstats.Stats(str(output)).total_calls > 0
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Profile (wall time)" in captured.err